@@ -1,16 +1,38 @@
+import json
 import os
-import threading
+import sqlite3
 import time
 
 import requests
-from flask import Flask, jsonify, render_template, request
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
 
-from job_automation import JobScraper
+from circuit_breaker import PLATFORM_HEALTH
+from dedupe import Deduper
+from feed_cache import FEED_CACHE, TTLCache
+from feed_index import FEED_DELTAS
+from http_cache import HTTP_CACHE
+from http_pool import HTTP_POOL
+from http_validators import HTTP_VALIDATORS
+from job_automation import PLATFORM_FLIGHTS, Job, JobScraper
+from job_store import JobStore
+from posted_dates import RecencyIndex
+from rate_limit import RATE_LIMITER
+from request_policy import REQUEST_POLICY
+from scheduler import PopularityTracker, RefreshBudget, Scheduler
+from search_jobs import QueueFull, SearchQueue
+from selector_memory import SELECTOR_MEMORY
 
 app = Flask(__name__)
 
-_self_ping_started = False
-_self_ping_lock = threading.Lock()
 HARDCODED_RENDER_URL = "https://jobfinding-kvbr.onrender.com"
 
 
@@ -27,6 +49,87 @@ def parse_int(value, default, minimum=None, maximum=None):
     return parsed
 
 
+FEED_CACHE.configure(
+    ttl=parse_int(os.environ.get("FEED_CACHE_TTL"), 300, minimum=0),
+    stale_ttl=parse_int(os.environ.get("FEED_CACHE_STALE_TTL"), 900, minimum=0),
+    max_bytes=parse_int(os.environ.get("FEED_CACHE_MAX_MB"), 64, minimum=1) * 1024 * 1024,
+)
+
+# Payloads kept for 304 answers, bounded apart from FEED_CACHE: they can
+# outlive the feed cache's copy of a feed
+HTTP_VALIDATORS.configure(
+    max_bytes=parse_int(os.environ.get("HTTP_VALIDATORS_MAX_MB"), 32, minimum=1) * 1024 * 1024,
+)
+
+# Keep-alive connections kept per upstream host, shared by every search
+HTTP_POOL.configure(
+    pool_maxsize=parse_int(os.environ.get("HTTP_POOL_PER_HOST"), 8, minimum=1),
+)
+
+# STREAM_FEEDS=1 parses the large RemoteOK / Arbeitnow feeds as they
+# download and stops at max_results, instead of holding whole feeds in
+# FEED_CACHE; for small-memory instances
+JobScraper.STREAM_FEEDS = (
+    os.environ.get("STREAM_FEEDS", "0").strip().lower() in {"1", "true", "on"}
+)
+
+# Retries per request (1 disables them) and hedged duplicates for slow
+# JSON API requests (REQUEST_HEDGING=0 turns them off)
+REQUEST_POLICY.configure(
+    max_attempts=parse_int(os.environ.get("REQUEST_MAX_ATTEMPTS"), 3, minimum=1),
+    hedging=os.environ.get("REQUEST_HEDGING", "1").strip() not in {"0", "false", "off"},
+)
+
+# Per-platform request budgets, e.g. RATE_LIMIT_LINKEDIN_PER_MIN=20 and
+# RATE_LIMIT_LINKEDIN_BURST=3; unset values keep rate_limit.HOST_RATES.
+for platform, host in JobScraper.PLATFORM_HOSTS.items():
+    env_prefix = f"RATE_LIMIT_{platform.upper()}"
+    per_min = os.environ.get(f"{env_prefix}_PER_MIN")
+    burst = os.environ.get(f"{env_prefix}_BURST")
+    RATE_LIMITER.configure(
+        host,
+        per_second=parse_int(per_min, 0, minimum=0) / 60 if per_min is not None else None,
+        burst=parse_int(burst, 1, minimum=1) if burst is not None else None,
+    )
+
+# Finished searches keyed on search_key(); repeated queries are answered from
+# here and stale entries are served while the queue refreshes them.
+RESULT_CACHE = TTLCache(
+    ttl=parse_int(os.environ.get("RESULT_CACHE_TTL"), 300, minimum=0),
+    stale_ttl=parse_int(os.environ.get("RESULT_CACHE_STALE_TTL"), 1800, minimum=0),
+    max_entries=parse_int(os.environ.get("RESULT_CACHE_MAX_ENTRIES"), 500, minimum=1),
+    max_bytes=parse_int(os.environ.get("RESULT_CACHE_MAX_MB"), 32, minimum=1) * 1024 * 1024,
+    name="result-cache",
+)
+
+
+def open_job_store():
+    """
+    The store at JOB_STORE_PATH; a relative path is taken from the app's
+    directory, not the working directory. The database is only opened
+    when a search first uses it.
+    """
+    path = os.environ.get("JOB_STORE_PATH", "jobs.db").strip()
+    if not path or path.lower() in {"0", "off", "none"}:
+        return None
+    if path != ":memory:":
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+    return JobStore(path)
+
+
+# Every live scrape is upserted here; a search scraped less than
+# JOB_STORE_FRESHNESS seconds ago is answered from the store instead.
+JOB_STORE = open_job_store()
+JOB_STORE_FRESHNESS = parse_int(os.environ.get("JOB_STORE_FRESHNESS"), 1800, minimum=0)
+
+
+def get_platform_timeout():
+    value = os.environ.get("PLATFORM_TIMEOUT")
+    if not value:
+        return None
+    return float(parse_int(value, 20, minimum=1, maximum=120))
+
+
 def get_self_ping_url():
     base_url = (
         os.environ.get("SELF_PING_URL")
@@ -42,53 +145,389 @@ def get_self_ping_url():
     return f"{normalized}/health"
 
 
-def self_ping_worker():
+def self_ping_enabled():
+    if os.environ.get("DISABLE_SELF_PING", "").lower() in {"1", "true", "yes"}:
+        return False
+
+    if os.environ.get("RENDER", "").lower() not in {"1", "true", "yes"} and not os.environ.get("SELF_PING_URL"):
+        return False
+
+    return bool(get_self_ping_url())
+
+
+def self_ping():
     ping_url = get_self_ping_url()
-    interval_seconds = parse_int(os.environ.get("SELF_PING_INTERVAL", 600), 600, minimum=60)
-    if not ping_url:
+    try:
+        response = HTTP_POOL.session.get(ping_url, timeout=10)
+    except requests.RequestException as exc:
+        print(f"Self ping failed: {exc}")
+        return {"url": ping_url, "error": str(exc)}
+    print(f"Self ping -> {response.status_code} {ping_url}")
+    return {"url": ping_url, "status": response.status_code}
+
+
+@app.route("/health")
+def health():
+    return jsonify({"status": "ok"})
+
+
+def read_search_form(values):
+    return {
+        "title": values.get("title", "").strip(),
+        "location": values.get("location", "").strip(),
+        "max_results": parse_int(values.get("max_results"), 10, minimum=1, maximum=50),
+        "latest_days": parse_int(values.get("latest_days"), 7, minimum=0, maximum=365),
+    }
+
+
+def search_message(form_data, count):
+    return (
+        f"Found {count} jobs for '{form_data['title']}' in "
+        f"'{form_data['location']}' across all active platforms"
+    )
+
+
+def search_key(form_data):
+    """
+    Identical scrapes share one run while in flight and one cache entry.
+    latest_days is not part of it: the recency filter is applied to the
+    cached scrape when it is shown (see present_search).
+    """
+    return (
+        " ".join(form_data["title"].lower().split()),
+        " ".join(form_data["location"].lower().split()),
+        form_data["max_results"],
+        tuple(JobScraper.DEFAULT_PLATFORMS),
+    )
+
+
+def scraper_options():
+    return {
+        "platform_timeout": get_platform_timeout(),
+        "max_workers": parse_int(
+            os.environ.get("SCRAPER_MAX_WORKERS"), JobScraper.MAX_WORKERS, minimum=1
+        ),
+        # Whole-search budget in seconds, retries and backoff included
+        "deadline": parse_int(os.environ.get("SEARCH_DEADLINE"), 40, minimum=5),
+    }
+
+
+def store_key(form_data):
+    title, location, max_results, platforms = search_key(form_data)
+    return json.dumps([title, location, max_results, list(platforms)])
+
+
+def save_to_store(form_data, jobs, statuses):
+    if JOB_STORE is None:
         return
+    try:
+        JOB_STORE.upsert_many(jobs)
+        JOB_STORE.record_search(
+            store_key(form_data), form_data["title"], form_data["location"],
+            statuses, len(jobs),
+        )
+    except sqlite3.Error as exc:
+        print(f"  [warn] could not save search to the job store: {exc}")
+
+
+def job_store_stats():
+    if JOB_STORE is None:
+        return None
+    try:
+        return JOB_STORE.stats()
+    except sqlite3.Error as exc:
+        return {"path": JOB_STORE.path, "error": str(exc)}
+
+
+def stored_search(form_data):
+    """Answer a search from the job store if it was scraped recently."""
+    if JOB_STORE is None:
+        return None
+    try:
+        last = JOB_STORE.last_search(store_key(form_data))
+        if last is None or last["age"] > JOB_STORE_FRESHNESS:
+            return None
+        all_jobs = JOB_STORE.search(
+            form_data["title"],
+            form_data["location"],
+            limit=form_data["max_results"] * len(JobScraper.DEFAULT_PLATFORMS),
+        )
+    except sqlite3.Error as exc:
+        print(f"  [warn] job store lookup failed: {exc}")
+        return None
+
+    return scrape_result(all_jobs, last["platform_statuses"])
+
+
+def scrape_result(all_jobs, platform_statuses):
+    """What is cached per search: every scraped job, ordered by recency."""
+    return {
+        "recency": RecencyIndex(all_jobs),
+        "platform_statuses": platform_statuses,
+    }
+
 
-    time.sleep(15)
-    while True:
+def present_search(result, form_data):
+    """Apply the recency filter of this request to a cached scrape result."""
+    jobs = result["recency"].within_days(form_data["latest_days"])
+    if not jobs:
+        # Better the older results than an empty page
+        jobs = result["recency"].newest_first()
+    return {
+        "jobs": jobs,
+        "platform_statuses": result["platform_statuses"],
+        "message": search_message(form_data, len(jobs)),
+    }
+
+
+def caller_params(search, args):
+    """
+    A queued search's params with the caller's own latest_days: searches
+    that differ only in it share one scrape (see search_key), so each
+    caller's recency filter travels in its own URL.
+    """
+    latest_days = parse_int(
+        args.get("latest_days"), search.params["latest_days"], minimum=0, maximum=365
+    )
+    return {**search.params, "latest_days": latest_days}
+
+
+def run_search(form_data, report=None):
+    """
+    Scrape every platform for form_data. report((key, jobs, status)) is
+    called as each platform finishes; the search queue passes the running
+    search's progress list, which /search/stream relays to the browser.
+    """
+    scraper = JobScraper()
+    all_jobs = scraper.scrape_all_sites(
+        form_data["title"],
+        form_data["location"],
+        form_data["max_results"],
+        concurrent=True,
+        on_platform=None if report is None else lambda *outcome: report(outcome),
+        **scraper_options(),
+    )
+    save_to_store(form_data, all_jobs, scraper.last_run_statuses)
+    return scrape_result(all_jobs, scraper.last_run_statuses)
+
+
+# Rough per-job overhead on top of the field text: object headers, dict
+# slots and the cache's own bookkeeping.
+JOB_OVERHEAD_BYTES = 400
+
+
+def estimate_result_size(result):
+    total = 0
+    for job in result["recency"].newest_first():
+        total += JOB_OVERHEAD_BYTES
+        for name in Job.__slots__:
+            value = getattr(job, name)
+            if isinstance(value, (str, bytes)):
+                total += len(value)
+    return total
+
+
+def run_and_cache_search(form_data, report=None):
+    result = run_search(form_data, report)
+    RESULT_CACHE.put(search_key(form_data), result, estimate_result_size(result))
+    return result
+
+
+def cached_search(form_data):
+    """
+    Return (result, state) from the result cache, state being "fresh",
+    "stale", "store" or "miss". A stale result is returned as is and a
+    refresh is queued behind it; the queue coalesces repeated refreshes of
+    one key. On a cache miss the job store is consulted next.
+    """
+    key = search_key(form_data)
+    POPULAR_SEARCHES.record(key, form_data)
+    entry, state = RESULT_CACHE.lookup(key)
+    if entry is None:
+        result = stored_search(form_data)
+        if result is None:
+            return None, state
+        RESULT_CACHE.put(key, result, estimate_result_size(result))
+        return result, "store"
+    if state == "stale":
         try:
-            response = requests.get(ping_url, timeout=10)
-            print(f"Self ping -> {response.status_code} {ping_url}")
-        except requests.RequestException as exc:
-            print(f"Self ping failed: {exc}")
-        time.sleep(interval_seconds)
+            SEARCH_QUEUE.submit(form_data, key=key)
+        except QueueFull:
+            pass
+    return entry.value, state
 
 
-def start_self_ping():
-    global _self_ping_started
-    if os.environ.get("DISABLE_SELF_PING", "").lower() in {"1", "true", "yes"}:
-        return
+SEARCH_QUEUE = SearchQueue(
+    run_and_cache_search,
+    max_workers=parse_int(os.environ.get("SEARCH_WORKERS"), 2, minimum=1),
+    max_pending=parse_int(os.environ.get("SEARCH_QUEUE_DEPTH"), 20, minimum=1),
+    result_ttl=parse_int(os.environ.get("SEARCH_RESULT_TTL"), 600, minimum=10),
+)
 
-    if os.environ.get("RENDER", "").lower() not in {"1", "true", "yes"} and not os.environ.get("SELF_PING_URL"):
-        return
+# The classic form page reloads itself this often while its search runs
+SEARCH_PAGE_REFRESH = parse_int(os.environ.get("SEARCH_PAGE_REFRESH"), 3, minimum=1)
 
-    if not get_self_ping_url():
-        return
+# A streamed search sends a keep-alive comment when nothing happened this long
+STREAM_HEARTBEAT = 15
+
+# A stream holds a (sync) gunicorn worker while it is open: after this many
+# seconds it hands the browser over to polling /api/searches/<id> instead
+STREAM_MAX_SECONDS = parse_int(os.environ.get("STREAM_MAX_SECONDS"), 10, minimum=1)
+
+
+# ---------------------------------------------------------------------------
+# Background scheduler: keep-alive ping, feed warming, popular-search refresh
+# ---------------------------------------------------------------------------
+
+SCHEDULER = Scheduler()
+SCHEDULER_JITTER = parse_int(os.environ.get("SCHEDULER_JITTER_PCT"), 10, minimum=0, maximum=50) / 100
+
+POPULAR_SEARCHES = PopularityTracker(
+    half_life=parse_int(os.environ.get("POPULARITY_HALF_LIFE"), 3600, minimum=60),
+)
+# Searches whose decayed hit count fell below this are no longer refreshed
+POPULAR_MIN_SCORE = 0.5
+POPULAR_REFRESH_COUNT = parse_int(os.environ.get("POPULAR_REFRESH_COUNT"), 5, minimum=0)
+
+# Upstream refreshes (feed reloads and re-run searches) allowed per window
+REFRESH_BUDGET = RefreshBudget(
+    limit=parse_int(os.environ.get("REFRESH_BUDGET"), 12, minimum=0),
+    window=parse_int(os.environ.get("REFRESH_BUDGET_WINDOW"), 300, minimum=10),
+)
+
+# Entries are refreshed once they are this far through their TTL
+REFRESH_AHEAD = 0.75
+
+
+def warm_feeds():
+    # The Muse is filtered per query; warm the variants popular searches read
+    queries = [
+        (form_data["title"], form_data["location"])
+        for _key, form_data, score in POPULAR_SEARCHES.top(POPULAR_REFRESH_COUNT)
+        if score >= POPULAR_MIN_SCORE
+    ]
+    return JobScraper().warm_feeds(
+        max_age=FEED_CACHE.ttl * REFRESH_AHEAD,
+        take_budget=REFRESH_BUDGET.take,
+        queries=queries,
+    )
+
+
+def refresh_popular_searches():
+    refreshed = []
+    for key, form_data, score in POPULAR_SEARCHES.top(POPULAR_REFRESH_COUNT):
+        if score < POPULAR_MIN_SCORE:
+            break
+        age = RESULT_CACHE.age(key)
+        if age is not None and age <= RESULT_CACHE.ttl * REFRESH_AHEAD:
+            continue
+        if not REFRESH_BUDGET.take():
+            break
+        try:
+            SEARCH_QUEUE.submit(form_data, key=key)
+        except QueueFull:
+            break
+        refreshed.append(f"{form_data['title']} / {form_data['location']}")
+    return refreshed
+
+
+PLATFORM_HEALTH.configure(
+    failure_threshold=parse_int(os.environ.get("BREAKER_FAILURES"), 3, minimum=1),
+    empty_threshold=parse_int(os.environ.get("BREAKER_EMPTY_RESULTS"), 8, minimum=1),
+    cooldown=parse_int(os.environ.get("BREAKER_COOLDOWN"), 60, minimum=5),
+    max_cooldown=parse_int(os.environ.get("BREAKER_MAX_COOLDOWN"), 900, minimum=5),
+)
+
+
+def probe_degraded_platforms():
+    scraper = JobScraper()
+    return [
+        f"{key}: {scraper.probe_platform(key, title, location)}"
+        for key, (title, location) in PLATFORM_HEALTH.due_probes()
+    ]
+
+
+# Jobs not seen by any scrape for this long are deleted from the store
+JOB_STORE_MAX_AGE = parse_int(os.environ.get("JOB_STORE_MAX_AGE"), 7 * 24 * 3600, minimum=3600)
 
-    with _self_ping_lock:
-        if _self_ping_started:
-            return
-        thread = threading.Thread(target=self_ping_worker, daemon=True, name="render-self-ping")
-        thread.start()
-        _self_ping_started = True
+
+def prune_job_store():
+    try:
+        return {"deleted": JOB_STORE.prune(JOB_STORE_MAX_AGE)}
+    except sqlite3.Error as exc:
+        print(f"  [warn] job store prune failed: {exc}")
+        return {"error": str(exc)}
+
+
+if self_ping_enabled():
+    SCHEDULER.add(
+        "keep-alive",
+        self_ping,
+        interval=parse_int(os.environ.get("SELF_PING_INTERVAL", 600), 600, minimum=60),
+        jitter=SCHEDULER_JITTER,
+        initial_delay=15,
+    )
+SCHEDULER.add(
+    "warm-feeds",
+    warm_feeds,
+    interval=parse_int(os.environ.get("FEED_WARM_INTERVAL"), 240, minimum=30),
+    jitter=SCHEDULER_JITTER,
+    initial_delay=5,
+)
+SCHEDULER.add(
+    "refresh-popular-searches",
+    refresh_popular_searches,
+    interval=parse_int(os.environ.get("SEARCH_REFRESH_INTERVAL"), 120, minimum=30),
+    jitter=SCHEDULER_JITTER,
+)
+SCHEDULER.add(
+    "probe-degraded-platforms",
+    probe_degraded_platforms,
+    interval=parse_int(os.environ.get("BREAKER_PROBE_INTERVAL"), 15, minimum=5),
+    jitter=SCHEDULER_JITTER,
+)
+
+if JOB_STORE is not None:
+    SCHEDULER.add(
+        "prune-job-store",
+        prune_job_store,
+        interval=parse_int(os.environ.get("JOB_STORE_PRUNE_INTERVAL"), 3600, minimum=60),
+        jitter=SCHEDULER_JITTER,
+        initial_delay=60,
+    )
+
+
+def start_scheduler():
+    if os.environ.get("DISABLE_SCHEDULER", "").lower() in {"1", "true", "yes"}:
+        return
+    if not SCHEDULER.running:
+        SCHEDULER.start()
 
 
 @app.before_request
 def ensure_background_jobs():
-    start_self_ping()
+    start_scheduler()
 
 
-@app.route("/health")
-def health():
-    return jsonify({"status": "ok"})
+def view_body(view):
+    return {
+        "message": view["message"],
+        "platform_statuses": view["platform_statuses"],
+        "jobs": [job.to_dict() for job in view["jobs"]],
+    }
+
+
+def sse_event(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
 
 
 @app.route("/", methods=["GET", "POST"])
 def index():
+    """
+    The search page. A search that is not cached is queued and the browser
+    is redirected to /?search=<id>, which reloads itself until the queued
+    search has finished, so no request waits on the scrape.
+    """
     jobs = []
     message = ""
     form_data = {
@@ -98,43 +537,275 @@ def index():
         "latest_days": 7,
     }
     platform_statuses = []
+    refresh = None
 
     if request.method == "POST":
-        form_data["title"] = request.form.get("title", "").strip()
-        form_data["location"] = request.form.get("location", "").strip()
-        form_data["max_results"] = parse_int(request.form.get("max_results"), 10, minimum=1, maximum=50)
-        form_data["latest_days"] = parse_int(request.form.get("latest_days"), 7, minimum=0, maximum=365)
+        form_data = read_search_form(request.form)
 
         if form_data["title"] and form_data["location"]:
-            scraper = JobScraper()
-            all_jobs = scraper.scrape_all_sites(
-                form_data["title"],
-                form_data["location"],
-                form_data["max_results"],
-            )
-            filtered_jobs = scraper.filter_latest_jobs(all_jobs, form_data["latest_days"])
-            jobs = filtered_jobs if filtered_jobs else all_jobs
-            platform_statuses = scraper.last_run_statuses
-
-            message = (
-                f"Found {len(jobs)} jobs for '{form_data['title']}' in "
-                f"'{form_data['location']}' across all active platforms"
-            )
+            cached, _state = cached_search(form_data)
+            if cached is not None:
+                shown = present_search(cached, form_data)
+                jobs = shown["jobs"]
+                platform_statuses = shown["platform_statuses"]
+                message = shown["message"]
+            else:
+                try:
+                    search = SEARCH_QUEUE.submit(form_data, key=search_key(form_data))
+                except QueueFull:
+                    message = "The search service is busy right now. Please try again in a moment."
+                else:
+                    return redirect(
+                        url_for("index", search=search.id, latest_days=form_data["latest_days"]),
+                        code=303,
+                    )
         else:
             message = "Please enter both a job title and location."
 
+    elif request.args.get("search"):
+        search = SEARCH_QUEUE.get(request.args["search"])
+        if search is None:
+            message = "This search has expired. Please search again."
+        else:
+            form_data = caller_params(search, request.args)
+            if search.status == "done":
+                shown = present_search(search.result, form_data)
+                jobs = shown["jobs"]
+                platform_statuses = shown["platform_statuses"]
+                message = shown["message"]
+            elif search.status == "failed":
+                message = "The search failed. Please try again."
+            else:
+                message = "Searching all active platforms... this page updates when the results are ready."
+                refresh = SEARCH_PAGE_REFRESH
+
     return render_template(
         "index.html",
         jobs=jobs,
         message=message,
         form_data=form_data,
         platform_statuses=platform_statuses,
+        refresh=refresh,
         ping_url=get_self_ping_url(),
     )
 
 
+@app.route("/search/stream")
+def search_stream():
+    """
+    Server-Sent Events version of the search: one "platform" event per
+    platform as soon as it finishes (its status chip and rendered job cards),
+    then a final "done" event with the summary message. A search that is
+    not cached runs on SEARCH_QUEUE like any other; the stream relays the
+    queued search's per-platform progress, so identical searches share one
+    scrape and the request thread only forwards events. A stream is closed
+    after STREAM_MAX_SECONDS with a "handoff" event naming the search's
+    status_url and result page; the browser polls the former and then
+    loads the latter, so slow searches do not hold a worker throughout.
+    """
+    form_data = read_search_form(request.args)
+
+    def platform_event(status, jobs):
+        return sse_event(
+            "platform",
+            {
+                "label": status["label"],
+                "status": status["status"],
+                "count": status["count"],
+                "chip": render_template("_status_chips.html", platform_statuses=[status]),
+                "cards": render_template("_job_cards.html", jobs=jobs) if jobs else "",
+            },
+        )
+
+    def events():
+        if not (form_data["title"] and form_data["location"]):
+            yield sse_event("done", {"message": "Please enter both a job title and location."})
+            return
+
+        cached, _state = cached_search(form_data)
+        if cached is not None:
+            view = present_search(cached, form_data)
+            for status in view["platform_statuses"]:
+                yield platform_event(status, [])
+            yield sse_event(
+                "jobs",
+                {
+                    "sources": sorted({job.source for job in view["jobs"]}),
+                    "cards": render_template("_job_cards.html", jobs=view["jobs"]),
+                },
+            )
+            yield sse_event("done", {"message": view["message"]})
+            return
+
+        try:
+            search = SEARCH_QUEUE.submit(form_data, key=search_key(form_data))
+        except QueueFull:
+            yield sse_event(
+                "done",
+                {"message": "The search service is busy right now. Please try again in a moment."},
+            )
+            return
+
+        scraper = JobScraper()
+        seen = Deduper()
+        held_back = []
+        shown = 0
+        relayed = 0
+        close_at = time.monotonic() + STREAM_MAX_SECONDS
+        while not (search.finished and relayed == len(search.progress)):
+            remaining = close_at - time.monotonic()
+            if remaining <= 0:
+                latest_days = form_data["latest_days"]
+                yield sse_event(
+                    "handoff",
+                    {
+                        "message": "Still searching the slower platforms...",
+                        "status_url": url_for(
+                            "api_search", search_id=search.id, latest_days=latest_days
+                        ),
+                        "page_url": url_for(
+                            "index", search=search.id, latest_days=latest_days
+                        ),
+                    },
+                )
+                return
+            outcomes = search.progress_since(
+                relayed, timeout=min(STREAM_HEARTBEAT, remaining)
+            )
+            if not outcomes:
+                if time.monotonic() < close_at:
+                    yield ": keep-alive\n\n"
+                continue
+            relayed += len(outcomes)
+            for _key, results, status in outcomes:
+                unique = scraper.take_unique(results, seen)
+                visible = scraper.filter_latest_jobs(unique, form_data["latest_days"])
+                visible_ids = {id(job) for job in visible}
+                held_back.extend(job for job in unique if id(job) not in visible_ids)
+                shown += len(visible)
+                yield platform_event(status, visible)
+
+        if search.status == "failed":
+            yield sse_event("done", {"message": "The search failed. Please try again."})
+            return
+
+        # Same fallback as index(): if the recency filter hides everything,
+        # show the unfiltered results instead of an empty page.
+        if not shown and held_back:
+            shown = len(held_back)
+            yield sse_event(
+                "jobs",
+                {
+                    "sources": sorted({job.source for job in held_back}),
+                    "cards": render_template("_job_cards.html", jobs=held_back),
+                },
+            )
+
+        yield sse_event("done", {"message": search_message(form_data, shown)})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/api/searches", methods=["GET", "POST"])
+def api_searches():
+    if request.method == "GET":
+        return jsonify(SEARCH_QUEUE.stats())
+
+    form_data = read_search_form(request.get_json(silent=True) or request.form)
+    if not (form_data["title"] and form_data["location"]):
+        return jsonify({"error": "Both title and location are required."}), 400
+
+    cached, state = cached_search(form_data)
+    if cached is not None:
+        return jsonify({
+            "status": "done",
+            "cache": state,
+            "params": form_data,
+            **view_body(present_search(cached, form_data)),
+        })
+
+    try:
+        search = SEARCH_QUEUE.submit(form_data, key=search_key(form_data))
+    except QueueFull:
+        response = jsonify({"error": "Too many searches in progress."})
+        response.headers["Retry-After"] = "5"
+        return response, 503
+
+    body = search.summary()
+    # A coalesced search carries the first submitter's params; report and
+    # later filter with this caller's own latest_days
+    body["params"] = caller_params(search, form_data)
+    body["status_url"] = url_for(
+        "api_search", search_id=search.id, latest_days=form_data["latest_days"]
+    )
+    return jsonify(body), 202
+
+
+@app.route("/api/searches/<search_id>")
+def api_search(search_id):
+    """
+    Poll a search; ?wait=N long-polls up to N seconds for it to finish.
+    ?latest_days=N (part of the status_url handed out on submit) is the
+    recency filter applied to the result.
+    """
+    search = SEARCH_QUEUE.get(search_id)
+    if search is None:
+        return jsonify({"error": "Unknown or expired search id."}), 404
+
+    wait_seconds = parse_int(request.args.get("wait"), 0, minimum=0, maximum=30)
+    if wait_seconds:
+        search.wait(wait_seconds)
+
+    params = caller_params(search, request.args)
+    body = search.summary()
+    body["params"] = params
+    if search.status == "done":
+        body.update(view_body(present_search(search.result, params)))
+    return jsonify(body)
+
+
+@app.route("/api/cache")
+def api_cache():
+    """Hit / miss / stale counters and sizes of the in-process caches."""
+    return jsonify({
+        "results": RESULT_CACHE.stats(),
+        "feeds": FEED_CACHE.stats(),
+        "platform_flights": PLATFORM_FLIGHTS.stats(),
+        "http_validators": HTTP_VALIDATORS.stats(),
+        "feed_deltas": FEED_DELTAS.stats(),
+        "rate_limits": RATE_LIMITER.stats(),
+        "http_pool": HTTP_POOL.stats(),
+        "http_cache": HTTP_CACHE.stats(),
+        "request_policy": REQUEST_POLICY.stats(),
+        "selector_memory": SELECTOR_MEMORY.stats(),
+        "job_store": job_store_stats(),
+    })
+
+
+@app.route("/api/scheduler")
+def api_scheduler():
+    """Scheduled tasks, what they last refreshed, and the popular searches."""
+    report = SCHEDULER.report()
+    report["refresh_budget_remaining"] = REFRESH_BUDGET.remaining()
+    report["popular_searches"] = [
+        {"title": params["title"], "location": params["location"], "score": round(score, 2)}
+        for _key, params, score in POPULAR_SEARCHES.top(10)
+    ]
+    return jsonify(report)
+
+
+@app.route("/api/platforms")
+def api_platforms():
+    """Circuit state and recent error / empty / latency rates per platform."""
+    return jsonify(PLATFORM_HEALTH.report())
+
+
 if __name__ == "__main__":
-    start_self_ping()
+    start_scheduler()
     port = int(os.environ.get("PORT", 5000))
     debug_mode = os.environ.get("FLASK_DEBUG", "").lower() in {"1", "true", "yes"}
     app.run(host="0.0.0.0", port=port, debug=debug_mode)
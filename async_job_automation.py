@@ -0,0 +1,575 @@
+"""
+Async Job Scraper
+=================
+asyncio counterpart of job_automation.JobScraper, built on aiohttp.
+
+One event loop can drive many searches (and every platform inside each
+search) concurrently without a thread per request. Parsing and filtering
+are shared with the synchronous scraper: both drive the same _steps_*
+generators and only differ in how their fetch steps are performed.
+
+    async with AsyncJobScraper() as scraper:
+        jobs = await scraper.scrape_all_sites("python developer", "remote")
+
+Identical platform runs and feed loads in flight at the same time are
+coalesced per scraper instance, not process-wide like the synchronous
+scraper's PLATFORM_FLIGHTS: the shared call runs on this scraper's event
+loop and aiohttp session, which another instance may not share or may
+close first. Use one AsyncJobScraper for all searches of a loop to get
+the coalescing.
+
+Everything the synchronous scraper offers that performs requests
+(scrape_all_sites, iter_platform_results, probe_platform, warm_feeds) is
+a coroutine / async iterator here.
+"""
+
+import asyncio
+import json
+import random
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, List,
+    Mapping, NamedTuple, Optional, Tuple,
+)
+
+import aiohttp
+from multidict import CIMultiDict
+
+from circuit_breaker import HealthBoard
+from feed_cache import Feed, TTLCache
+from http_cache import CachedResponse, HttpCache
+from http_pool import BROWSER_HEADERS
+from job_automation import (
+    FetchStep, Job, JobScraper, ParallelFetch, Step, Steps, StreamFetch,
+)
+from json_stream import ArrayItemParser
+from rate_limit import RateLimiter
+from request_policy import RETRY_STATUSES, RequestPolicy, search_deadline
+
+
+class PageResponse(NamedTuple):
+    """The parts of an HTTP response the platform parsers rely on."""
+    status_code: int
+    text: str
+    headers: Mapping[str, str] = CIMultiDict()
+    # The unread aiohttp response when requested with stream=True
+    body: Optional[aiohttp.ClientResponse] = None
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncJobScraper(JobScraper):
+    # Per-host connection cap shared by every search on this scraper
+    LIMIT_PER_HOST: int = 8
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        feed_cache: Optional[TTLCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        health: Optional[HealthBoard] = None,
+        request_policy: Optional[RequestPolicy] = None,
+        http_cache: Optional[HttpCache] = None,
+    ) -> None:
+        super().__init__(
+            feed_cache=feed_cache,
+            rate_limiter=rate_limiter,
+            health=health,
+            request_policy=request_policy,
+            http_cache=http_cache,
+        )
+        self._http: Optional[aiohttp.ClientSession] = session
+        self._owns_http = session is None
+        self._background: set = set()
+        # Per instance; see the module docstring
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncJobScraper":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._http is not None and self._owns_http:
+            await self._http.close()
+        self._http = None
+
+    def _client(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the running event loop
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.LIMIT_PER_HOST)
+            )
+            self._owns_http = True
+        return self._http
+
+    # ---- Low-level HTTP helpers -------------------------------------------
+
+    async def _request_page(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: int = 15,
+        extra_headers: Optional[dict] = None,
+        stream: bool = False,
+    ) -> Optional[PageResponse]:
+        """Event-loop version of JobScraper._request_page (same request policy)."""
+        if self.http_cache.replaying:
+            return self._replayed(url, params)
+        headers = {**BROWSER_HEADERS, "User-Agent": random.choice(self._USER_AGENTS)}
+        if extra_headers:
+            headers.update(extra_headers)
+
+        async def send(attempt_timeout: float) -> Optional[PageResponse]:
+            try:
+                if stream:
+                    resp = await self._client().get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=attempt_timeout),
+                    )
+                    return PageResponse(resp.status, "", CIMultiDict(resp.headers), resp)
+                async with self._client().get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=attempt_timeout),
+                ) as resp:
+                    return PageResponse(
+                        resp.status, await resp.text(), CIMultiDict(resp.headers)
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError) as exc:
+                print(f"  [warn] request failed for {url!r}: {exc}")
+                return None
+
+        policy = self.request_policy
+        resp = None
+        for attempt in range(policy.max_attempts):
+            attempt_timeout = policy.attempt_timeout(timeout)
+            if attempt_timeout is None:
+                print(f"  [warn] search deadline reached before {url!r}")
+                break
+            wait = self.rate_limiter.reserve(
+                url, min(self.RATE_LIMIT_MAX_WAIT, attempt_timeout)
+            )
+            if wait is None:
+                self._rate_limit_exceeded(url)
+                break
+            if wait > 0:
+                await asyncio.sleep(wait)
+            resp = await policy.send_async(
+                RateLimiter.host(url),
+                send,
+                attempt_timeout,
+                None if stream else self._hedge_check(url),
+            )
+            delay = policy.retry_delay(attempt, resp)
+            if delay is None:
+                break
+            if resp is not None and resp.body is not None:
+                resp.body.close()
+            await asyncio.sleep(delay)
+        if self.http_cache.enabled:
+            return await self._through_cache(url, params, resp, stream)
+        return resp
+
+    def _cached_response(self, kept: CachedResponse) -> PageResponse:
+        return PageResponse(
+            kept.status_code,
+            kept.body.decode(kept.encoding or "utf-8", "replace"),
+            CIMultiDict(kept.headers),
+        )
+
+    async def _through_cache(
+        self, url: str, params: Optional[dict], resp: Optional[PageResponse], stream: bool
+    ) -> Optional[PageResponse]:
+        """Event-loop version of JobScraper._through_cache."""
+        cache = self.http_cache
+        if cache.mode == "live" and (resp is None or resp.status_code in RETRY_STATUSES):
+            kept = self._fallback(url, params, resp)
+            if kept is not resp and resp is not None and resp.body is not None:
+                resp.body.close()
+            return kept
+        if resp is None or not cache.stores(resp.status_code) or (
+            stream and cache.mode == "live"
+        ):
+            return resp
+        if resp.body is not None:
+            # Recording reads a streamed body in full and hands back the text
+            try:
+                async with resp.body:
+                    text = await resp.body.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError) as exc:
+                print(f"  [warn] request failed for {url!r}: {exc}")
+                return None
+            resp = PageResponse(resp.status_code, text, resp.headers)
+        cache.put(
+            "GET", url, params, resp.status_code, resp.headers,
+            resp.text.encode("utf-8"), "utf-8",
+        )
+        return resp
+
+    async def _request_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: int = 15,
+        extra_headers: Optional[dict] = None,
+    ):
+        """GET a URL and parse the response as JSON. Returns None on failure."""
+        loaded = await self._conditional_json(url, params, timeout, extra_headers)
+        return loaded[0] if loaded is not None else None
+
+    async def _conditional_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: int = 15,
+        extra_headers: Optional[dict] = None,
+        wrap: Callable[[Any], Any] = lambda data: data,
+    ) -> Optional[Tuple[Any, int]]:
+        key = self.validators.key(url, params)
+        resp = await self._request_page(
+            url,
+            params=params,
+            timeout=timeout,
+            extra_headers=self._validated_headers(key, extra_headers),
+        )
+        return self._accept_json(key, resp, url, wrap)
+
+    def _body_size(self, resp) -> int:
+        return len(resp.text)
+
+    async def _load_feed(self, step: FetchStep) -> Optional[Tuple[Any, int]]:
+        return await self._conditional_json(
+            step.url, params=step.params, extra_headers=step.extra_headers, wrap=Feed
+        )
+
+    async def _coalesce(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Await the in-flight call for key, starting it if there is none."""
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._flights[key] = task
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+        # Shielded so one caller's timeout does not cancel the shared call
+        return await asyncio.shield(task)
+
+    async def _store_feed(self, key: tuple, step: FetchStep) -> Any:
+        async def load():
+            loaded = await self._load_feed(step)
+            if loaded is None:
+                return None
+            self.feed_cache.put(key, *loaded)
+            return loaded[0]
+
+        return await self._coalesce(("feed", key), load)
+
+    async def _refresh_feed(self, key: tuple, step: FetchStep) -> None:
+        try:
+            await self._store_feed(key, step)
+        except Exception as exc:
+            print(f"  [warn] feed refresh failed for {step.url!r}: {exc}")
+        finally:
+            self.feed_cache.end_refresh(key)
+
+    async def _fetch_feed(self, step: FetchStep) -> Any:
+        """Event-loop version of TTLCache.get_or_load for a feed request."""
+        key = self._feed_key(step)
+        entry, state = self.feed_cache.lookup(key)
+        if state == "fresh":
+            return entry.value
+        if state == "stale":
+            if self.feed_cache.begin_refresh(key):
+                task = asyncio.ensure_future(self._refresh_feed(key, step))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            return entry.value
+        return await self._store_feed(key, step)
+
+    async def _perform_parallel(self, step: ParallelFetch) -> List[Any]:
+        replies: List[Any] = [None] * len(step.steps)
+        slots = asyncio.Semaphore(max(1, step.max_workers))
+
+        async def fetch(i: int) -> int:
+            async with slots:
+                replies[i] = await self._perform(step.steps[i])
+            return i
+
+        tasks = [asyncio.ensure_future(fetch(i)) for i in range(len(step.steps))]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                i = await next_done
+                if step.done is not None and step.done(i, replies[i]):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        return replies
+
+    async def _perform_stream(self, step: StreamFetch) -> Optional[int]:
+        resp = await self._request_page(
+            step.url, params=step.params, extra_headers=step.extra_headers, stream=True
+        )
+        if resp is None:
+            return None
+        try:
+            if resp.status_code >= 400:
+                print(f"  [warn] {step.url} returned HTTP {resp.status_code}")
+                return None
+            parser, read = ArrayItemParser(step.path), 0
+            async for chunk in self._body_chunks(resp):
+                for item in parser.feed(chunk):
+                    read += 1
+                    if step.take(item):
+                        return read
+                if parser.done:
+                    return read
+            for item in parser.close():
+                read += 1
+                if step.take(item):
+                    break
+            return read
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+            print(f"  [warn] streaming {step.url!r} failed: {exc}")
+            return None
+        finally:
+            # Back to the pool when read to the end; aiohttp drops the
+            # connection instead when the body was abandoned part way
+            if resp.body is not None:
+                resp.body.release()
+
+    async def _body_chunks(self, resp: PageResponse) -> AsyncIterator[Any]:
+        if resp.body is None:
+            # Already read: answered from the HTTP cache, or recorded
+            yield resp.text
+            return
+        async for chunk in resp.body.content.iter_chunked(self.STREAM_CHUNK_BYTES):
+            yield chunk
+
+    async def _perform(self, step: Step):
+        if isinstance(step, ParallelFetch):
+            return await self._perform_parallel(step)
+        if isinstance(step, StreamFetch):
+            return await self._perform_stream(step)
+        if step.feed:
+            return await self._fetch_feed(step)
+        if step.as_json:
+            return await self._request_json(
+                step.url, params=step.params, extra_headers=step.extra_headers
+            )
+        return await self._request_page(
+            step.url, params=step.params, extra_headers=step.extra_headers
+        )
+
+    async def _drive(self, steps: Steps) -> List[Job]:
+        """Run a platform step generator to completion over HTTP."""
+        reply = None
+        while True:
+            try:
+                step = steps.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply = await self._perform(step)
+
+    # =========================================================================
+    # PLATFORM SCRAPERS
+    # =========================================================================
+
+    async def get_jobs_linkedin(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return await self._drive(self._steps_linkedin(title, location, max_results))
+
+    async def get_jobs_internshala(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return await self._drive(self._steps_internshala(title, location, max_results))
+
+    async def get_jobs_remoteok(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return await self._drive(self._steps_remoteok(title, location, max_results))
+
+    async def get_jobs_arbeitnow(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return await self._drive(self._steps_arbeitnow(title, location, max_results))
+
+    async def get_jobs_themuse(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return await self._drive(self._steps_themuse(title, location, max_results))
+
+    async def get_jobs_himalayas(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return await self._drive(self._steps_himalayas(title, location, max_results))
+
+    async def get_jobs_jobicy(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return await self._drive(self._steps_jobicy(title, location, max_results))
+
+    # =========================================================================
+    # Orchestration
+    # =========================================================================
+
+    async def _run_platform(
+        self,
+        key: str,
+        title: str,
+        location: str,
+        max_results: int,
+        timeout: float,
+    ) -> Tuple[List[Job], Dict[str, str]]:
+        """Run one platform scraper under its deadline and build its status entry."""
+        flight_key = (
+            key, self._normalise(title), self._normalise(location), max_results
+        )
+        started = asyncio.get_running_loop().time()
+        try:
+            # Tasks started inside inherit the deadline for their requests
+            with search_deadline(timeout):
+                results = await asyncio.wait_for(
+                    self._coalesce(
+                        flight_key,
+                        lambda: self.platform_scrapers[key](title, location, max_results),
+                    ),
+                    timeout,
+                )
+            results = list(results)
+        except asyncio.TimeoutError:
+            print(f"  [warn] {self.PLATFORM_LABELS[key]} timed out")
+            return [], self._status_entry(key, "timeout", seconds=timeout)
+        except Exception as exc:
+            print(f"  [error] {self.PLATFORM_LABELS[key]} failed: {exc}")
+            return [], self._status_entry(
+                key, "error", seconds=asyncio.get_running_loop().time() - started
+            )
+        status = "success" if results else "empty"
+        return results, self._status_entry(
+            key, status, len(results), asyncio.get_running_loop().time() - started
+        )
+
+    async def probe_platform(
+        self, key: str, title: str, location: str, max_results: int = 5
+    ) -> str:
+        """Event-loop version of JobScraper.probe_platform."""
+        _results, entry = await self._run_platform(
+            key, title, location, max_results, self.platform_timeout(key)
+        )
+        status = entry["status"]
+        self.health.finish_probe(key, status, float(entry["seconds"]))
+        return status
+
+    async def iter_platform_results(
+        self,
+        title: str,
+        location: str,
+        max_results: int = 10,
+        platforms: Optional[List[str]] = None,
+        platform_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[str, List[Job], Dict[str, str]]]:
+        """
+        Event-loop version of JobScraper.iter_platform_results: yields
+        (key, jobs, status) for each platform as soon as it finishes,
+        degraded platforms first. Platforms still running when the
+        iterator is closed are cancelled.
+        """
+        query = (title, location)
+        selected = []
+        for key in self.resolve_platforms(platforms):
+            if self.health.allow(key):
+                selected.append(key)
+            else:
+                yield key, [], self._degraded_entry(key)
+        tasks = [
+            asyncio.ensure_future(
+                self._run_platform(
+                    key, title, location, max_results,
+                    self._platform_budget(key, platform_timeout, deadline),
+                )
+            )
+            for key in selected
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                results, status = await next_done
+                self.health.record_statuses([status], query)
+                yield status["key"], results, status
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def warm_feeds(
+        self,
+        max_age: float,
+        take_budget: Callable[[], bool] = lambda: True,
+        queries: Iterable[Tuple[str, str]] = (),
+    ) -> List[str]:
+        """Event-loop version of JobScraper.warm_feeds."""
+        warmed: List[str] = []
+        for key, step, build_index in self.feed_requests(queries):
+            if self.STREAM_FEEDS and key in self.STREAMED_PLATFORMS:
+                continue
+            feed_key = self._feed_key(step)
+            age = self.feed_cache.age(feed_key)
+            if age is not None and age <= max_age:
+                continue
+            if not take_budget():
+                break
+            build_index(await self._store_feed(feed_key, step))
+            warmed.append(self._warmed_label(key, step))
+        return warmed
+
+    async def scrape_all_sites(
+        self,
+        title: str,
+        location: str,
+        max_results_per_site: int = 10,
+        platforms: Optional[List[str]] = None,
+        platform_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> List[Job]:
+        """
+        Scrape every selected platform concurrently and return de-duplicated
+        jobs. Platforms that overrun their deadline (their own timeout,
+        capped by the search deadline in seconds) are reported as "timeout",
+        platforms whose circuit is open are skipped as "degraded".
+        """
+        selected = self.resolve_platforms(platforms)
+        self._announce_search(title, location, selected)
+        degraded = {key for key in selected if not self.health.allow(key)}
+
+        outcomes = await asyncio.gather(
+            *(
+                self._run_platform(
+                    key,
+                    title,
+                    location,
+                    max_results_per_site,
+                    self._platform_budget(key, platform_timeout, deadline),
+                )
+                for key in selected
+                if key not in degraded
+            )
+        )
+        self.health.record_statuses([status for _, status in outcomes], (title, location))
+
+        finished = {status["key"]: (results, status) for results, status in outcomes}
+        all_jobs: List[Job] = []
+        self.last_run_statuses = []
+        for key in selected:
+            if key in degraded:
+                self.last_run_statuses.append(self._degraded_entry(key))
+                continue
+            results, status = finished[key]
+            all_jobs.extend(results)
+            self.last_run_statuses.append(status)
+        return self._dedupe_jobs(all_jobs)
@@ -0,0 +1,133 @@
+"""
+Precision / recall of dedupe.Deduper on the labelled fixture of
+cross-platform postings (pairs of jobs in the same labelled cluster are
+duplicates), compared with the previous exact-key de-duplication, and
+its throughput on synthetic result sets of growing size.
+
+    python benchmarks/bench_dedupe.py [--sizes 1000,5000,20000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from itertools import combinations
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dedupe import Deduper  # noqa: E402
+from job_automation import Job  # noqa: E402
+from text_normalize import normalize_text  # noqa: E402
+
+FIXTURE = os.path.join(ROOT, "benchmarks", "fixtures", "dedupe_labelled.json")
+
+# The fixture must stay at least this good
+MIN_PRECISION = 0.95
+MIN_RECALL = 0.90
+
+
+def exact_key(job: Job) -> tuple:
+    """The key the scraper de-duplicated on before Deduper."""
+    return tuple(
+        normalize_text(value).lower() for value in (job.title, job.company, job.location)
+    )
+
+
+def predicted_pairs_exact(jobs: list) -> set:
+    pairs = set()
+    for a, b in combinations(range(len(jobs)), 2):
+        if exact_key(jobs[a]) == exact_key(jobs[b]):
+            pairs.add((a, b))
+    return pairs
+
+
+def predicted_pairs_deduper(jobs: list) -> set:
+    deduper = Deduper()
+    for job in jobs:
+        deduper.add(job)
+    position = {id(job): i for i, job in enumerate(jobs)}
+    pairs = set()
+    for group in deduper.clusters():
+        members = sorted(position[id(job)] for job in group)
+        pairs.update(combinations(members, 2))
+    return pairs
+
+
+def score(predicted: set, truth: set) -> tuple:
+    hits = len(predicted & truth)
+    precision = hits / len(predicted) if predicted else 1.0
+    recall = hits / len(truth) if truth else 1.0
+    return precision, recall
+
+
+def synthetic(n: int, rnd: random.Random) -> list:
+    roles = [
+        "Python Developer", "Data Engineer", "Frontend Engineer", "Product Manager",
+        "DevOps Engineer", "QA Engineer", "Machine Learning Engineer", "Designer",
+    ]
+    levels = ["", "Senior ", "Sr. ", "Junior ", "Lead ", "Staff "]
+    cities = ["Remote", "Remote, Worldwide", "Berlin, Germany", "London", "Pune, India"]
+    jobs = []
+    for _ in range(n):
+        jobs.append(Job(
+            title=f"{rnd.choice(levels)}{rnd.choice(roles)}",
+            company=f"Company {rnd.randint(1, n // 4 or 1)}{rnd.choice(['', ' Inc.', ' GmbH'])}",
+            location=rnd.choice(cities),
+            link="https://example.com/job",
+            source=rnd.choice(["LinkedIn", "RemoteOK", "Himalayas"]),
+        ))
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as fh:
+        rows = json.load(fh)
+    jobs = [
+        Job(
+            title=row["title"], company=row["company"], location=row["location"],
+            link=row.get("link", ""), source=row["source"], salary=row["salary"],
+            description=row["description"],
+        )
+        for row in rows
+    ]
+    truth = {
+        (a, b) for a, b in combinations(range(len(rows)), 2)
+        if rows[a]["cluster"] == rows[b]["cluster"]
+    }
+
+    print(f"fixture: {len(rows)} jobs, {len({r['cluster'] for r in rows})} postings, "
+          f"{len(truth)} duplicate pairs")
+    print(f"{'method':<10} {'precision':>10} {'recall':>8}")
+    exact = score(predicted_pairs_exact(jobs), truth)
+    fuzzy = score(predicted_pairs_deduper(jobs), truth)
+    print(f"{'exact':<10} {exact[0]:>10.3f} {exact[1]:>8.3f}")
+    print(f"{'deduper':<10} {fuzzy[0]:>10.3f} {fuzzy[1]:>8.3f}")
+
+    print(f"\n{'jobs':>7} {'ms':>9} {'µs/job':>8} {'clusters':>9}")
+    rnd = random.Random(11)
+    for n in (int(size) for size in args.sizes.split(",")):
+        batch = synthetic(n, rnd)
+        t0 = time.perf_counter()
+        deduper = Deduper()
+        for job in batch:
+            deduper.add(job)
+        clusters = len(deduper.results())
+        elapsed = time.perf_counter() - t0
+        print(f"{n:>7} {elapsed * 1000:>9.1f} {elapsed / n * 1e6:>8.1f} {clusters:>9}")
+
+    if fuzzy[0] < MIN_PRECISION or fuzzy[1] < MIN_RECALL:
+        sys.exit(
+            f"deduper below target: precision {fuzzy[0]:.3f} (min {MIN_PRECISION}), "
+            f"recall {fuzzy[1]:.3f} (min {MIN_RECALL})"
+        )
+
+
+if __name__ == "__main__":
+    main()
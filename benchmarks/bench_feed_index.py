@@ -0,0 +1,127 @@
+"""
+Per-query latency of the feed token index against the linear scan it
+replaces, on a synthetic RemoteOK-shaped feed, plus the cost of rebuilding
+the index for a refreshed copy of the feed with a few new items (delta
+ingestion re-cleans only those).
+
+    python benchmarks/bench_feed_index.py [--items 10000] [--queries 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_automation import JobScraper  # noqa: E402
+
+ROLES = [
+    "Senior Python Developer", "Backend Engineer", "Data Analyst",
+    "Frontend Developer (React)", "DevOps &amp; SRE Engineer",
+    "Machine Learning Engineer", "Product Designer", "QA Automation Engineer",
+    "Full Stack Developer", "Technical Writer", "<b>Staff</b> Data Engineer",
+]
+LOCATIONS = [
+    "Remote", "Worldwide", "Berlin, Germany", "Bangalore, India", "New York, NY",
+    "Remote, Europe", "London, UK", "", "Toronto, Canada", "Remote (US only)",
+]
+QUERIES = [
+    ("python developer", "remote"), ("data", "india"), ("engineer", "berlin"),
+    ("frontend react", "worldwide"), ("sre", "london"), ("qa automation", "canada"),
+    ("staff data engineer", "remote"), ("designer", "new york"), ("go", "any"),
+]
+
+
+def make_feed(n: int) -> list:
+    rnd = random.Random(7)
+    feed = [{"legal": "API terms"}]
+    for i in range(n):
+        feed.append({
+            "id": i,
+            "position": f"{rnd.choice(ROLES)} {rnd.randint(1, 99)}",
+            "company": f"Company {rnd.randint(1, 500)}",
+            "location": rnd.choice(LOCATIONS),
+            "date": "2025-04-01T00:00:00+00:00",
+            "epoch": 1743465600 + i,
+        })
+    return feed
+
+
+def refreshed(feed: list, new_items: int) -> list:
+    """A later copy of feed: new_items newer postings on top, oldest dropped."""
+    newest = feed[-1]
+    fresh = [
+        {**newest, "id": newest["id"] + 1 + i, "epoch": newest["epoch"] + 1 + i}
+        for i in range(new_items)
+    ]
+    return [feed[0]] + fresh + feed[1:len(feed) - new_items]
+
+
+def linear(scraper: JobScraper, feed: list, title: str, location: str) -> list:
+    out = []
+    for item in feed:
+        if not isinstance(item, dict) or "position" not in item:
+            continue
+        job_title = scraper._clean(item.get("position", ""))
+        job_loc = scraper._clean(item.get("location", "Remote")) or "Remote"
+        if not scraper._tokens_match(title, job_title):
+            continue
+        if location.lower() != "remote" and not scraper._location_match(location, job_loc):
+            continue
+        out.append(item["id"])
+    return out
+
+
+def indexed(scraper: JobScraper, index, title: str, location: str) -> list:
+    wanted = [index.title_matches(title)]
+    if location.lower() != "remote":
+        wanted.append(index.location_matches(scraper._normalise(location)))
+    return [entry[0]["id"] for entry in index.select(*wanted)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=len(QUERIES))
+    args = parser.parse_args()
+
+    scraper = JobScraper()
+    feed = make_feed(args.items)
+    queries = (QUERIES * (args.queries // len(QUERIES) + 1))[:args.queries]
+
+    t0 = time.perf_counter()
+    index = scraper._index_remoteok(feed)
+    build_s = time.perf_counter() - t0
+
+    new_items = max(1, args.items // 50)
+    next_copy = refreshed(feed, new_items)
+    t0 = time.perf_counter()
+    scraper._index_remoteok(next_copy)
+    delta_s = time.perf_counter() - t0
+
+    linear_s = indexed_s = 0.0
+    for title, location in queries:
+        t0 = time.perf_counter()
+        expected = linear(scraper, feed, title, location)
+        linear_s += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        got = indexed(scraper, index, title, location)
+        indexed_s += time.perf_counter() - t0
+
+        if got != expected:
+            sys.exit(f"MISMATCH for {title!r} / {location!r}: {len(got)} vs {len(expected)}")
+
+    n = len(queries)
+    print(f"feed items        : {args.items}")
+    print(f"index build       : {build_s * 1000:.1f} ms (once per feed)")
+    print(f"delta rebuild     : {delta_s * 1000:.1f} ms ({new_items} new items)")
+    print(f"linear scan/query : {linear_s / n * 1000:.2f} ms")
+    print(f"index query/query : {indexed_s / n * 1000:.2f} ms")
+    print(f"speedup           : {linear_s / max(indexed_s, 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+CPU cost of the LinkedIn and Internshala scrapers on saved result pages,
+per installed HTML parser backend, and the saving from precompiled
+selectors over per-call selector strings.
+
+lxml is optional: without it only html.parser is measured and the
+missing backend is reported. Install it with
+
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/bench_html_parse.py [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from typing import NamedTuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from html_backend import _PREFERRED_PARSERS, available_parsers, make_soup  # noqa: E402
+from job_automation import FetchStep, JobScraper  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures")
+PAGES = {
+    "linkedin": ("linkedin_search.html", JobScraper._LINKEDIN_SELECTORS),
+    "internshala": ("internshala_jobs.html", JobScraper._INTERNSHALA_SELECTORS),
+}
+
+
+# Scraper progress lines would land in the results table
+_SINK = open(os.devnull, "w")
+
+
+class Page(NamedTuple):
+    status_code: int
+    text: str
+
+
+def run_steps(steps, html: str) -> list:
+    """Drive a _steps_* generator, answering every fetch with html."""
+    reply = None
+    with contextlib.redirect_stdout(_SINK):
+        while True:
+            try:
+                step = steps.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply = Page(200, html) if isinstance(step, FetchStep) else None
+
+
+def timed(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = available_parsers()
+    for backend in _PREFERRED_PARSERS:
+        if backend not in backends:
+            print(f"{backend}: not installed, skipped (pip install -r benchmarks/requirements.txt)")
+    print(f"{'platform':<12} {'backend':<12} {'jobs':>5} {'parse ms':>9} {'scrape ms':>10}")
+    for platform, (filename, _) in PAGES.items():
+        with open(os.path.join(FIXTURES, filename), encoding="utf-8") as fh:
+            html = fh.read()
+        for backend in backends:
+            scraper = JobScraper(html_parser=backend)
+            steps = getattr(scraper, f"_steps_{platform}")
+            jobs = run_steps(steps("python developer", "india", 50), html)
+            parse_ms = timed(lambda: make_soup(html, backend), args.repeat)
+            scrape_ms = timed(
+                lambda: run_steps(steps("python developer", "india", 50), html),
+                args.repeat,
+            )
+            print(f"{platform:<12} {backend:<12} {len(jobs):>5} {parse_ms:>9.2f} {scrape_ms:>10.2f}")
+
+    print(f"\n{'platform':<12} {'strings ms':>11} {'compiled ms':>12}   (all field selectors, every card)")
+    for platform, (filename, selectors) in PAGES.items():
+        with open(os.path.join(FIXTURES, filename), encoding="utf-8") as fh:
+            soup = make_soup(fh.read())
+        cards = JobScraper()._select_cards(soup, selectors["cards"])
+        fields = [sel for key, sels in selectors.items() if key != "cards" for sel in sels]
+        patterns = [sel.pattern for sel in fields]
+
+        def with_strings():
+            for card in cards:
+                for pattern in patterns:
+                    card.select_one(pattern)
+
+        def with_compiled():
+            for card in cards:
+                for sel in fields:
+                    sel.select_one(card)
+
+        print(
+            f"{platform:<12} {timed(with_strings, args.repeat):>11.2f}"
+            f" {timed(with_compiled, args.repeat):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Bytes per Job record for the compact Job (slots, interned repeated values,
+compressed descriptions) against the plain dataclass it replaced, on
+synthetic scraped records.
+
+    python benchmarks/bench_job_memory.py [--records 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_automation import Job  # noqa: E402
+
+
+@dataclass
+class LegacyJob:
+    title: str
+    company: str
+    location: str
+    link: str
+    source: str
+    posted_date: str = ""
+    salary: str = ""
+    description: str = ""
+
+
+WORDS = (
+    "we are looking for an experienced engineer to join our team and help build "
+    "scalable services with python django postgres aws kubernetes you will work "
+    "closely with product design and data to ship features used by millions of "
+    "customers benefits include remote work flexible hours equity health insurance "
+    "learning budget and a friendly culture requirements strong communication "
+    "skills ownership testing code review experience with distributed systems"
+).split()
+SOURCES = ["LinkedIn", "Internshala", "RemoteOK", "Arbeitnow", "The Muse", "Himalayas", "Jobicy"]
+LOCATIONS = ["Remote", "Worldwide", "Berlin, Germany", "Bangalore, India", "London, UK"]
+POSTED = ["Recently", "1 day ago", "2 days ago", "Today", "1 week ago"]
+SALARIES = ["Not specified", "Not specified", "$100k - $140k", "₹20,000 /month"]
+
+
+def records(n: int, seed: int = 3):
+    """Field values as scraping produces them: a fresh string object per field."""
+    rnd = random.Random(seed)
+    for i in range(n):
+        words = rnd.choices(WORDS, k=rnd.randint(120, 320))
+        yield (
+            f"{rnd.choice(['Senior', 'Junior', 'Lead'])} Engineer {i}",
+            "".join(["Company ", str(rnd.randint(1, 2000))]),
+            "".join([rnd.choice(LOCATIONS)]),
+            f"https://example.com/jobs/{i}",
+            "".join([rnd.choice(SOURCES)]),
+            "".join([rnd.choice(POSTED)]),
+            "".join([rnd.choice(SALARIES)]),
+            " ".join(words),
+        )
+
+
+def measure(cls, n: int):
+    # Field strings are allocated while tracing, so they count against the
+    # record that keeps them alive
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    jobs = [cls(*row) for row in records(n)]
+    build_s = time.perf_counter() - t0
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return jobs, current, build_s
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args()
+    n = args.records
+
+    print(f"{'model':<10} {'bytes/job':>10} {'total MB':>9} {'build s':>8}")
+    results = {}
+    for name, cls in (("dataclass", LegacyJob), ("compact", Job)):
+        jobs, current, build_s = measure(cls, n)
+        results[name] = current
+        print(f"{name:<10} {current / n:>10.0f} {current / 1e6:>9.1f} {build_s:>8.2f}")
+        if name == "compact":
+            t0 = time.perf_counter()
+            total = sum(len(job.description) for job in jobs[:10000])
+            read_us = (time.perf_counter() - t0) / min(n, 10000) * 1e6
+            print(f"description read: {read_us:.1f} µs/job ({total} chars)")
+        del jobs
+
+    print(f"saving: {1 - results['compact'] / results['dataclass']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Checks text_normalize.normalize_text against the golden corpus of platform
+field values (expected outputs recorded from the BeautifulSoup cleaner) and
+reports the per-field speedup over that cleaner.
+
+    python benchmarks/bench_normalize.py [--repeat 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from text_normalize import normalize_text, soup_text  # noqa: E402
+
+CORPUS = os.path.join(ROOT, "benchmarks", "fixtures", "clean_corpus.json")
+
+
+def per_call_us(fn, values, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for value in values:
+            fn(value)
+    return (time.perf_counter() - t0) / (repeat * len(values)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(CORPUS, encoding="utf-8") as fh:
+        corpus = json.load(fh)
+
+    failures = [
+        row for row in corpus
+        if normalize_text(row["input"]) != row["expected"]
+        or soup_text(row["input"]) != row["expected"]
+    ]
+    for row in failures:
+        print(f"MISMATCH [{row['source']}.{row['field']}] {row['input']!r}")
+        print(f"  expected {row['expected']!r}")
+        print(f"  got      {normalize_text(row['input'])!r}")
+    if failures:
+        sys.exit(1)
+    print(f"golden corpus: {len(corpus)} values match")
+
+    by_field = defaultdict(list)
+    for row in corpus:
+        by_field[row["field"]].append(row["input"])
+
+    print(f"\n{'field':<12} {'values':>6} {'soup µs':>9} {'fast µs':>9} {'speedup':>8}")
+    for field_name, values in sorted(by_field.items()):
+        slow = per_call_us(soup_text, values, args.repeat)
+        fast = per_call_us(normalize_text, values, args.repeat)
+        print(f"{field_name:<12} {len(values):>6} {slow:>9.1f} {fast:>9.2f} {slow / fast:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
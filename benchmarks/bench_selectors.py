@@ -0,0 +1,205 @@
+"""
+Selector lookups and Internshala requests per search with the learned
+selector / URL-pattern order (selector_memory) against the plain fallback
+order, on the saved LinkedIn and Internshala result pages. Internshala is
+served on its third URL pattern only, as after a URL scheme change.
+
+    python benchmarks/bench_selectors.py [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+from typing import NamedTuple
+from urllib.parse import quote
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from job_automation import FetchStep, JobScraper  # noqa: E402
+from selector_memory import SelectorMemory  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures")
+PAGES = {
+    "linkedin": "linkedin_search.html",
+    "internshala": "internshala_jobs.html",
+}
+# One odd card that only the generic fallbacks match, then a regular card
+# that also carries an h3 (a badge) and a plain link ahead of its own
+ODD_THEN_REGULAR = """
+<div class="individual_internship">
+  <h3>Odd Card Title</h3><div class="company-name">Odd Co</div>
+  <a href="/jobs/detail/odd">View</a>
+</div>
+<div class="individual_internship">
+  <h3>Actively hiring</h3><a href="/premium">Premium</a>
+  <div class="job-title-text">Python Developer</div>
+  <div class="company-name">Regular Co</div>
+  <a class="view_detail_button" href="/jobs/detail/regular">View</a>
+</div>
+"""
+QUERIES = [("python developer", "india"), ("java developer", "mumbai"), ("data analyst", "pune")]
+
+
+# Scraper progress lines would land in the results table
+_SINK = open(os.devnull, "w")
+
+
+class Page(NamedTuple):
+    status_code: int
+    text: str
+
+
+class CountingSelector:
+    """A compiled selector that counts how often it is evaluated."""
+
+    calls = 0
+
+    def __init__(self, compiled) -> None:
+        self.compiled = compiled
+        self.pattern = compiled.pattern
+
+    def select(self, tag):
+        CountingSelector.calls += 1
+        return self.compiled.select(tag)
+
+    def select_one(self, tag):
+        CountingSelector.calls += 1
+        return self.compiled.select_one(tag)
+
+
+def counting(selectors: dict) -> dict:
+    return {
+        field: tuple(CountingSelector(sel) for sel in sels)
+        for field, sels in selectors.items()
+    }
+
+
+class NoMemory(SelectorMemory):
+    """The order before selector_memory: nothing is learned."""
+
+    def learn(self, key, name, position) -> None:
+        pass
+
+
+class CountingScraper(JobScraper):
+    _LINKEDIN_SELECTORS = counting(JobScraper._LINKEDIN_SELECTORS)
+    _INTERNSHALA_SELECTORS = counting(JobScraper._INTERNSHALA_SELECTORS)
+
+
+def run_steps(steps, answer) -> tuple:
+    """Drive a _steps_* generator; answer(url) gives each fetch's response."""
+    reply, fetches = None, 0
+    with contextlib.redirect_stdout(_SINK):
+        while True:
+            try:
+                step = steps.send(reply)
+            except StopIteration as done:
+                return done.value, fetches
+            if isinstance(step, FetchStep):
+                fetches += 1
+                reply = answer(step.url)
+            else:
+                reply = None
+
+
+def scrape(scraper: JobScraper, platform: str, answer) -> tuple:
+    CountingSelector.calls = 0
+    steps = getattr(scraper, f"_steps_{platform}")("python developer", "india", 50)
+    jobs, fetches = run_steps(steps, answer)
+    return len(jobs), fetches, CountingSelector.calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'platform':<12} {'order':<8} {'jobs':>5} {'requests':>9}"
+        f" {'lookups':>8} {'scrape ms':>10}"
+    )
+    for platform, filename in PAGES.items():
+        with open(os.path.join(FIXTURES, filename), encoding="utf-8") as fh:
+            html = fh.read()
+
+        # Internshala answers only its fresher-jobs URL pattern, the third
+        # one tried in the fallback order
+        def answer(url: str) -> Page:
+            if platform == "internshala" and "/fresher-jobs/" not in url:
+                return Page(404, "")
+            return Page(200, html)
+
+        # fallback: nothing learned (the previous behaviour); cold: first
+        # search after a restart without a memory file, learning from its
+        # first card on; learned: every later search
+        for order in ("fallback", "cold", "learned"):
+            memory = NoMemory() if order == "fallback" else SelectorMemory()
+            scraper = CountingScraper(selector_memory=memory)
+            if order == "learned":
+                scrape(scraper, platform, answer)
+            jobs, fetches, lookups = scrape(scraper, platform, answer)
+
+            t0 = time.perf_counter()
+            for _ in range(args.repeat):
+                if order == "cold":
+                    scraper.selector_memory = SelectorMemory()
+                scrape(scraper, platform, answer)
+            scrape_ms = (time.perf_counter() - t0) / args.repeat * 1000
+            print(
+                f"{platform:<12} {order:<8} {jobs:>5} {fetches:>9}"
+                f" {lookups:>8} {scrape_ms:>10.2f}"
+            )
+
+    # Back-to-back searches each request their own query's URLs, whatever
+    # was learned from the search before (no pattern answers, so every
+    # pattern is requested in its learned order)
+    scraper = JobScraper(selector_memory=SelectorMemory())
+    scraper.selector_memory.learn(("internshala", "url"), "jobs", 1)
+    for title, location in QUERIES:
+        fetched = []
+
+        def answer(url: str) -> Page:
+            fetched.append(url)
+            return Page(404, "")
+
+        run_steps(scraper._steps_internshala(title, location, 50), answer)
+        slug = title.lower().replace(" ", "-")
+        if fetched[0] != f"https://internshala.com/jobs/{slug}-jobs" or not all(
+            slug in url or quote(title) in url for url in fetched
+        ):
+            sys.exit(f"\n'{title}' in '{location}' fetched {fetched}")
+    print(f"\n{len(QUERIES)} back-to-back queries fetched their own URLs, learned one first")
+
+    # A catch-all that matched one odd card is not learned: the next card
+    # still gets its specific title and link selectors
+    scraper = JobScraper(selector_memory=SelectorMemory())
+    jobs, _ = run_steps(
+        scraper._steps_internshala("python developer", "india", 50),
+        lambda url: Page(200, ODD_THEN_REGULAR),
+    )
+    regular = jobs[1]
+    if (regular.title, regular.link) != (
+        "Python Developer", "https://internshala.com/jobs/detail/regular"
+    ):
+        sys.exit(f"\nregular card after an odd one parsed as {regular.title!r}, {regular.link!r}")
+    print("\nfallback match on an odd card left the next card on its specific selectors")
+
+    # Learned choices survive a restart
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "selector_memory.json")
+        scraper = JobScraper(selector_memory=SelectorMemory(path))
+        with open(os.path.join(FIXTURES, PAGES["internshala"]), encoding="utf-8") as fh:
+            html = fh.read()
+        run_steps(
+            scraper._steps_internshala("python developer", "india", 50),
+            lambda url: Page(200, html),
+        )
+        print(f"\nreloaded from disk: {SelectorMemory(path).stats()['choices']} learned choices")
+
+
+if __name__ == "__main__":
+    main()
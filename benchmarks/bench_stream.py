@@ -0,0 +1,165 @@
+"""
+Peak memory, bytes downloaded and latency of a cold RemoteOK / Arbeitnow
+search: the whole feed loaded with resp.json() and indexed (the default)
+against STREAM_FEEDS, which parses the body as it arrives and hangs up at
+max_results matches. A synthetic multi-MB feed of each shape is served
+from a local HTTP server; every search starts with empty caches.
+
+    python benchmarks/bench_stream.py [--items 4000] [--every 25]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from feed_cache import TTLCache  # noqa: E402
+from feed_index import FeedDeltas  # noqa: E402
+from http_pool import HttpPool  # noqa: E402
+from http_validators import ValidatorCache  # noqa: E402
+from job_automation import FetchStep, JobScraper  # noqa: E402
+from rate_limit import Rate, RateLimiter  # noqa: E402
+
+TITLES = [
+    "Senior Frontend Engineer", "Product Designer", "Data Analyst",
+    "DevOps Engineer", "Customer Success Manager", "Java Developer",
+    "Marketing Lead", "Site Reliability Engineer", "QA Engineer",
+]
+LOCATIONS = ["Remote", "Berlin", "Worldwide", "New York", "London"]
+CHUNK = 16 * 1024
+
+
+def synthetic_items(count: int, every: int, platform: str) -> list:
+    """count postings, one in every `every` a Python developer job."""
+    rng = random.Random(7)
+    items = []
+    for i in range(count):
+        title = "Python Developer" if i % every == every - 1 else rng.choice(TITLES)
+        description = "<p>" + " ".join(
+            rng.choice(["build", "ship", "scale", "<b>teams</b>", "APIs", "&amp;"])
+            for _ in range(250)
+        ) + "</p>"
+        if platform == "remoteok":
+            items.append({
+                "id": str(100000 + i), "epoch": 1700000000 + i,
+                "date": "2024-11-14T22:13:20+00:00", "position": title,
+                "company": f"Company {i}", "location": rng.choice(LOCATIONS),
+                "salary_min": 90000, "salary_max": 140000,
+                "url": f"https://remoteok.com/remote-jobs/{i}",
+                "description": description,
+            })
+        else:
+            items.append({
+                "slug": f"job-{i}", "created_at": 1700000000 + i, "title": title,
+                "company_name": f"Company {i}", "location": rng.choice(LOCATIONS),
+                "remote": i % 3 == 0, "url": f"https://www.arbeitnow.com/view/{i}",
+                "description": description,
+            })
+    return items
+
+
+class FeedServer:
+    """Serves the feeds and counts the bytes each download actually sent."""
+
+    def __init__(self, bodies: dict) -> None:
+        self.bodies = bodies
+        self.sent = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                body = server.bodies[self.path]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    for start in range(0, len(body), CHUNK):
+                        self.wfile.write(body[start:start + CHUNK])
+                        server.sent += min(CHUNK, len(body) - start)
+                        # Paced like a remote server so a hang-up is noticed
+                        time.sleep(0.0005)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.httpd.server_port}"
+
+
+class BenchScraper(JobScraper):
+    def __init__(self, server: FeedServer, stream: bool) -> None:
+        super().__init__(
+            feed_cache=TTLCache(ttl=300),
+            validators=ValidatorCache(),
+            feed_deltas=FeedDeltas(),
+            rate_limiter=RateLimiter(default=Rate(0, 1)),
+            http_pool=HttpPool(),
+        )
+        self.server = server
+        self.STREAM_FEEDS = stream
+
+    def _remoteok_feed(self) -> FetchStep:
+        return FetchStep(f"{self.server.base}/remoteok", as_json=True, feed=True)
+
+    def _arbeitnow_feed(self) -> FetchStep:
+        return FetchStep(f"{self.server.base}/arbeitnow", as_json=True, feed=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=4000)
+    parser.add_argument("--every", type=int, default=25)
+    parser.add_argument("--max-results", type=int, default=10)
+    args = parser.parse_args()
+
+    remoteok = [{"legal": "API terms"}] + synthetic_items(args.items, args.every, "remoteok")
+    arbeitnow = {
+        "data": synthetic_items(args.items, args.every, "arbeitnow"),
+        "links": {"next": None},
+        "meta": {"current_page": 1},
+    }
+    server = FeedServer({
+        "/remoteok": json.dumps(remoteok).encode(),
+        "/arbeitnow": json.dumps(arbeitnow).encode(),
+    })
+    for name, body in server.bodies.items():
+        print(f"{name[1:]} feed: {args.items} items, {len(body) / 1024 / 1024:.1f} MB")
+
+    print(
+        f"\n{'platform':<10} {'mode':<8} {'jobs':>5} {'downloaded KB':>14}"
+        f" {'peak MB':>8} {'ms':>7}"
+    )
+    for platform in ("remoteok", "arbeitnow"):
+        for mode in ("whole", "stream"):
+            scraper = BenchScraper(server, stream=mode == "stream")
+            steps = getattr(scraper, f"_steps_{platform}")
+            server.sent = 0
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            jobs = scraper._drive(steps("python developer", "remote", args.max_results))
+            elapsed = (time.perf_counter() - t0) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            # Let the server notice the hang-up before reading its count
+            time.sleep(0.2)
+            print(
+                f"{platform:<10} {mode:<8} {len(jobs):>5} {server.sent / 1024:>14.0f}"
+                f" {peak / 1024 / 1024:>8.1f} {elapsed:>7.0f}"
+            )
+            scraper.http_pool.close()
+
+
+if __name__ == "__main__":
+    main()
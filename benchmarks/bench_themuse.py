@@ -0,0 +1,165 @@
+"""
+Latency, requests and bytes transferred per The Muse search: the previous
+scraper (pages 1..N one after another, unfiltered, matched locally) against
+concurrent pages with early cancellation and server-side category /
+location filters. Responses are served from recorded jobs with a fixed
+per-request latency; every search starts with empty caches.
+
+    python benchmarks/bench_themuse.py [--latency-ms 120]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from feed_cache import TTLCache  # noqa: E402
+from feed_index import FeedDeltas  # noqa: E402
+from http_validators import ValidatorCache  # noqa: E402
+from job_automation import Job, JobScraper, Steps  # noqa: E402
+from rate_limit import Rate, RateLimiter  # noqa: E402
+
+FIXTURE = os.path.join(ROOT, "benchmarks", "fixtures", "themuse_jobs.json")
+PAGE_SIZE = 20
+
+QUERIES = [
+    ("python developer", "remote", 10),
+    ("data scientist", "remote", 10),
+    ("product manager", "new york", 10),
+    ("designer", "london", 10),
+    ("rust developer", "remote", 10),  # few hits: every page is read
+]
+
+
+class Recorded:
+    """A response as JobScraper._request_page returns it."""
+
+    def __init__(self, body: bytes) -> None:
+        self.status_code = 200
+        self.content = body
+        self.headers = {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class RecordedMuse:
+    """The Muse jobs endpoint answered from the recorded jobs."""
+
+    def __init__(self, jobs: List[dict], latency: float) -> None:
+        self.jobs = jobs
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bytes = 0
+
+    def get(self, params: Optional[dict]) -> Recorded:
+        params = params or {}
+        selected = [
+            job for job in self.jobs
+            if (
+                "category" not in params
+                or any(c["name"] == params["category"] for c in job["categories"])
+            )
+            and (
+                "location" not in params
+                or any(l["name"] == params["location"] for l in job["locations"])
+            )
+        ]
+        page = int(params.get("page", 1))
+        body = json.dumps({
+            "page": page,
+            "page_count": -(-len(selected) // PAGE_SIZE),
+            "results": selected[(page - 1) * PAGE_SIZE:page * PAGE_SIZE],
+        }).encode()
+        # Counted when the request is sent: an abandoned page still costs
+        # the bytes the server has started streaming
+        with self.lock:
+            self.requests += 1
+            self.bytes += len(body)
+        time.sleep(self.latency)
+        return Recorded(body)
+
+
+class BenchScraper(JobScraper):
+    def __init__(self, server: RecordedMuse) -> None:
+        super().__init__(
+            feed_cache=TTLCache(ttl=300),
+            validators=ValidatorCache(),
+            feed_deltas=FeedDeltas(),
+            rate_limiter=RateLimiter(default=Rate(0, 1)),
+        )
+        self.server = server
+
+    def _request_page(self, url, params=None, timeout=15, extra_headers=None):
+        return self.server.get(params)
+
+
+def legacy_steps(scraper: JobScraper, title: str, location: str, max_results: int) -> Steps:
+    """The Muse scraper before concurrent pages and server-side filters."""
+    jobs: List[Job] = []
+    for page in range(1, scraper.THEMUSE_PAGES + 1):
+        feed = yield scraper._themuse_feed(page)
+        index = scraper._themuse_index(feed, page)
+        if index is None:
+            break
+        wanted = [index.title_matches(title)]
+        if location and location.lower() != "remote":
+            wanted.append(index.location_matches(scraper._normalise(location)))
+        for item, job_title, company, job_loc in index.select(*wanted):
+            jobs.append(Job(job_title, company, job_loc, "", "The Muse"))
+            if len(jobs) >= max_results:
+                break
+        if len(jobs) >= max_results:
+            break
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=120)
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as fh:
+        recorded = json.load(fh)
+
+    print(
+        f"{'query':<30} {'scraper':<9} {'jobs':>5} {'requests':>9}"
+        f" {'KB':>7} {'ms':>7}"
+    )
+    totals = {"before": [0.0, 0], "after": [0.0, 0]}
+    for title, location, max_results in QUERIES:
+        for name in ("before", "after"):
+            server = RecordedMuse(recorded, args.latency_ms / 1000)
+            scraper = BenchScraper(server)
+            if name == "before":
+                steps = legacy_steps(scraper, title, location, max_results)
+            else:
+                steps = scraper._steps_themuse(title, location, max_results)
+            t0 = time.perf_counter()
+            jobs = scraper._drive(steps)
+            elapsed = (time.perf_counter() - t0) * 1000
+            # Let abandoned pages finish so they are counted
+            time.sleep(args.latency_ms / 1000)
+            totals[name][0] += elapsed
+            totals[name][1] += server.bytes
+            print(
+                f"{title + ' / ' + location:<30} {name:<9} {len(jobs):>5}"
+                f" {server.requests:>9} {server.bytes / 1024:>7.1f} {elapsed:>7.0f}"
+            )
+
+    before, after = totals["before"], totals["after"]
+    print(
+        f"\ntotal: {before[0]:.0f} ms -> {after[0]:.0f} ms, "
+        f"{before[1] / 1024:.0f} KB -> {after[1] / 1024:.0f} KB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""
+Offline benchmark suite: every platform scraper against its recorded
+payload served by a local stub (benchmarks/stub_server.py), then the
+aggregation pipeline (_clean, the dedupe step of scrape_all_sites,
+filter_latest_jobs) and a whole concurrent search, at each size.
+
+Reports throughput, time per stage (a scraper's time is split into fetch,
+spent inside _request_page, and parse, everything else) and peak traced
+memory, and compares them with a stored baseline: any stage slower or
+larger than the baseline by more than the tolerance is reported as a
+REGRESSION and the exit status is 1.
+
+Timings are compared as multiples of a fixed reference workload measured
+in the same run (plain JSON / sorting / string work that does not touch
+the scrapers), never as absolute milliseconds, so the baseline holds no
+machine's clock speed. A stage that looks slower is measured again with
+more repeats, and only a slowdown that holds up is reported. Peak memory
+does not depend on the machine and is compared as is.
+
+    python benchmarks/run.py                  # realistic sizes: 50 and 500
+    python benchmarks/run.py --stress         # adds 5,000 and 50,000 items
+    python benchmarks/run.py --sizes 50,2000 --stages remoteok,dedupe
+    python benchmarks/run.py --save-baseline  # record the current numbers
+
+Every run starts with empty caches and needs no network.
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from circuit_breaker import HealthBoard  # noqa: E402
+from feed_cache import TTLCache  # noqa: E402
+from feed_index import FeedDeltas  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+from http_pool import HttpPool  # noqa: E402
+from http_validators import ValidatorCache  # noqa: E402
+from job_automation import Job, JobScraper  # noqa: E402
+from rate_limit import Rate, RateLimiter  # noqa: E402
+from request_policy import RequestPolicy  # noqa: E402
+from selector_memory import SelectorMemory  # noqa: E402
+from singleflight import SingleFlight  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+CORPUS = os.path.join(ROOT, "benchmarks", "fixtures", "clean_corpus.json")
+
+REALISTIC_SIZES = [50, 500]
+STRESS_SIZES = [5000, 50000]
+PLATFORMS = list(JobScraper.DEFAULT_PLATFORMS)
+PIPELINE = ["clean", "dedupe", "filter_latest", "search"]
+
+TITLE, LOCATION = "developer", "remote"
+
+# Differences below these are noise, whatever the ratio
+MIN_SECONDS = 0.005
+MIN_PEAK_BYTES = 256 * 1024
+
+# Passes over the corpus in one run of the reference workload (~50 ms): long
+# enough that CPU contention slows it as much as the stages it is compared to
+REFERENCE_ROUNDS = 750
+
+
+class BenchScraper(JobScraper):
+    """A JobScraper with private, empty caches whose requests go to the stub."""
+
+    def __init__(self, stub: StubServer) -> None:
+        super().__init__(
+            feed_cache=TTLCache(ttl=300),
+            platform_flights=SingleFlight(),
+            validators=ValidatorCache(),
+            feed_deltas=FeedDeltas(),
+            rate_limiter=RateLimiter(default=Rate(0, 1)),
+            health=HealthBoard(),
+            selector_memory=SelectorMemory(),
+            http_pool=HttpPool(),
+            request_policy=RequestPolicy(hedging=False),
+            http_cache=HttpCache(mode="off"),
+        )
+        self.stub = stub
+        self._fetches: List[Tuple[float, float]] = []
+
+    def _request_page(self, url, params=None, timeout=15, extra_headers=None, stream=False):
+        t0 = time.perf_counter()
+        try:
+            return super()._request_page(
+                self.stub.url_for(url), params, timeout, extra_headers, stream
+            )
+        finally:
+            self._fetches.append((t0, time.perf_counter()))
+
+    @property
+    def fetch_seconds(self) -> float:
+        """Wall time with at least one request outstanding (pages overlap)."""
+        total, reached = 0.0, 0.0
+        for start, end in sorted(self._fetches):
+            if end > reached:
+                total += end - max(start, reached)
+                reached = end
+        return total
+
+
+# ---------------------------------------------------------------------------
+# Measuring
+# ---------------------------------------------------------------------------
+
+def measure(run: Callable[[], Tuple[Any, float]], repeat: int) -> Dict[str, Any]:
+    """
+    Best of `repeat` timed runs, then one run under tracemalloc for the
+    peak. run() returns (result, seconds spent fetching).
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        result, fetch = run()
+        seconds = time.perf_counter() - t0
+        if best is None or seconds < best[0]:
+            best = (seconds, fetch, result)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds, fetch, result = best
+    return {"seconds": seconds, "fetch": fetch, "peak_bytes": peak, "result": result}
+
+
+def reference_seconds(corpus: List[str], repeat: int) -> float:
+    """Best time of the reference workload that stage timings are relative to."""
+    text = json.dumps(corpus)
+    best = None
+    for _ in range(max(repeat, 5)):
+        gc.collect()
+        t0 = time.perf_counter()
+        for _ in range(REFERENCE_ROUNDS):
+            sorted(word.lower() for entry in json.loads(text) for word in entry.split())
+        seconds = time.perf_counter() - t0
+        if best is None or seconds < best:
+            best = seconds
+    return best
+
+
+def quiet(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """fn with the scrapers' progress output discarded."""
+    def run():
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            return fn()
+    return run
+
+
+def scrape_platform(
+    stub: StubServer, key: str, size: int
+) -> Callable[[], Tuple[List[Job], float]]:
+    def run():
+        scraper = BenchScraper(stub)
+        try:
+            jobs = scraper.platform_scrapers[key](TITLE, LOCATION, size)
+        finally:
+            scraper.http_pool.close()
+        return jobs, scraper.fetch_seconds
+    return quiet(run)
+
+
+def full_search(stub: StubServer, size: int) -> Callable[[], Tuple[List[Job], float]]:
+    def run():
+        scraper = BenchScraper(stub)
+        try:
+            # No platform may time out: every run must do the whole work
+            jobs = scraper.scrape_all_sites(
+                TITLE, LOCATION, size, concurrent=True, platform_timeout=3600
+            )
+        finally:
+            scraper.http_pool.close()
+        # Platforms overlap in time, so their fetch time is not separable
+        return jobs, 0.0
+    return quiet(run)
+
+
+def run_size(
+    stub: StubServer, size: int, stages: List[str], repeat: int, corpus: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    stub.size = size
+    stub.prepare()
+    results: Dict[str, Dict[str, Any]] = {}
+    jobs: List[Job] = []
+    scraper = BenchScraper(stub)
+
+    for key in PLATFORMS:
+        # The pipeline stages work on every platform's jobs
+        if key not in stages and not set(PIPELINE[:3]) & set(stages):
+            continue
+        measured = measure(scrape_platform(stub, key, size), repeat)
+        jobs.extend(measured["result"])
+        if key in stages:
+            measured["items"] = stub.items(key)
+            results[key] = measured
+
+    texts = [corpus[i % len(corpus)] for i in range(size)]
+    pipeline = {
+        "clean": (len(texts), lambda: ([scraper._clean(t) for t in texts], 0.0)),
+        "dedupe": (len(jobs), quiet(lambda: (scraper._dedupe_jobs(jobs), 0.0))),
+        "filter_latest": (len(jobs), lambda: (scraper.filter_latest_jobs(jobs, 7), 0.0)),
+        "search": (sum(stub.items(k) for k in PLATFORMS), full_search(stub, size)),
+    }
+    for stage in PIPELINE:
+        if stage not in stages:
+            continue
+        items, run = pipeline[stage]
+        measured = measure(run, repeat)
+        measured["items"] = items
+        results[stage] = measured
+    scraper.http_pool.close()
+
+    for measured in results.values():
+        result = measured.pop("result")
+        measured["out"] = len(result)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def print_table(size: int, results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n== {size} items ==")
+    print(
+        f"{'stage':<14} {'items':>7} {'out':>7} {'items/s':>10} {'total ms':>9}"
+        f" {'fetch ms':>9} {'parse ms':>9} {'peak MB':>8}"
+    )
+    for stage, m in results.items():
+        seconds = m["seconds"]
+        rate = m["items"] / seconds if seconds > 0 else float("inf")
+        fetch = f"{m['fetch'] * 1000:>9.1f}" if m["fetch"] else f"{'-':>9}"
+        parse = (
+            f"{(seconds - m['fetch']) * 1000:>9.1f}" if m["fetch"] else f"{'-':>9}"
+        )
+        print(
+            f"{stage:<14} {m['items']:>7} {m['out']:>7} {rate:>10.0f}"
+            f" {seconds * 1000:>9.1f} {fetch} {parse} {m['peak_bytes'] / 1024 / 1024:>8.2f}"
+        )
+
+
+def slower(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    reference: float,
+    tolerance: float,
+) -> List[Tuple[str, str]]:
+    """(name, line) for every stage slower than the baseline, in reference units."""
+    regressions = []
+    for name, now in sorted(current.items()):
+        then = baseline.get(name)
+        if then is None or "relative" not in then:
+            continue
+        relative = now["seconds"] / reference
+        limit = max(then["relative"], MIN_SECONDS / reference) * (1 + tolerance)
+        if relative > limit:
+            regressions.append((
+                name,
+                f"{name}: {relative:.3f}x reference vs baseline {then['relative']:.3f}x"
+                f" (+{relative / then['relative'] - 1:.0%}, {now['seconds'] * 1000:.1f} ms now)",
+            ))
+    return regressions
+
+
+def larger(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    memory_tolerance: float,
+) -> List[str]:
+    """Lines for every stage whose peak memory grew beyond the tolerance."""
+    regressions = []
+    for name, now in sorted(current.items()):
+        then = baseline.get(name)
+        if then is None:
+            continue
+        limit = max(then["peak_bytes"], MIN_PEAK_BYTES) * (1 + memory_tolerance)
+        if now["peak_bytes"] > limit:
+            regressions.append(
+                f"{name}: peak {now['peak_bytes'] / 1024 / 1024:.2f} MB vs baseline "
+                f"{then['peak_bytes'] / 1024 / 1024:.2f} MB"
+                f" (+{now['peak_bytes'] / then['peak_bytes'] - 1:.0%})"
+            )
+    return regressions
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save_baseline(
+    path: str, flat: Dict[str, Dict[str, Any]], reference: float, merge: bool
+) -> None:
+    saved = (load_baseline(path) if merge else None) or {"results": {}}
+    saved["meta"] = {
+        "python": platform.python_version(),
+        "recorded": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+    for name, m in flat.items():
+        saved["results"][name] = {
+            # stage time / reference workload time of the same run
+            "relative": round(m["seconds"] / reference, 4),
+            "peak_bytes": m["peak_bytes"],
+            "items": m["items"],
+        }
+    saved["results"] = dict(sorted(saved["results"].items()))
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(saved, fh, indent=2)
+        fh.write("\n")
+
+
+def parse_list(value: str) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=lambda v: [int(s) for s in parse_list(v)])
+    parser.add_argument("--stress", action="store_true", help="add 5,000 and 50,000 items")
+    parser.add_argument(
+        "--stages", type=parse_list, default=PLATFORMS + PIPELINE,
+        help=f"comma-separated subset of: {', '.join(PLATFORMS + PIPELINE)}",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage (best kept)")
+    parser.add_argument(
+        "--confirm-repeat", type=int, default=10,
+        help="timed runs when re-measuring a stage that looked slower",
+    )
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown, 0.5 = +50%%")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    unknown = set(args.stages) - set(PLATFORMS + PIPELINE)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    sizes = args.sizes or REALISTIC_SIZES + (STRESS_SIZES if args.stress else [])
+
+    with open(CORPUS, encoding="utf-8") as fh:
+        corpus = [entry["input"] for entry in json.load(fh)]
+
+    stub = StubServer(JobScraper._LINKEDIN_SELECTORS, JobScraper._INTERNSHALA_SELECTORS)
+    flat: Dict[str, Dict[str, Any]] = {}
+    try:
+        reference = reference_seconds(corpus, args.repeat)
+        print(f"reference workload: {reference * 1000:.1f} ms")
+        for size in sizes:
+            results = run_size(stub, size, args.stages, args.repeat, corpus)
+            print_table(size, results)
+            for stage, measured in results.items():
+                flat[f"{stage}@{size}"] = measured
+
+        baseline = None if args.save_baseline else load_baseline(args.baseline)
+        suspects = (
+            slower(flat, baseline["results"], reference, args.tolerance) if baseline else []
+        )
+        if suspects:
+            # One slow run is usually noise: measure the suspects (and the
+            # reference) again with more repeats and keep the best times
+            print(f"\nre-measuring {len(suspects)} slower stages ...")
+            reference = min(reference, reference_seconds(corpus, args.confirm_repeat))
+            for size in sizes:
+                stages = [name.split("@")[0] for name, _ in suspects if name.endswith(f"@{size}")]
+                if not stages:
+                    continue
+                again = run_size(stub, size, stages, args.confirm_repeat, corpus)
+                for stage in stages:
+                    measured = flat[f"{stage}@{size}"]
+                    measured["seconds"] = min(measured["seconds"], again[stage]["seconds"])
+    finally:
+        stub.close()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(flat, fh, indent=2)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, flat, reference, merge=True)
+        print(f"\nbaseline saved to {os.path.relpath(args.baseline, ROOT)}")
+        return 0
+
+    if baseline is None:
+        print(f"\nno baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+    regressions = [
+        line for _, line in slower(flat, baseline["results"], reference, args.tolerance)
+    ] + larger(flat, baseline["results"], args.memory_tolerance)
+    compared = len(set(flat) & set(baseline["results"]))
+    if regressions:
+        print(f"\nREGRESSION in {len(regressions)} of {compared} measurements:")
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        return 1
+    print(f"\nno regressions in {compared} measurements against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""
+Local stand-in for every upstream the scrapers talk to, for offline
+benchmarks. Each platform is answered from its recorded payload in
+benchmarks/fixtures, scaled to `size` postings: the recorded postings are
+repeated with fresh ids and numbered titles, so a feed of any size keeps
+the shape (and the per-posting cost) of the real one.
+
+Requests arrive as http://127.0.0.1:<port>/<upstream host>/<path>?<query>
+(see StubServer.url_for); HTML pages of the scraped sites are capped at
+HTML_MAX_ITEMS cards, far more than a real result page carries.
+"""
+
+import copy
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures")
+
+HTML_MAX_ITEMS = 5000
+THEMUSE_PAGES = 4
+_MARKER = "BENCHCARDSMARKER"
+_TITLE = "BENCHTITLESUFFIX"
+
+Payload = Tuple[str, bytes]  # (content type, body)
+
+
+def _load(name: str):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as fh:
+        return fh.read() if name.endswith(".html") else json.load(fh)
+
+
+def _suffix(n: int, templates: int) -> str:
+    round_no = n // templates
+    return f" ({round_no})" if round_no else ""
+
+
+def _repeat(templates: List[dict], size: int, vary: Callable[[dict, int, str], None]) -> List[dict]:
+    items = []
+    for n in range(size):
+        item = copy.deepcopy(templates[n % len(templates)])
+        vary(item, n, _suffix(n, len(templates)))
+        items.append(item)
+    return items
+
+
+# ---------------------------------------------------------------------------
+# HTML pages
+# ---------------------------------------------------------------------------
+
+class HtmlPage:
+    """A recorded result page whose cards can be repeated any number of times."""
+
+    def __init__(self, html: str, card_selectors, title_selectors) -> None:
+        soup = BeautifulSoup(html, "html.parser")
+        cards = []
+        for selector in card_selectors:
+            cards = selector.select(soup)
+            if cards:
+                break
+        self.cards: List[str] = []
+        for card in cards:
+            for selector in title_selectors:
+                title = selector.select_one(card)
+                if title is not None:
+                    title.string = title.get_text(" ", strip=True) + _TITLE
+                    break
+            self.cards.append(str(card))
+        cards[0].replace_with(_MARKER)
+        for card in cards[1:]:
+            card.decompose()
+        self.head, _, self.tail = str(soup).partition(_MARKER)
+
+    def render(self, size: int) -> str:
+        size = min(size, HTML_MAX_ITEMS)
+        parts = [self.head]
+        for n in range(size):
+            card = self.cards[n % len(self.cards)]
+            parts.append(card.replace(_TITLE, _suffix(n, len(self.cards))))
+        parts.append(self.tail)
+        return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Payload builders
+# ---------------------------------------------------------------------------
+
+def _remoteok(size: int) -> List[dict]:
+    recorded = _load("remoteok_api.json")
+    legal, templates = recorded[:1], recorded[1:]
+
+    def vary(item, n, suffix):
+        item["id"] = str(2000000 + n)
+        item["epoch"] -= n * 60
+        item["position"] += suffix
+        item["url"] = item["apply_url"] = f"https://remoteok.com/remote-jobs/{item['id']}"
+
+    return legal + _repeat(templates, size, vary)
+
+
+def _arbeitnow(size: int) -> dict:
+    recorded = _load("arbeitnow_api.json")
+
+    def vary(item, n, suffix):
+        item["slug"] = f"{item['slug']}-{n}"
+        item["title"] += suffix
+        item["created_at"] -= n * 60
+        item["url"] = f"{item['url']}-{n}"
+
+    recorded["data"] = _repeat(recorded["data"], size, vary)
+    return recorded
+
+
+def _himalayas(size: int) -> dict:
+    recorded = _load("himalayas_search.json")
+
+    def vary(item, n, suffix):
+        item["guid"] = f"himalayas-{n}"
+        item["title"] += suffix
+        item["applicationLink"] = f"{item['applicationLink']}-{n}"
+
+    recorded["jobs"] = _repeat(recorded["jobs"], size, vary)
+    recorded["totalCount"] = recorded["limit"] = size
+    return recorded
+
+
+def _jobicy(size: int) -> dict:
+    recorded = _load("jobicy_remote_jobs.json")
+
+    def vary(item, n, suffix):
+        item["id"] = 300000 + n
+        item["jobTitle"] += suffix
+        item["url"] = f"https://jobicy.com/jobs/{item['id']}"
+
+    recorded["jobs"] = _repeat(recorded["jobs"], size, vary)
+    recorded["jobCount"] = size
+    return recorded
+
+
+def _themuse(size: int) -> List[dict]:
+    def vary(item, n, suffix):
+        item["id"] = 9500000 + n
+        item["name"] += suffix
+        item.setdefault("refs", {})["landing_page"] = f"https://www.themuse.com/jobs/{item['id']}"
+
+    return _repeat(_load("themuse_jobs.json"), size, vary)
+
+
+def _json(data) -> Payload:
+    return "application/json", json.dumps(data).encode("utf-8")
+
+
+def _html(text: str) -> Payload:
+    return "text/html; charset=utf-8", text.encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class StubServer:
+    """Serves every platform at `size` postings; change .size between runs."""
+
+    HOSTS: Dict[str, str] = {
+        "www.linkedin.com": "linkedin",
+        "internshala.com": "internshala",
+        "remoteok.com": "remoteok",
+        "www.arbeitnow.com": "arbeitnow",
+        "www.themuse.com": "themuse",
+        "himalayas.app": "himalayas",
+        "jobicy.com": "jobicy",
+    }
+
+    def __init__(self, linkedin_selectors: dict, internshala_selectors: dict, size: int = 50) -> None:
+        self.size = size
+        self.requests = 0
+        self.bytes = 0
+        self._payloads: Dict[Tuple[str, int, int], Payload] = {}
+        self._lock = threading.Lock()
+        self._pages = {
+            "linkedin": HtmlPage(
+                _load("linkedin_search.html"),
+                linkedin_selectors["cards"], linkedin_selectors["title"],
+            ),
+            "internshala": HtmlPage(
+                _load("internshala_jobs.html"),
+                internshala_selectors["cards"], internshala_selectors["title"],
+            ),
+        }
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self._httpd.server_port}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def url_for(self, url: str) -> str:
+        """Where the stub answers a request meant for url."""
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.base}/{parts.netloc}{parts.path}{query}"
+
+    def items(self, platform: str) -> int:
+        """Postings a platform's payload holds at the current size."""
+        if platform in self._pages:
+            return min(self.size, HTML_MAX_ITEMS)
+        return self.size
+
+    def payload(self, platform: str, page: int = 1) -> Payload:
+        key = (platform, self.size, page)
+        with self._lock:
+            cached = self._payloads.get(key)
+        if cached is not None:
+            return cached
+        built = self._build(platform, page)
+        with self._lock:
+            self._payloads[key] = built
+        return built
+
+    def prepare(self) -> None:
+        """Build every payload for the current size ahead of the timed runs."""
+        for platform in self.HOSTS.values():
+            pages = range(1, THEMUSE_PAGES + 1) if platform == "themuse" else [1]
+            for page in pages:
+                self.payload(platform, page)
+
+    def _build(self, platform: str, page: int) -> Payload:
+        size = self.size
+        if platform in self._pages:
+            return _html(self._pages[platform].render(size))
+        if platform == "themuse":
+            per_page = -(-size // THEMUSE_PAGES)
+            jobs = _themuse(size)
+            return _json({
+                "page": page,
+                "page_count": THEMUSE_PAGES,
+                "items_per_page": per_page,
+                "total": size,
+                "results": jobs[(page - 1) * per_page:page * per_page],
+            })
+        builders = {
+            "remoteok": _remoteok,
+            "arbeitnow": _arbeitnow,
+            "himalayas": _himalayas,
+            "jobicy": _jobicy,
+        }
+        return _json(builders[platform](size))
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                host, _, _ = parts.path.lstrip("/").partition("/")
+                platform = server.HOSTS.get(host)
+                if platform is None:
+                    self.send_error(404)
+                    return
+                page = int(parse_qs(parts.query).get("page", ["1"])[0])
+                content_type, body = server.payload(platform, page)
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                with server._lock:
+                    server.requests += 1
+                    server.bytes += len(body)
+
+        return Handler
@@ -0,0 +1,285 @@
+"""
+Platform health and circuit breakers
+====================================
+Every platform outcome a search records in last_run_statuses ("success",
+"empty", "error", "timeout", plus how long the platform took) is fed to
+the platform's breaker:
+
+  - closed     the platform is scraped normally; its recent error, empty
+               and latency figures are kept over a sliding window
+  - open       after failure_threshold errors / timeouts in a row, or
+               empty_threshold empty results in a row for queries that
+               recently returned jobs there (what a markup change looks
+               like; an empty niche query proves nothing), searches skip
+               the platform at once and report it as "degraded"
+  - half-open  once the cooldown has passed the platform is due for a
+               probe: the next search that asks allow() scrapes it, or the
+               scheduler's background probe (JobScraper.probe_platform)
+               with the last query that succeeded there, whichever comes
+               first. Only one probe runs at a time. A probe that returns
+               jobs, or finds nothing for a query not known to have any,
+               closes the breaker; anything else re-opens it with a
+               doubled cooldown. A probe that never reports back is given
+               up after another cooldown.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_STATUSES = {"error", "timeout"}
+
+# Query used to probe a platform that has never answered a search
+DEFAULT_PROBE_QUERY = ("software engineer", "remote")
+
+# Who is running a half-open breaker's probe
+SEARCH_PROBE = "search"
+BACKGROUND_PROBE = "background"
+
+
+def _query_key(query: Tuple[str, str]) -> Tuple[str, str]:
+    return tuple(part.strip().lower() for part in query)  # type: ignore[return-value]
+
+
+class CircuitBreaker:
+    __slots__ = (
+        "state", "failures", "empties", "opened_at", "cooldown", "trips",
+        "probing", "probe_at", "last_query", "hits", "window",
+    )
+
+    def __init__(self, cooldown: float, window: int) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.empties = 0
+        self.opened_at = 0.0
+        self.cooldown = cooldown
+        self.trips = 0
+        self.probing: Optional[str] = None
+        self.probe_at = 0.0
+        self.last_query: Tuple[str, str] = DEFAULT_PROBE_QUERY
+        # Normalised queries that recently returned jobs on the platform
+        self.hits: Deque[Tuple[str, str]] = deque(maxlen=window)
+        self.window: Deque[Tuple[str, Optional[float]]] = deque(maxlen=window)
+
+    def known_hit(self, query: Optional[Tuple[str, str]]) -> bool:
+        return query is not None and _query_key(query) in self.hits
+
+    def add_hit(self, query: Tuple[str, str]) -> None:
+        key = _query_key(query)
+        if key in self.hits:
+            self.hits.remove(key)
+        self.hits.append(key)
+        self.last_query = query
+
+    def rates(self) -> Dict[str, Any]:
+        total = len(self.window)
+        if not total:
+            return {"samples": 0, "error_rate": 0.0, "empty_rate": 0.0, "mean_seconds": None}
+        errors = sum(1 for status, _ in self.window if status in FAILURE_STATUSES)
+        empties = sum(1 for status, _ in self.window if status == "empty")
+        timings = [seconds for _, seconds in self.window if seconds is not None]
+        return {
+            "samples": total,
+            "error_rate": round(errors / total, 3),
+            "empty_rate": round(empties / total, 3),
+            "mean_seconds": round(sum(timings) / len(timings), 2) if timings else None,
+        }
+
+
+class HealthBoard:
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        empty_threshold: int = 8,
+        cooldown: float = 60.0,
+        max_cooldown: float = 900.0,
+        window: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.empty_threshold = empty_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.window = window
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        failure_threshold: Optional[int] = None,
+        empty_threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+        max_cooldown: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            if failure_threshold is not None:
+                self.failure_threshold = failure_threshold
+            if empty_threshold is not None:
+                self.empty_threshold = empty_threshold
+            if cooldown is not None:
+                self.base_cooldown = cooldown
+            if max_cooldown is not None:
+                self.max_cooldown = max_cooldown
+
+    def _breaker(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(self.base_cooldown, self.window)
+        return breaker
+
+    def _open(self, breaker: CircuitBreaker, cooldown: float) -> None:
+        breaker.state = OPEN
+        breaker.opened_at = self._clock()
+        breaker.cooldown = min(cooldown, self.max_cooldown)
+        breaker.trips += 1
+        breaker.failures = breaker.empties = 0
+        breaker.probing = None
+
+    def _claim_probe(self, breaker: CircuitBreaker, prober: str) -> bool:
+        """Mark an open breaker half-open for prober if its probe is due."""
+        now = self._clock()
+        if breaker.state == CLOSED or now - breaker.opened_at < breaker.cooldown:
+            return False
+        if breaker.probing is not None and now - breaker.probe_at < breaker.cooldown:
+            return False
+        breaker.state = HALF_OPEN
+        breaker.probing = prober
+        breaker.probe_at = now
+        return True
+
+    def _settle_probe(
+        self,
+        key: str,
+        breaker: CircuitBreaker,
+        status: str,
+        query: Optional[Tuple[str, str]],
+    ) -> bool:
+        failed = status in FAILURE_STATUSES or (
+            status == "empty" and (query is None or breaker.known_hit(query))
+        )
+        if failed:
+            self._open(breaker, breaker.cooldown * 2)
+            return False
+        breaker.state = CLOSED
+        breaker.probing = None
+        breaker.cooldown = self.base_cooldown
+        breaker.failures = breaker.empties = 0
+        if status == "success" and query is not None:
+            breaker.add_hit(query)
+        print(f"  [info] {key} circuit closed after a successful probe")
+        return True
+
+    # ---- Searches -----------------------------------------------------------
+
+    def allow(self, key: str) -> bool:
+        """
+        True if searches should scrape the platform; False while degraded.
+        Once the cooldown has passed, the first search to ask is let through
+        as the probe and its outcome (see record) settles the breaker.
+        """
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None or breaker.state == CLOSED:
+                return True
+            return self._claim_probe(breaker, SEARCH_PROBE)
+
+    def record(
+        self,
+        key: str,
+        status: str,
+        seconds: Optional[float] = None,
+        query: Optional[Tuple[str, str]] = None,
+    ) -> None:
+        """Feed one platform outcome of a search to its breaker."""
+        with self._lock:
+            breaker = self._breaker(key)
+            breaker.window.append((status, seconds))
+            if breaker.state != CLOSED:
+                if breaker.probing == SEARCH_PROBE:
+                    self._settle_probe(key, breaker, status, query)
+                # otherwise a search that started before the breaker opened
+                return
+            if status in FAILURE_STATUSES:
+                breaker.failures += 1
+                breaker.empties = 0
+            elif status == "empty":
+                # Only an empty answer to a query that found jobs here
+                # before points at the platform rather than the query
+                if breaker.known_hit(query):
+                    breaker.empties += 1
+                    breaker.failures = 0
+            elif status == "success":
+                breaker.failures = breaker.empties = 0
+                if query is not None:
+                    breaker.add_hit(query)
+            if (
+                breaker.failures >= self.failure_threshold
+                or breaker.empties >= self.empty_threshold
+            ):
+                self._open(breaker, self.base_cooldown)
+                print(f"  [warn] {key} circuit opened after repeated failures")
+
+    def record_statuses(
+        self, statuses: List[Dict[str, str]], query: Optional[Tuple[str, str]] = None
+    ) -> None:
+        """Feed every entry of a last_run_statuses list (degraded ones are skipped)."""
+        for entry in statuses:
+            if entry["status"] == "degraded":
+                continue
+            seconds = entry.get("seconds")
+            self.record(
+                entry["key"], entry["status"],
+                float(seconds) if seconds is not None else None, query,
+            )
+
+    # ---- Background probes --------------------------------------------------
+
+    def due_probes(self) -> List[Tuple[str, Tuple[str, str]]]:
+        """
+        Platforms whose cooldown has passed, with the query to probe them
+        with. Each is marked half-open and handed out to one prober only;
+        a platform a search is already probing is not handed out.
+        """
+        due = []
+        with self._lock:
+            for key, breaker in self._breakers.items():
+                if self._claim_probe(breaker, BACKGROUND_PROBE):
+                    due.append((key, breaker.last_query))
+        return due
+
+    def finish_probe(self, key: str, status: str, seconds: Optional[float] = None) -> bool:
+        """Record a background probe's outcome; True if it closed the breaker."""
+        with self._lock:
+            breaker = self._breaker(key)
+            breaker.window.append((status, seconds))
+            if breaker.probing != BACKGROUND_PROBE:
+                # settled by a search probe meanwhile, or given up on
+                return breaker.state == CLOSED
+            return self._settle_probe(key, breaker, status, breaker.last_query)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        now = self._clock()
+        with self._lock:
+            report = {}
+            for key, breaker in self._breakers.items():
+                probe_in = None
+                if breaker.state != CLOSED:
+                    probe_in = round(max(0.0, breaker.opened_at + breaker.cooldown - now), 1)
+                report[key] = {
+                    "state": breaker.state,
+                    "trips": breaker.trips,
+                    "consecutive_failures": breaker.failures,
+                    "consecutive_empty": breaker.empties,
+                    "probe_in": probe_in,
+                    **breaker.rates(),
+                }
+            return report
+
+
+PLATFORM_HEALTH = HealthBoard()
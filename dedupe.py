@@ -0,0 +1,454 @@
+"""
+Job de-duplication
+==================
+The same posting often shows up on several boards with cosmetic
+differences ("Sr. Python Dev" on one, "Senior Python Developer (m/f/d)"
+on another; "Remote" vs "Remote, Worldwide"). Deduper folds those into
+one result:
+
+  - every Job gets a normalised key once, when it is added: title
+    abbreviations expanded and noise such as gender tags dropped, legal
+    suffixes stripped from the company, and the location reduced to its
+    city (or "remote") followed by whatever region or country it names
+  - jobs with equal keys are duplicates
+  - otherwise near-duplicates are found with MinHash / LSH over the title's
+    word unigrams and bigrams, blocked by company, so each job is only
+    compared with the few candidates sharing a band bucket. Only postings
+    from different sources can be near-duplicates (one board does not list
+    an opening twice), and a candidate is one when the seniority words
+    agree, the companies match, the locations are compatible and either
+    the titles have the same words or their Jaccard similarity reaches the
+    threshold and the salaries or descriptions agree as well. Titles that
+    add a word ("Backend Engineer, Payments", "Java Developer 2") are
+    different openings on their own
+  - duplicates are joined with union-find. Two clusters are never joined
+    if that would put two different links from one source, or two places
+    that cannot be the same ("London, UK" and "London, Ontario"), into one
+    cluster, so a vague record cannot bridge distinct openings
+  - every cluster is reported as its richest record (salary, description,
+    date), with empty fields filled in from the other members
+
+Adding a job costs a constant number of hash and set operations, so
+de-duplicating n jobs is roughly linear in n.
+"""
+
+import re
+import zlib
+from typing import (
+    TYPE_CHECKING, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple,
+)
+
+from text_normalize import normalize_text
+
+if TYPE_CHECKING:  # job_automation imports this module
+    from job_automation import Job
+
+ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "mgr": "manager", "mngr": "manager", "eng": "engineer", "engr": "engineer",
+    "dev": "developer", "devs": "developers", "swe": "software engineer",
+    "sde": "software development engineer", "assoc": "associate",
+    "asst": "assistant", "admin": "administrator", "dir": "director",
+    "vp": "vice president", "intl": "international", "ml": "machine learning",
+    "internship": "intern",
+}
+
+# Adjacent title words written both split and joined ("front end" / "frontend")
+_COMPOUNDS = {
+    ("front", "end"): "frontend", ("back", "end"): "backend",
+    ("full", "stack"): "fullstack", ("dev", "ops"): "devops",
+}
+
+# Seniority words: titles that differ in these are different openings
+_LEVEL_WORDS = {
+    "intern", "trainee", "junior", "associate", "mid", "senior", "staff",
+    "lead", "principal", "head", "chief", "i", "ii", "iii", "iv",
+}
+
+# Work-mode words that boards append to titles and that say nothing about the role
+_TITLE_NOISE = {"remote", "hybrid", "onsite", "wfh", "fully", "the", "a", "an"}
+
+_COMPANY_SUFFIXES = {
+    "inc", "llc", "ltd", "limited", "gmbh", "corp", "corporation", "co",
+    "plc", "pvt", "private", "ag", "sa", "srl", "bv", "the", "company",
+}
+
+_REMOTE_WORDS = {"remote", "worldwide", "anywhere", "global", "wfh"}
+
+# Location words that qualify a place without naming one ("Remote (US only)")
+_PLACE_NOISE = {"only", "based", "area", "greater", "metro", "hybrid", "onsite", "fully"}
+
+_PLACE_ALIASES = {
+    "united kingdom": "uk", "great britain": "uk", "gb": "uk",
+    "united states": "us", "united states of america": "us", "usa": "us",
+    "deutschland": "germany", "the netherlands": "netherlands",
+}
+
+# Regions that imply a country, so "Toronto, ON" and "Toronto, Canada" agree
+_REGION_COUNTRY = {
+    **{
+        code: "us" for code in (
+            "al ak az ar ca co ct dc de fl ga hi id il in ia ks ky la me md ma mi"
+            " mn ms mo mt ne nv nh nj nm ny nc nd oh ok or pa ri sc sd tn tx ut vt"
+            " va wa wv wi wy"
+        ).split()
+    },
+    **{
+        region: "canada" for region in (
+            "ab", "bc", "mb", "nb", "nl", "ns", "on", "pe", "qc", "sk",
+            "alberta", "british columbia", "manitoba", "new brunswick",
+            "nova scotia", "ontario", "quebec", "saskatchewan",
+        )
+    },
+    "england": "uk", "scotland": "uk", "wales": "uk", "northern ireland": "uk",
+}
+
+_PLACE_SPLIT_RE = re.compile(r"[,/;|()]| - ")
+
+# "(m/f/d)", "m/w/d", "(f/m/x)" ...
+_GENDER_TAG_RE = re.compile(r"\(?\b[mfwdx](?:\s*/\s*[mfwdx]){1,3}\b\)?")
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+_NO_SALARY = {"", "not specified", "n/a", "na", "-", "0 - 0"}
+
+_MERSENNE = (1 << 61) - 1
+
+
+class JobKey(NamedTuple):
+    title: str
+    company: str
+    location: str
+
+
+def _words(value: str) -> List[str]:
+    return _WORD_RE.findall(normalize_text(value).lower())
+
+
+def normalize_title(value: str) -> List[str]:
+    text = _GENDER_TAG_RE.sub(" ", normalize_text(value).lower())
+    joined: List[str] = []
+    for word in _WORD_RE.findall(text):
+        if joined and (joined[-1], word) in _COMPOUNDS:
+            joined[-1] = _COMPOUNDS[(joined[-1], word)]
+        else:
+            joined.append(word)
+    words: List[str] = []
+    for word in joined:
+        words.extend(ABBREVIATIONS.get(word, word).split())
+    return [w for w in words if w not in _TITLE_NOISE]
+
+
+def normalize_company(value: str) -> List[str]:
+    return [w for w in _words(value) if w not in _COMPANY_SUFFIXES]
+
+
+def normalize_location(value: str) -> str:
+    """
+    "city, region, country" with what the location names of each, or
+    "remote[, region]" for remote postings: "London, UK" -> "london, uk",
+    "Remote (US only)" -> "remote, us", "Remote, Worldwide" -> "remote".
+    """
+    text = normalize_text(value).lower()
+    remote = bool(set(_WORD_RE.findall(text)) & _REMOTE_WORDS)
+    parts = ["remote"] if remote else []
+    for part in _PLACE_SPLIT_RE.split(text):
+        words = [
+            w for w in _WORD_RE.findall(part)
+            if w not in _PLACE_NOISE and not (remote and w in _REMOTE_WORDS)
+        ]
+        if words:
+            name = " ".join(words)
+            name = _PLACE_ALIASES.get(name, name)
+            if name not in parts:
+                parts.append(name)
+    return ", ".join(parts)
+
+
+Place = Tuple[str, FrozenSet[str]]
+
+
+def parse_place(location: str) -> Place:
+    """(city, regions) of a normalised location, regions with their countries."""
+    if not location:
+        return ("", frozenset())
+    city, *regions = location.split(", ")
+    expanded = set(regions)
+    expanded.update(_REGION_COUNTRY[r] for r in regions if r in _REGION_COUNTRY)
+    return (city, frozenset(expanded))
+
+
+def _places_compatible(a: Place, b: Place) -> bool:
+    """
+    Whether two places can be the same: an unknown place matches anything,
+    otherwise the cities agree and one names no region the other lacks.
+    """
+    if not a[0] or not b[0]:
+        return True
+    return a[0] == b[0] and (a[1] <= b[1] or b[1] <= a[1])
+
+
+def _more_specific(a: Place, b: Place) -> Place:
+    if not a[0]:
+        return b
+    if not b[0]:
+        return a
+    return a if len(a[1]) >= len(b[1]) else b
+
+
+def job_key(job: "Job") -> JobKey:
+    """Normalised (title, company, location) identifying a posting."""
+    return JobKey(
+        " ".join(normalize_title(job.title)),
+        " ".join(normalize_company(job.company)),
+        normalize_location(job.location),
+    )
+
+
+def richness(job: "Job") -> Tuple[int, int, int]:
+    """Sort key preferring records with a salary, then description, then date."""
+    has_salary = (job.salary or "").strip().lower() not in _NO_SALARY
+    return (int(has_salary), len(job.description or ""), int(bool(job.posted_date)))
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class _LCG:
+    """Deterministic permutation parameters independent of PYTHONHASHSEED."""
+
+    def __init__(self, seed: int) -> None:
+        self.state = seed
+
+    def next(self) -> int:
+        self.state = (self.state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        return (self.state >> 3) % _MERSENNE
+
+
+def _salary(job: "Job") -> str:
+    salary = " ".join(_words(job.salary or ""))
+    return "" if salary in _NO_SALARY else salary
+
+
+def _description_head(job: "Job") -> str:
+    return " ".join(_words(job.description or "")[:40])
+
+
+class _Entry:
+    __slots__ = ("job", "key", "shingles", "levels", "company_words", "place")
+
+    def __init__(self, job: "Job", key: JobKey, shingles: Set[str], place: Place) -> None:
+        self.job = job
+        self.key = key
+        self.shingles = shingles
+        self.levels = shingles & _LEVEL_WORDS
+        self.company_words = set(key.company.split())
+        self.place = place
+
+
+class _Cluster:
+    """What a cluster's members pin down: one link per source, one place."""
+
+    __slots__ = ("links", "place")
+
+    def __init__(self, entry: _Entry) -> None:
+        link = (entry.job.link or "").strip()
+        self.links: Dict[str, str] = {entry.job.source: link} if link else {}
+        self.place = entry.place
+
+    def compatible(self, other: "_Cluster") -> bool:
+        for source, link in other.links.items():
+            if self.links.get(source, link) != link:
+                return False
+        return _places_compatible(self.place, other.place)
+
+    def absorb(self, other: "_Cluster") -> None:
+        for source, link in other.links.items():
+            self.links.setdefault(source, link)
+        self.place = _more_specific(self.place, other.place)
+
+
+class Deduper:
+    """
+    Incremental near-duplicate clustering. add() reports whether a job
+    starts a new cluster; results() returns one merged Job per cluster in
+    order of first appearance.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        bands: int = 12,
+        rows: int = 2,
+        max_bucket: int = 64,
+    ) -> None:
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.max_bucket = max_bucket
+        self._entries: List[_Entry] = []
+        self._parent: List[int] = []
+        self._clusters: List[Optional[_Cluster]] = []
+        self._exact: Dict[JobKey, int] = {}
+        self._buckets: Dict[Tuple[int, str, Tuple[int, ...]], List[int]] = {}
+        self._hashes: Dict[str, Tuple[int, ...]] = {}
+        self._places: Dict[str, Place] = {}
+        rng = _LCG(0x5EED)
+        self._perms = [
+            (rng.next() | 1, rng.next()) for _ in range(bands * rows)
+        ]
+
+    # ---- Union-find -------------------------------------------------------
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(self, a: int, b: int) -> bool:
+        """Join the clusters of a and b; False if their members conflict."""
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return True
+        if not self._clusters[ra].compatible(self._clusters[rb]):
+            return False
+        # The earlier entry stays the root, which keeps first-seen order
+        if rb < ra:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        self._clusters[ra].absorb(self._clusters[rb])
+        self._clusters[rb] = None
+        return True
+
+    # ---- MinHash ------------------------------------------------------------
+
+    def _shingle_hashes(self, shingle: str) -> Tuple[int, ...]:
+        hashes = self._hashes.get(shingle)
+        if hashes is None:
+            h = zlib.crc32(shingle.encode("utf-8"))
+            hashes = self._hashes[shingle] = tuple(
+                (a * h + b) % _MERSENNE for a, b in self._perms
+            )
+        return hashes
+
+    def _signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        if not shingles:
+            return (0,) * len(self._perms)
+        return tuple(map(min, zip(*(self._shingle_hashes(s) for s in shingles))))
+
+    # ---- Public API ---------------------------------------------------------
+
+    def add(self, job: "Job") -> bool:
+        """
+        Add a job; True if it is not a duplicate of one added before.
+        Jobs without a title or company are ignored (and return False).
+        """
+        key = job_key(job)
+        if not key.title or not key.company:
+            return False
+
+        index = len(self._entries)
+        title_words = key.title.split()
+        shingles = set(title_words)
+        shingles.update(
+            f"{a} {b}" for a, b in zip(title_words, title_words[1:])
+        )
+        place = self._places.get(key.location)
+        if place is None:
+            place = self._places[key.location] = parse_place(key.location)
+        entry = _Entry(job, key, shingles, place)
+        self._entries.append(entry)
+        self._parent.append(index)
+        self._clusters.append(_Cluster(entry))
+
+        match = self._exact.get(key)
+        if match is not None and self._union(match, index):
+            return False
+        self._exact.setdefault(key, index)
+
+        is_new = True
+        block = key.company.split()[0]
+        signature = self._signature(shingles)
+        for band in range(self.bands):
+            bucket_key = (
+                band, block, signature[band * self.rows:(band + 1) * self.rows]
+            )
+            bucket = self._buckets.setdefault(bucket_key, [])
+            for other in bucket:
+                if self._find(other) == self._find(index):
+                    continue
+                if self._similar(self._entries[other], entry) and self._union(other, index):
+                    is_new = False
+            if len(bucket) < self.max_bucket:
+                bucket.append(index)
+        return is_new
+
+    def _similar(self, a: _Entry, b: _Entry) -> bool:
+        if a.job.source == b.job.source:
+            return False
+        if a.levels != b.levels:
+            return False
+        if not _places_compatible(a.place, b.place):
+            return False
+        if a.key.company != b.key.company and _jaccard(
+            a.company_words, b.company_words
+        ) < 0.5:
+            return False
+        if set(a.key.title.split()) == set(b.key.title.split()):
+            return True
+        if _jaccard(a.shingles, b.shingles) < self.threshold:
+            return False
+        # Similar but not the same words: only with a second field agreeing
+        salary = _salary(a.job)
+        if salary and salary == _salary(b.job):
+            return True
+        head = _description_head(a.job)
+        return bool(head) and head == _description_head(b.job)
+
+    def clusters(self) -> List[List["Job"]]:
+        """Clusters of duplicate jobs, in order of their first member."""
+        groups: Dict[int, List["Job"]] = {}
+        for i, entry in enumerate(self._entries):
+            groups.setdefault(self._find(i), []).append(entry.job)
+        return [groups[root] for root in sorted(groups)]
+
+    def results(self) -> List["Job"]:
+        return [merge_cluster(group) for group in self.clusters()]
+
+
+def merge_cluster(jobs: List["Job"]) -> "Job":
+    """The richest job of a cluster, with empty fields filled from the others."""
+    if len(jobs) == 1:
+        return jobs[0]
+    best = max(jobs, key=richness)
+    fills: Dict[str, str] = {}
+    for field_name in ("salary", "description", "posted_date", "link"):
+        current = getattr(best, field_name) or ""
+        if field_name == "salary" and current.strip().lower() in _NO_SALARY:
+            current = ""
+        if current:
+            continue
+        for other in jobs:
+            value = getattr(other, field_name) or ""
+            if field_name == "salary" and value.strip().lower() in _NO_SALARY:
+                continue
+            if value:
+                fills[field_name] = value
+                if field_name == "posted_date" and best.posted_ts is None:
+                    fills["posted_ts"] = other.posted_ts
+                break
+    return best.replace(**fills) if fills else best
+
+
+def dedupe_jobs(
+    jobs: List["Job"], deduper: Optional[Deduper] = None
+) -> List["Job"]:
+    """Merge duplicate and near-duplicate jobs, keeping first-seen order."""
+    deduper = deduper or Deduper()
+    for job in jobs:
+        deduper.add(job)
+    return deduper.results()
@@ -0,0 +1,225 @@
+"""
+Shared TTL cache
+================
+A small process-wide, thread-safe cache with:
+
+  - a freshness TTL, after which an entry is "stale"
+  - a stale window during which the stale value is still served while a
+    single background refresh replaces it (stale-while-revalidate)
+  - LRU eviction bounded by entry count and by approximate byte size
+  - single-flight loads: concurrent misses (and a background refresh) for
+    the same key share one loader call
+
+FEED_CACHE holds the parsed full feeds of the query-independent JSON APIs
+(RemoteOK, Arbeitnow, The Muse pages), so every search inside the TTL
+filters the same in-memory copy instead of downloading it again. Feeds are
+wrapped in Feed so that derived structures (such as the token index built
+by the scrapers) are computed once per ingested copy and evicted with it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from singleflight import SingleFlight
+
+# A loader returns (value, size_in_bytes), or None when the fetch failed.
+Loader = Callable[[], Optional[Tuple[Any, int]]]
+
+
+class Feed:
+    """A parsed feed payload plus structures derived from it on demand."""
+
+    __slots__ = ("data", "_derived", "_lock")
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+        self._derived: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def memo(self, name: str, builder: Callable[[], Any]) -> Any:
+        """Build a derived value once; concurrent callers wait for it."""
+        with self._lock:
+            if name not in self._derived:
+                self._derived[name] = builder()
+            return self._derived[name]
+
+
+class CacheEntry:
+    __slots__ = ("value", "size", "stored_at")
+
+    def __init__(self, value: Any, size: int) -> None:
+        self.value = value
+        self.size = size
+        self.stored_at = time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
+class TTLCache:
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        stale_ttl: float = 900.0,
+        max_entries: int = 64,
+        max_bytes: int = 64 * 1024 * 1024,
+        name: str = "cache",
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.name = name
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._refreshing: set = set()
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+
+    def configure(
+        self,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+            if stale_ttl is not None:
+                self.stale_ttl = stale_ttl
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    # ---- Primitives ---------------------------------------------------------
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[CacheEntry], str]:
+        """Return (entry, state) where state is "fresh", "stale" or "miss"."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = entry.age()
+                if age <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry, "fresh"
+                if age <= self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["stale"] += 1
+                    return entry, "stale"
+                self._drop(key)
+            self._stats["misses"] += 1
+            return None, "miss"
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """Age of the entry for key in seconds, without counting a lookup."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.age() if entry is not None else None
+
+    def put(self, key: Hashable, value: Any, size: int = 0) -> CacheEntry:
+        entry = CacheEntry(value, size)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size <= self.max_bytes:
+                self._entries[key] = entry
+                self._bytes += size
+                self._evict()
+        return entry
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def begin_refresh(self, key: Hashable) -> bool:
+        """Claim the background refresh of key; False if one is running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                **self._stats,
+            }
+
+    # ---- Read-through access -----------------------------------------------
+
+    def get_or_load(self, key: Hashable, loader: Loader) -> Any:
+        """
+        Return the cached value for key, loading it on a miss. A stale value
+        is returned immediately while loader runs once in a background
+        thread. Returns None when there is no value and the load failed.
+        """
+        entry, state = self.lookup(key)
+        if state == "fresh":
+            return entry.value
+        if state == "stale":
+            if self.begin_refresh(key):
+                threading.Thread(
+                    target=self._refresh,
+                    args=(key, loader),
+                    daemon=True,
+                    name=f"{self.name}-refresh",
+                ).start()
+            return entry.value
+        return self.load(key, loader)
+
+    def load(self, key: Hashable, loader: Loader) -> Any:
+        value, _shared = self._flights.do(key, lambda: self._load(key, loader))
+        return value
+
+    def _load(self, key: Hashable, loader: Loader) -> Any:
+        loaded = loader()
+        if loaded is None:
+            return None
+        value, size = loaded
+        self.put(key, value, size)
+        return value
+
+    def _refresh(self, key: Hashable, loader: Loader) -> None:
+        try:
+            self.load(key, loader)
+        except Exception as exc:
+            print(f"  [warn] {self.name} refresh failed for {key!r}: {exc}")
+        finally:
+            self.end_refresh(key)
+
+    # ---- Internals (call with the lock held) -------------------------------
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._drop(key)
+            self._stats["evictions"] += 1
+
+
+FEED_CACHE = TTLCache(name="feed-cache")
@@ -0,0 +1,179 @@
+"""
+Feed token index
+================
+Posting lists over the normalised title and location strings of an
+in-memory feed, built once when the feed is ingested.
+
+The scrapers' matching rules are substring checks ("dev" matches
+"developer"), so the index is keyed on character trigrams rather than
+whole words: a needle's candidates are the intersection of its trigrams'
+posting lists, verified with a plain substring test on the pre-normalised
+string. Needles shorter than a trigram fall back to that substring test
+over every entry, which is still far cheaper than re-cleaning HTML.
+
+Results are positions in the original feed, returned in feed order, so a
+query over the index yields exactly what the linear scan would have.
+
+FeedDeltas carries the cleaned rows of one copy of a feed over to the next:
+items whose identity (id plus timestamp) was already seen are reused and
+only the new ones are cleaned, and a per-feed watermark records the newest
+timestamp ingested so far.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+_GRAM = 3
+
+REMOTE_ALIASES = {"remote", "any", "worldwide"}
+
+
+def query_tokens(query: str) -> List[str]:
+    """The first 3 meaningful tokens of a search query, lower-cased."""
+    return [t for t in re.split(r"\W+", query.lower()) if t][:3]
+
+
+class _Postings:
+    def __init__(self, keys: List[str]) -> None:
+        self.keys = keys
+        self.grams: Dict[str, List[int]] = {}
+        # Locations (and many titles) repeat across a feed; split each
+        # distinct key into trigrams once
+        split: Dict[str, Set[str]] = {}
+        for pos, key in enumerate(keys):
+            grams = split.get(key)
+            if grams is None:
+                grams = split[key] = {
+                    key[i:i + _GRAM] for i in range(len(key) - _GRAM + 1)
+                }
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(pos)
+
+    def containing(self, needle: str) -> Set[int]:
+        """Positions whose key contains needle as a substring."""
+        if len(needle) < _GRAM:
+            return {pos for pos, key in enumerate(self.keys) if needle in key}
+        lists = []
+        for i in range(len(needle) - _GRAM + 1):
+            postings = self.grams.get(needle[i:i + _GRAM])
+            if postings is None:
+                return set()
+            lists.append(postings)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for postings in lists[1:]:
+            candidates.intersection_update(postings)
+            if not candidates:
+                return candidates
+        return {pos for pos in candidates if needle in self.keys[pos]}
+
+
+class FeedIndex:
+    """
+    entries  - per-item payload the scraper wants back (e.g. the cleaned
+               fields and the raw item)
+    titles   - normalised (cleaned, lower-cased) title per entry
+    locations - normalised location per entry
+    """
+
+    def __init__(
+        self,
+        entries: List[Any],
+        titles: List[str],
+        locations: List[str],
+    ) -> None:
+        self.entries = entries
+        self._titles = _Postings(titles)
+        self._locations = _Postings(locations)
+        self._remote = self._locations.containing("remote")
+        self._worldwide = self._locations.containing("worldwide")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def title_matches(self, query: str) -> Optional[Set[int]]:
+        """Entries containing the first 3 query tokens; None means all."""
+        tokens = query_tokens(query)
+        if not tokens:
+            return None
+        matches: Optional[Set[int]] = None
+        for token in sorted(set(tokens), key=len, reverse=True):
+            found = self._titles.containing(token)
+            matches = found if matches is None else matches & found
+            if not matches:
+                break
+        return matches
+
+    def location_matches(self, requested: str) -> Optional[Set[int]]:
+        """Same rules as JobScraper._location_match; requested is normalised."""
+        if not requested:
+            return None
+        if requested in REMOTE_ALIASES:
+            return self._remote | self._worldwide
+        return self._locations.containing(requested) | self._remote
+
+    def select(self, *matches: Optional[Set[int]]) -> Iterable[Any]:
+        """Entries in all the given match sets (None = no constraint), in feed order."""
+        constraints = [m for m in matches if m is not None]
+        if not constraints:
+            return iter(self.entries)
+        positions = set.intersection(*constraints)
+        return (self.entries[pos] for pos in sorted(positions))
+
+
+# (entry, normalised title, normalised location)
+IndexRow = Tuple[Any, str, str]
+
+
+class FeedDeltas:
+    def __init__(self) -> None:
+        self._rows: Dict[str, Dict[Hashable, IndexRow]] = {}
+        self._watermarks: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def previous(self, name: str) -> Dict[Hashable, IndexRow]:
+        """Rows of the last ingested copy of feed name, by item identity."""
+        with self._lock:
+            return self._rows.get(name, {})
+
+    def watermark(self, name: str) -> Any:
+        with self._lock:
+            return self._watermarks.get(name)
+
+    def commit(
+        self,
+        name: str,
+        rows: Dict[Hashable, IndexRow],
+        newest: Any,
+        reused: int,
+        cleaned: int,
+        new_items: int,
+    ) -> None:
+        """Replace the carried rows of feed name with those of its newest copy."""
+        with self._lock:
+            self._rows[name] = rows
+            if newest is not None:
+                self._watermarks[name] = newest
+            stats = self._stats.setdefault(
+                name, {"ingests": 0, "reused": 0, "cleaned": 0, "new_items": 0}
+            )
+            stats["ingests"] += 1
+            stats["reused"] += reused
+            stats["cleaned"] += cleaned
+            stats["new_items"] += new_items
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                name: {
+                    **counts,
+                    "items": len(self._rows.get(name, {})),
+                    "watermark": self._watermarks.get(name),
+                }
+                for name, counts in self._stats.items()
+            }
+
+
+FEED_DELTAS = FeedDeltas()
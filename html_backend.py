@@ -0,0 +1,52 @@
+"""
+HTML parsing backend
+====================
+One place to choose how result pages are parsed.
+
+  - HTML_PARSER is the fastest BeautifulSoup tree builder installed:
+    "lxml" when the lxml package is available, otherwise the pure-Python
+    "html.parser". Set HTML_PARSER in the environment to force one.
+  - compile_selectors() turns CSS selector strings into soupsieve patterns
+    once, so scrapers do not re-parse selector strings for every card.
+"""
+
+import os
+from typing import List, Optional, Sequence, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup, FeatureNotFound
+
+SelectorList = Tuple[soupsieve.SoupSieve, ...]
+
+_PREFERRED_PARSERS = ("lxml", "html.parser")
+
+
+def available_parsers() -> List[str]:
+    """Tree builders usable in this environment, fastest first."""
+    found = []
+    for name in _PREFERRED_PARSERS:
+        try:
+            BeautifulSoup("", name)
+        except FeatureNotFound:
+            continue
+        found.append(name)
+    return found
+
+
+def _default_parser() -> str:
+    forced = os.environ.get("HTML_PARSER", "").strip()
+    installed = available_parsers()
+    if forced in installed:
+        return forced
+    return installed[0]
+
+
+HTML_PARSER: str = _default_parser()
+
+
+def make_soup(markup: str, parser: Optional[str] = None) -> BeautifulSoup:
+    return BeautifulSoup(markup, parser or HTML_PARSER)
+
+
+def compile_selectors(selectors: Sequence[str]) -> SelectorList:
+    return tuple(soupsieve.compile(sel) for sel in selectors)
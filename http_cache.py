@@ -0,0 +1,267 @@
+"""
+On-disk HTTP response cache
+===========================
+Raw upstream responses kept on disk, one gzip file per request, keyed by
+method, URL and query parameters. Each file holds a JSON header line
+(status, response headers, fetch time, the request it answers) followed
+by the body exactly as it was received.
+
+Modes (HTTP_CACHE):
+
+  off      the default: nothing is read or written
+  live     requests go upstream as usual; successful responses are kept,
+           and when an upstream fails (no answer, 429 or 5xx after the
+           request policy's retries) the last good copy is served instead
+  record   like live, but every response is kept, errors included, and
+           nothing is served from disk: a slow or broken search can be
+           captured exactly as it happened
+  replay   never touches the network: every request is answered from disk
+           (a miss is a failed request), so a whole search runs offline at
+           disk speed, for reproducing a recorded run or for benchmarks
+
+Files live in HTTP_CACHE_DIR ("http_cache" by default). The directory is
+bounded by HTTP_CACHE_MAX_MB: when a write takes it over, the least recently
+used files are removed (reads refresh a file's mtime, so the order survives
+restarts).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+MODES = ("off", "live", "record", "replay")
+
+# Describe the body as it was on the wire, not as it is stored
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+    encoding: Optional[str]
+    fetched_at: float
+    url: str
+
+
+class HttpCache:
+    def __init__(
+        self,
+        path: str = "http_cache",
+        mode: str = "off",
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.path = path
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> (size on disk, last used); loaded from the directory lazily
+        self._files: Optional[Dict[str, Tuple[int, float]]] = None
+        self._bytes = 0
+        self._stats = {
+            "hits": 0, "misses": 0, "stored": 0, "fallbacks": 0, "evictions": 0,
+        }
+
+    def configure(
+        self,
+        path: Optional[str] = None,
+        mode: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            if mode is not None:
+                if mode not in MODES:
+                    print(f"  [warn] unknown HTTP cache mode {mode!r}, using 'off'")
+                    mode = "off"
+                self.mode = mode
+            if path is not None and path != self.path:
+                self.path = path
+                self._files = None
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+                if self._files is not None:
+                    self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def stores(self, status: int) -> bool:
+        """Whether a response with this status is written in the current mode."""
+        if self.mode == "record":
+            # A 304 has no body of its own; the copy it refers to is kept
+            return status != 304
+        return self.mode == "live" and 200 <= status < 300
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        query = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        request = [method.upper(), url, query]
+        return hashlib.sha1(json.dumps(request).encode("utf-8")).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.gz")
+
+    # ---- Index --------------------------------------------------------------
+
+    def _index(self) -> Dict[str, Tuple[int, float]]:
+        """The files on disk; caller holds the lock."""
+        if self._files is None:
+            self._files, self._bytes = {}, 0
+            try:
+                entries = list(os.scandir(self.path))
+            except OSError:
+                entries = []
+            for entry in entries:
+                if not entry.name.endswith(".gz"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                self._files[entry.name[:-3]] = (stat.st_size, stat.st_mtime)
+                self._bytes += stat.st_size
+        return self._files
+
+    def _forget(self, key: str) -> None:
+        size, _ = self._files.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        files = self._index()
+        if self._bytes <= self.max_bytes:
+            return
+        for key, _ in sorted(files.items(), key=lambda item: item[1][1]):
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(self._file(key))
+            except OSError:
+                pass
+            self._forget(key)
+            self._stats["evictions"] += 1
+
+    # ---- Reading and writing ------------------------------------------------
+
+    def get(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]] = None
+    ) -> Optional[CachedResponse]:
+        key = self.key(method, url, params)
+        with self._lock:
+            files = self._index()
+            if key not in files:
+                self._stats["misses"] += 1
+                return None
+        path = self._file(key)
+        try:
+            with open(path, "rb") as fh:
+                meta_line, _, body = gzip.decompress(fh.read()).partition(b"\n")
+            meta = json.loads(meta_line)
+            os.utime(path)
+        except (OSError, EOFError, ValueError) as exc:
+            print(f"  [warn] unreadable HTTP cache entry {path!r}: {exc}")
+            with self._lock:
+                if key in self._files:
+                    self._forget(key)
+                self._stats["misses"] += 1
+            return None
+        with self._lock:
+            if key in self._files:
+                self._files[key] = (self._files[key][0], time.time())
+            self._stats["hits"] += 1
+        return CachedResponse(
+            meta["status"], meta["headers"], body, meta.get("encoding"),
+            meta["fetched_at"], meta["url"],
+        )
+
+    def put(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        encoding: Optional[str] = None,
+    ) -> None:
+        key = self.key(method, url, params)
+        meta = {
+            "method": method.upper(),
+            "url": url,
+            "params": {str(k): str(v) for k, v in (params or {}).items()},
+            "status": status,
+            "headers": {
+                k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS
+            },
+            "encoding": encoding,
+            "fetched_at": time.time(),
+        }
+        blob = gzip.compress(json.dumps(meta).encode("utf-8") + b"\n" + body)
+        path = self._file(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(blob)
+            os.replace(tmp, path)
+        except OSError as exc:
+            print(f"  [warn] could not write HTTP cache entry {path!r}: {exc}")
+            return
+        with self._lock:
+            files = self._index()
+            if key in files:
+                self._forget(key)
+            files[key] = (len(blob), time.time())
+            self._bytes += len(blob)
+            self._stats["stored"] += 1
+            self._evict()
+
+    def fallback(self) -> None:
+        """Count a stale copy served in place of a failed upstream."""
+        with self._lock:
+            self._stats["fallbacks"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._index()):
+                try:
+                    os.remove(self._file(key))
+                except OSError:
+                    pass
+                self._forget(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            files = self._index() if self.enabled else {}
+            return {
+                "mode": self.mode,
+                "path": self.path,
+                "entries": len(files),
+                "bytes": self._bytes if self.enabled else 0,
+                "max_bytes": self.max_bytes,
+                **self._stats,
+            }
+
+
+def _from_env() -> Dict[str, Any]:
+    settings: Dict[str, Any] = {
+        "path": os.environ.get("HTTP_CACHE_DIR", "http_cache").strip() or "http_cache",
+        "mode": os.environ.get("HTTP_CACHE", "off").strip().lower() or "off",
+    }
+    try:
+        settings["max_bytes"] = max(1, int(os.environ["HTTP_CACHE_MAX_MB"])) * 1024 * 1024
+    except (KeyError, ValueError):
+        pass
+    return settings
+
+
+HTTP_CACHE = HttpCache()
+HTTP_CACHE.configure(**_from_env())
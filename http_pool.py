@@ -0,0 +1,113 @@
+"""
+Shared HTTP connection pool
+===========================
+One requests.Session for the whole process, so every search and every
+search worker reuses the same keep-alive connections to the upstream hosts
+instead of opening (and TLS-handshaking) new ones per JobScraper.
+
+  - per-host pools of up to pool_maxsize idle connections (urllib3
+    HTTPAdapter), for up to pool_connections hosts
+  - the session is never mutated after configure(): browser headers are set
+    once and per-request headers (the rotating User-Agent, Referer, ...)
+    are passed with each call. Its own cookie jar refuses every cookie, so
+    one search's (or one user's) upstream cookies never reach another;
+    each JobScraper keeps its own jar and passes it with every request, so
+    cookies set on a redirect hop or an earlier page still reach the next
+    one. Concurrent searches can share it safely
+  - stats() reports, per host, how many requests went out and how many new
+    connections they needed; the difference is the handshakes saved
+"""
+
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BROWSER_HEADERS: Dict[str, str] = {
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;"
+        "q=0.9,image/webp,*/*;q=0.8"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+
+class HttpPool:
+    def __init__(self, pool_connections: int = 16, pool_maxsize: int = 8) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+
+    def _build(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(BROWSER_HEADERS)
+        # No allowed domains: Set-Cookie answers are never stored here
+        # (callers pass their own jar per request)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build()
+                session = self._session
+        return session
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+    ) -> None:
+        """Change the pool sizes; takes effect for the next session built."""
+        with self._lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def stats(self) -> Dict[str, Any]:
+        hosts: Dict[str, Dict[str, int]] = {}
+        session = self._session
+        if session is not None:
+            adapter = session.get_adapter("https://")
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts[f"{key.key_scheme}://{key.key_host}"] = {
+                    "requests": pool.num_requests,
+                    "connections_opened": pool.num_connections,
+                    "reused": max(0, pool.num_requests - pool.num_connections),
+                    "idle": pool.pool.qsize() if pool.pool is not None else 0,
+                }
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "hosts": hosts,
+        }
+
+
+HTTP_POOL = HttpPool()
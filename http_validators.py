@@ -0,0 +1,130 @@
+"""
+Conditional GET support
+=======================
+Remembers the ETag / Last-Modified validators of JSON API responses per
+(URL, params) together with the payload parsed from them. The next request
+for the same resource sends If-None-Match / If-Modified-Since, and a
+304 Not Modified answer reuses the remembered payload: nothing is
+downloaded or parsed again, and for feeds the Feed object (with the index
+already built on it) is reused as is.
+
+Only responses that carry a validator are remembered. The cache is bounded
+by entry count and by the payloads' byte size (the same size FEED_CACHE
+charges for a feed), so payloads it keeps after FEED_CACHE has evicted
+them stay within a budget of their own; entries are evicted least recently
+used first, and a payload larger than the whole budget is not kept.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+
+class _Validated:
+    __slots__ = ("etag", "last_modified", "payload", "size")
+
+    def __init__(
+        self, etag: str, last_modified: str, payload: Any, size: int
+    ) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.payload = payload
+        self.size = size
+
+
+class ValidatorCache:
+    def __init__(
+        self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Validated]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "conditional": 0, "not_modified": 0, "bytes_saved": 0, "evictions": 0,
+        }
+
+    def configure(
+        self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def _drop(self, key: Hashable) -> None:
+        # Call with the lock held
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        # Call with the lock held
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats["evictions"] += 1
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None) -> Tuple[str, tuple]:
+        return url, tuple(sorted((params or {}).items()))
+
+    def conditional_headers(self, key: Hashable) -> Dict[str, str]:
+        """Request headers that make the next GET of key conditional."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            self._stats["conditional"] += 1
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def remember(
+        self, key: Hashable, headers: Mapping[str, str], payload: Any, size: int
+    ) -> None:
+        etag = headers.get("ETag") or ""
+        last_modified = headers.get("Last-Modified") or ""
+        with self._lock:
+            self._drop(key)
+            if not (etag or last_modified) or size > self.max_bytes:
+                return
+            self._entries[key] = _Validated(etag, last_modified, payload, size)
+            self._bytes += size
+            self._evict()
+
+    def reuse(self, key: Hashable) -> Optional[Tuple[Any, int]]:
+        """The payload remembered for key after a 304, or None if evicted."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self._stats["not_modified"] += 1
+            self._stats["bytes_saved"] += entry.size
+            return entry.payload, entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                **self._stats,
+            }
+
+
+HTTP_VALIDATORS = ValidatorCache()
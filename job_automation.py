@@ -24,32 +24,255 @@ Platforms intentionally NOT included:
 import csv
 import json
 import random
-import re
+import sys
 import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from datetime import datetime
-from html import unescape
-from typing import Callable, Dict, List, Optional
+from typing import (
+    Any, Callable, Dict, Generator, Hashable, Iterable, Iterator, List,
+    Optional, Tuple, Union,
+)
 from urllib.parse import quote, urlencode
 
 import requests
-from bs4 import BeautifulSoup
+from requests.structures import CaseInsensitiveDict
+
+from circuit_breaker import PLATFORM_HEALTH, HealthBoard
+from dedupe import Deduper, dedupe_jobs
+from feed_cache import FEED_CACHE, Feed, TTLCache
+from feed_index import (
+    FEED_DELTAS, REMOTE_ALIASES, FeedDeltas, FeedIndex, IndexRow, query_tokens,
+)
+from html_backend import HTML_PARSER, SelectorList, compile_selectors, make_soup
+from http_cache import HTTP_CACHE, CachedResponse, HttpCache
+from http_pool import HTTP_POOL, HttpPool
+from http_validators import HTTP_VALIDATORS, ValidatorCache
+from json_stream import ArrayItemParser
+from posted_dates import RecencyIndex, parse_posted
+from rate_limit import RATE_LIMITER, RateLimiter
+from request_policy import (
+    REQUEST_POLICY, RETRY_STATUSES, RequestPolicy, search_deadline,
+)
+from selector_memory import SELECTOR_MEMORY, FieldKey, SelectorMemory
+from singleflight import SingleFlight
+from text_normalize import normalize_text
 
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass
 class Job:
-    title: str
-    company: str
-    location: str
-    link: str
-    source: str
-    posted_date: str = ""
-    salary: str = ""
-    description: str = ""
+    """
+    One job posting. Slotted, with the values that repeat across postings
+    (source, company, location, salary, posted date) interned so every
+    copy shares one string, and long descriptions — which the UI never
+    shows — held zlib-compressed and only decompressed when read.
+    """
+
+    __slots__ = (
+        "title", "company", "location", "link", "source", "posted_date",
+        "salary", "_description", "posted_ts",
+    )
+
+    FIELDS = (
+        "title", "company", "location", "link", "source", "posted_date",
+        "salary", "description", "posted_ts",
+    )
+
+    # Shorter descriptions are kept as plain strings
+    COMPRESS_MIN_CHARS = 256
+
+    def __init__(
+        self,
+        title: str,
+        company: str,
+        location: str,
+        link: str,
+        source: str,
+        posted_date: str = "",
+        salary: str = "",
+        description: str = "",
+        posted_ts: Optional[float] = None,
+    ) -> None:
+        self.title = title
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.link = link
+        self.source = _intern(source)
+        self.posted_date = _intern(posted_date)
+        self.salary = _intern(salary)
+        self.description = description
+        # UTC epoch seconds parsed from posted_date at ingest, None if unknown
+        self.posted_ts = posted_ts
+
+    @property
+    def description(self) -> str:
+        stored = self._description
+        if isinstance(stored, bytes):
+            return zlib.decompress(stored).decode("utf-8")
+        return stored
+
+    @description.setter
+    def description(self, value: str) -> None:
+        if value and len(value) >= self.COMPRESS_MIN_CHARS:
+            self._description = zlib.compress(value.encode("utf-8"), 6)
+        else:
+            self._description = value
+
+    def _values(self) -> tuple:
+        return (
+            self.title, self.company, self.location, self.link, self.source,
+            self.posted_date, self.salary, self._description, self.posted_ts,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        fields_ = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"Job({fields_})"
+
+    def __getstate__(self) -> tuple:
+        return self._values()
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def replace(self, **changes: Any) -> "Job":
+        """A copy with some fields changed (dataclasses.replace equivalent)."""
+        values = self.to_dict()
+        values.update(changes)
+        return Job(**values)
+
+
+def _intern(value: str) -> str:
+    return sys.intern(value) if type(value) is str else value
+
+
+# ---------------------------------------------------------------------------
+# Fetch steps
+# ---------------------------------------------------------------------------
+# Platform scrapers are written as generators that yield the HTTP requests
+# (and politeness pauses) they need and receive each response back. The
+# synchronous JobScraper and async_job_automation.AsyncJobScraper drive the
+# very same generators, so parsing and filtering exist in one place only.
+
+@dataclass
+class FetchStep:
+    """
+    One GET request. The driver sends back the response object (anything
+    with status_code / text / json()), or the decoded payload when as_json
+    is set. Failures are sent back as None.
+
+    feed marks a JSON request whose payload does not depend on the search
+    (a full feed that is filtered locally); the driver answers it from the
+    shared feed cache and sends back a feed_cache.Feed wrapping the payload.
+    """
+    url: str
+    params: Optional[dict] = None
+    extra_headers: Optional[dict] = None
+    as_json: bool = False
+    feed: bool = False
+
+
+@dataclass
+class ParallelFetch:
+    """
+    Several FetchSteps performed concurrently, at most max_workers at a
+    time. As each reply arrives the driver calls done(i, reply) (i is the
+    position in steps); once it returns True the requests still outstanding
+    are abandoned. The driver sends back the replies in step order, None for
+    failed or abandoned ones.
+    """
+    steps: List[FetchStep]
+    done: Optional[Callable[[int, Any], bool]] = None
+    max_workers: int = 4
+
+
+@dataclass
+class StreamFetch:
+    """
+    A JSON GET whose body is parsed as it arrives (json_stream): take(item)
+    is called with each item of the array at path and returns True once it
+    has seen enough, which stops the download. Nothing is cached. The driver
+    sends back the number of items read, or None if the request failed.
+    """
+    url: str
+    take: Callable[[Any], bool]
+    path: Tuple[str, ...] = ()
+    params: Optional[dict] = None
+    extra_headers: Optional[dict] = None
+
+
+Step = Union[FetchStep, ParallelFetch, StreamFetch]
+Steps = Generator[Step, Any, List[Job]]
+
+
+# Identical concurrent platform scrapes (same platform, normalised query and
+# result cap) share one upstream call across every JobScraper in the process.
+PLATFORM_FLIGHTS = SingleFlight()
+
+
+def _item_identity(
+    item: dict, id_field: str, stamp_field: str
+) -> Optional[Tuple[Hashable, Any]]:
+    """
+    ((id_field, id, timestamp), timestamp) for delta ingestion: the first
+    part identifies the item in FeedDeltas, the second is compared with the
+    feed's watermark. None when the item has no usable id.
+    """
+    item_id = item.get(id_field)
+    if item_id is None or isinstance(item_id, (dict, list)):
+        return None
+    stamp = item.get(stamp_field)
+    if isinstance(stamp, (dict, list)):
+        stamp = None
+    return (id_field, item_id, stamp), stamp
+
+
+def _pattern(selector) -> str:
+    return selector.pattern
+
+
+# Catch-all selectors at the end of the lists below. They match some element
+# on almost any card, so a hit on one odd card says nothing about the next:
+# they are never learned and keep their place after the specific selectors.
+_GENERIC_SELECTORS = frozenset({
+    "a",
+    "h3",
+    "h4",
+    "time",
+    ".profile",
+    "[class*='company']",
+    "[class*='salary']",
+    "[class*='date']",
+    ".jobs_new_jobs_container article",
+    "article.job",
+})
+
+
+def _is_newer(stamp: Any, watermark: Any) -> bool:
+    if stamp is None:
+        return False
+    if watermark is None:
+        return True
+    try:
+        return stamp > watermark
+    except TypeError:
+        return False
 
 
 # ---------------------------------------------------------------------------
@@ -80,6 +303,83 @@ class JobScraper:
         "jobicy",
     ]
 
+    # ---- Concurrent fan-out ------------------------------------------------
+
+    # Upper bound on platforms scraped at the same time in concurrent mode
+    MAX_WORKERS: int = 7
+
+    # Seconds each platform may take before it is reported as "timeout".
+    # The HTML scrapers get more room than the JSON APIs.
+    DEFAULT_PLATFORM_TIMEOUT: float = 20.0
+
+    # Result pages of The Muse's public feed read per search, and how many
+    # of them are requested at the same time
+    THEMUSE_PAGES: int = 4
+    THEMUSE_PAGE_WORKERS: int = 4
+
+    # The Muse category a query is narrowed to server-side, by the first
+    # phrase found in its normalised title (most specific phrases first).
+    # Queries matching none read the unfiltered feed.
+    THEMUSE_CATEGORIES: List[Tuple[str, str]] = [
+        ("data scientist", "Data Science"),
+        ("data science", "Data Science"),
+        ("machine learning", "Data Science"),
+        ("data analyst", "Data and Analytics"),
+        ("business analyst", "Data and Analytics"),
+        ("product manager", "Product Management"),
+        ("project manager", "Project Management"),
+        ("designer", "Design and UX"),
+        ("ux", "Design and UX"),
+        ("recruiter", "HR and Recruiting"),
+        ("accountant", "Accounting and Finance"),
+        ("marketing", "Marketing"),
+        ("sales", "Sales"),
+        ("developer", "Software Engineering"),
+        ("engineer", "Software Engineering"),
+        ("programmer", "Software Engineering"),
+        ("software", "Software Engineering"),
+        ("devops", "Software Engineering"),
+    ]
+    THEMUSE_REMOTE_LOCATION: str = "Flexible / Remote"
+    PLATFORM_TIMEOUTS: Dict[str, float] = {
+        "linkedin":    25.0,
+        "internshala": 30.0,
+    }
+
+    # ---- Rate limiting -----------------------------------------------------
+
+    # Host each platform sends its requests to (rate_limit.HOST_RATES holds
+    # the per-host budgets)
+    PLATFORM_HOSTS: Dict[str, str] = {
+        "linkedin":    "www.linkedin.com",
+        "internshala": "internshala.com",
+        "remoteok":    "remoteok.com",
+        "arbeitnow":   "www.arbeitnow.com",
+        "themuse":     "www.themuse.com",
+        "himalayas":   "himalayas.app",
+        "jobicy":      "jobicy.com",
+    }
+
+    # A request that would have to queue longer than this for its host's
+    # budget is dropped instead, like a failed request
+    RATE_LIMIT_MAX_WAIT: float = 10.0
+
+    # Platforms whose slow requests may be hedged with a duplicate GET
+    # (the JSON APIs; the HTML sites are the ones that block)
+    HEDGED_PLATFORMS: Tuple[str, ...] = (
+        "remoteok", "arbeitnow", "themuse", "himalayas", "jobicy",
+    )
+
+    # ---- Streaming feeds ---------------------------------------------------
+
+    # When set, a RemoteOK / Arbeitnow feed that is not already in the feed
+    # cache is parsed item by item as it downloads and the download stops at
+    # max_results matches, instead of loading (and caching) the whole feed.
+    # Trades upstream traffic for peak memory on small instances.
+    STREAM_FEEDS: bool = False
+    STREAMED_PLATFORMS: Tuple[str, ...] = ("remoteok", "arbeitnow")
+    STREAM_CHUNK_BYTES: int = 64 * 1024
+
     # ---- Browser-like headers used for HTML scraping ----------------------
 
     _USER_AGENTS: List[str] = [
@@ -93,11 +393,136 @@ class JobScraper:
         "Gecko/20100101 Firefox/125.0",
     ]
 
+    # ---- HTML selectors ---------------------------------------------------
+    # Compiled once per class; tried in order until one matches, except that
+    # the one that last matched for a field is tried first (selector_memory).
+
+    _LINKEDIN_SELECTORS: Dict[str, SelectorList] = {
+        "cards": compile_selectors([
+            ".jobs-search__results-list li",
+            ".job-search-card",
+            ".base-card",
+        ]),
+        "title": compile_selectors([
+            "h3.base-search-card__title",
+            ".base-search-card__title",
+            ".job-search-card__title",
+            "h3",
+        ]),
+        "company": compile_selectors([
+            ".base-search-card__subtitle",
+            ".job-search-card__subtitle",
+            "h4",
+        ]),
+        "location": compile_selectors([
+            ".job-search-card__location",
+            ".base-search-card__metadata",
+        ]),
+        "posted": compile_selectors(["time", ".job-search-card__listdate"]),
+        "posted_at": compile_selectors(["time[datetime]"]),
+        "link": compile_selectors([
+            "a.base-card__full-link",
+            "a[href*='/jobs/view/']",
+            "a[href*='/jobs/collections/']",
+        ]),
+    }
+
+    # Internshala: covers old markup + the 2024/2025 redesign
+    _INTERNSHALA_SELECTORS: Dict[str, SelectorList] = {
+        "cards": compile_selectors([
+            # 2024-2025 redesign
+            ".individual_internship",
+            "[data-internship-id]",
+            "[data-job-id]",
+            ".job-internship-card",
+            ".internship-card",
+            # older markup still seen on some listing types
+            ".internship_meta",
+            ".container_type .individual_internship",
+            "#internship_list_container .individual_internship",
+            # very broad fallback
+            ".jobs_new_jobs_container article",
+            "article.job",
+        ]),
+        "title": compile_selectors([
+            # 2025 class names
+            ".job-title-text",
+            "h3.job-title",
+            ".title",
+            # 2024 class names
+            "div.heading_4_5",
+            ".profile h3",
+            ".job-internship-name",
+            # older
+            ".profile",
+            "h3",
+        ]),
+        "company": compile_selectors([
+            # 2025
+            ".company-name",
+            ".company_name",
+            # 2024
+            "a.link_display_like_text",
+            ".company",
+            # generic
+            "[class*='company']",
+        ]),
+        "salary": compile_selectors(
+            [".salary", ".stipend", ".compensation", "[class*='salary']"]
+        ),
+        "posted": compile_selectors([
+            ".status-success",
+            ".posted-date",
+            ".date",
+            "time",
+            "[class*='date']",
+        ]),
+        "link": compile_selectors([
+            "a.view_detail_button",
+            "a[href*='/jobs/detail/']",
+            "a[href*='/internship/detail/']",
+            "a[href*='/job/']",
+            "a[href*='/internship/']",
+            "a",
+        ]),
+    }
+
     # ---- Construction -----------------------------------------------------
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self._refresh_headers()
+    def __init__(
+        self,
+        feed_cache: Optional[TTLCache] = None,
+        html_parser: Optional[str] = None,
+        platform_flights: Optional[SingleFlight] = None,
+        validators: Optional[ValidatorCache] = None,
+        feed_deltas: Optional[FeedDeltas] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        health: Optional[HealthBoard] = None,
+        selector_memory: Optional[SelectorMemory] = None,
+        http_pool: Optional[HttpPool] = None,
+        request_policy: Optional[RequestPolicy] = None,
+        http_cache: Optional[HttpCache] = None,
+    ) -> None:
+        self.http_pool = http_pool if http_pool is not None else HTTP_POOL
+        self.http_cache = http_cache if http_cache is not None else HTTP_CACHE
+        self.request_policy = (
+            request_policy if request_policy is not None else REQUEST_POLICY
+        )
+        self._hedged_hosts = {
+            self.PLATFORM_HOSTS[key] for key in self.HEDGED_PLATFORMS
+        }
+        self.html_parser = html_parser or HTML_PARSER
+        self.platform_flights = (
+            platform_flights if platform_flights is not None else PLATFORM_FLIGHTS
+        )
+        self.feed_cache = feed_cache if feed_cache is not None else FEED_CACHE
+        self.validators = validators if validators is not None else HTTP_VALIDATORS
+        self.feed_deltas = feed_deltas if feed_deltas is not None else FEED_DELTAS
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RATE_LIMITER
+        self.health = health if health is not None else PLATFORM_HEALTH
+        self.selector_memory = (
+            selector_memory if selector_memory is not None else SELECTOR_MEMORY
+        )
         self.platform_scrapers: Dict[str, Callable[[str, str, int], List[Job]]] = {
             "linkedin":    self.get_jobs_linkedin,
             "internshala": self.get_jobs_internshala,
@@ -108,20 +533,15 @@ class JobScraper:
             "jobicy":      self.get_jobs_jobicy,
         }
         self.last_run_statuses: List[Dict[str, str]] = []
+        # Cookies the upstream sites set for this scraper (a consent or
+        # session cookie from the first page that later pages need). Sent
+        # with each request; the shared session itself stores none.
+        self.cookies = requests.cookies.RequestsCookieJar()
 
-    def _refresh_headers(self) -> None:
-        self.session.headers.update(
-            {
-                "User-Agent": random.choice(self._USER_AGENTS),
-                "Accept": (
-                    "text/html,application/xhtml+xml,application/xml;"
-                    "q=0.9,image/webp,*/*;q=0.8"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-        )
+    @property
+    def session(self) -> requests.Session:
+        """The process-wide pooled session (shared, never mutated per call)."""
+        return self.http_pool.session
 
     # ---- Platform options (for UI / CLI menus) ----------------------------
 
@@ -134,8 +554,11 @@ class JobScraper:
 
     # ---- Low-level HTTP helpers -------------------------------------------
 
-    def _add_delay(self, min_s: float = 0.8, max_s: float = 2.0) -> None:
-        time.sleep(random.uniform(min_s, max_s))
+    def _rate_limit_exceeded(self, url: str) -> None:
+        print(
+            f"  [warn] rate limit for {RateLimiter.host(url)} exceeded; "
+            f"skipping {url!r}"
+        )
 
     def _request_page(
         self,
@@ -143,19 +566,126 @@ class JobScraper:
         params: Optional[dict] = None,
         timeout: int = 15,
         extra_headers: Optional[dict] = None,
+        stream: bool = False,
     ) -> Optional[requests.Response]:
-        """GET a URL, rotating the User-Agent each call."""
-        try:
-            self.session.headers["User-Agent"] = random.choice(self._USER_AGENTS)
-            headers = dict(self.session.headers)
-            if extra_headers:
-                headers.update(extra_headers)
-            return self.session.get(
-                url, params=params, timeout=timeout, headers=headers
+        """
+        GET a URL under self.request_policy: retried on connection errors,
+        429 and 5xx, possibly hedged, each attempt paced by the host's rate
+        limit and cut to the search deadline. Returns the last response
+        (which may be an error status), or None if nothing was received.
+        With stream=True the body is left unread (and never hedged); the
+        caller must close the response.
+
+        self.http_cache may answer from disk instead (see http_cache).
+        """
+        if self.http_cache.replaying:
+            return self._replayed(url, params)
+        # Only the per-request headers; the session adds the browser defaults
+        headers = {"User-Agent": random.choice(self._USER_AGENTS)}
+        if extra_headers:
+            headers.update(extra_headers)
+
+        def send(attempt_timeout: float):
+            try:
+                resp = self.session.get(
+                    url,
+                    params=params,
+                    timeout=attempt_timeout,
+                    headers=headers,
+                    stream=stream,
+                    cookies=self.cookies,
+                )
+            except requests.RequestException as exc:
+                print(f"  [warn] request failed for {url!r}: {exc}")
+                return None
+            for hop in (*resp.history, resp):
+                self.cookies.update(hop.cookies)
+            return resp
+
+        policy = self.request_policy
+        resp = None
+        for attempt in range(policy.max_attempts):
+            attempt_timeout = policy.attempt_timeout(timeout)
+            if attempt_timeout is None:
+                print(f"  [warn] search deadline reached before {url!r}")
+                break
+            if not self.rate_limiter.acquire(
+                url, min(self.RATE_LIMIT_MAX_WAIT, attempt_timeout)
+            ):
+                self._rate_limit_exceeded(url)
+                break
+            resp = policy.send(
+                RateLimiter.host(url),
+                send,
+                attempt_timeout,
+                None if stream else self._hedge_check(url),
             )
+            delay = policy.retry_delay(attempt, resp)
+            if delay is None:
+                break
+            if resp is not None:
+                resp.close()
+            time.sleep(delay)
+        if self.http_cache.enabled:
+            return self._through_cache(url, params, resp, stream)
+        return resp
+
+    # ---- On-disk response cache ---------------------------------------------
+
+    def _cached_response(self, kept: CachedResponse) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = kept.status_code
+        resp.headers = CaseInsensitiveDict(kept.headers)
+        resp._content = kept.body
+        resp._content_consumed = True
+        resp.encoding = kept.encoding
+        resp.url = kept.url
+        return resp
+
+    def _replayed(self, url: str, params: Optional[dict]):
+        kept = self.http_cache.get("GET", url, params)
+        if kept is None:
+            print(f"  [warn] no recorded response for {url!r}")
+            return None
+        return self._cached_response(kept)
+
+    def _fallback(self, url: str, params: Optional[dict], resp):
+        """The kept copy of a failed live request, or resp if there is none."""
+        kept = self.http_cache.get("GET", url, params)
+        if kept is None:
+            return resp
+        age = time.time() - kept.fetched_at
+        print(f"  [warn] {url} unavailable, serving the copy fetched {age:.0f}s ago")
+        self.http_cache.fallback()
+        return self._cached_response(kept)
+
+    def _through_cache(
+        self, url: str, params: Optional[dict], resp, stream: bool
+    ) -> Optional[requests.Response]:
+        cache = self.http_cache
+        if cache.mode == "live" and (resp is None or resp.status_code in RETRY_STATUSES):
+            kept = self._fallback(url, params, resp)
+            if kept is not resp and resp is not None:
+                resp.close()
+            return kept
+        # A live stream is left alone so it can stop early; recording reads it all
+        if resp is None or not cache.stores(resp.status_code) or (
+            stream and cache.mode == "live"
+        ):
+            return resp
+        try:
+            body = resp.content
         except requests.RequestException as exc:
             print(f"  [warn] request failed for {url!r}: {exc}")
             return None
+        cache.put("GET", url, params, resp.status_code, resp.headers, body, resp.encoding)
+        return resp
+
+    def _hedge_check(self, url: str) -> Optional[Callable[[], bool]]:
+        """For hedged hosts: a check that books a token for the duplicate."""
+        if RateLimiter.host(url) not in self._hedged_hosts:
+            return None
+        return lambda: self.rate_limiter.reserve(url, 0) is not None
 
     def _request_json(
         self,
@@ -165,9 +695,59 @@ class JobScraper:
         extra_headers: Optional[dict] = None,
     ):
         """GET a URL and parse the response as JSON. Returns None on failure."""
+        loaded = self._conditional_json(url, params, timeout, extra_headers)
+        return loaded[0] if loaded is not None else None
+
+    def _conditional_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: int = 15,
+        extra_headers: Optional[dict] = None,
+        wrap: Callable[[Any], Any] = lambda data: data,
+    ) -> Optional[Tuple[Any, int]]:
+        """
+        GET a JSON resource with the validators of its last response and
+        return (wrap(payload), size). On 304 the payload remembered for it
+        is returned without downloading or parsing anything.
+        """
+        key = self.validators.key(url, params)
         resp = self._request_page(
-            url, params=params, timeout=timeout, extra_headers=extra_headers
+            url,
+            params=params,
+            timeout=timeout,
+            extra_headers=self._validated_headers(key, extra_headers),
         )
+        return self._accept_json(key, resp, url, wrap)
+
+    def _validated_headers(
+        self, key: tuple, extra_headers: Optional[dict]
+    ) -> Optional[dict]:
+        conditional = self.validators.conditional_headers(key)
+        if not conditional:
+            return extra_headers
+        return {**(extra_headers or {}), **conditional}
+
+    def _accept_json(
+        self, key: tuple, resp, url: str, wrap: Callable[[Any], Any]
+    ) -> Optional[Tuple[Any, int]]:
+        if resp is not None and resp.status_code == 304:
+            reused = self.validators.reuse(key)
+            if reused is None:
+                print(f"  [warn] {url} answered 304 for a payload no longer held")
+            return reused
+        data = self._decode_json(resp, url)
+        if data is None:
+            return None
+        value, size = wrap(data), self._body_size(resp)
+        self.validators.remember(key, resp.headers, value, size)
+        return value, size
+
+    def _body_size(self, resp) -> int:
+        return len(resp.content)
+
+    def _decode_json(self, resp, url: str):
+        """Decode a JSON response body, or None if it is missing or invalid."""
         if resp is None:
             return None
         if resp.status_code >= 400:
@@ -179,30 +759,186 @@ class JobScraper:
             print(f"  [warn] {url} did not return valid JSON")
             return None
 
+    def _feed_key(self, step: FetchStep) -> tuple:
+        return step.url, tuple(sorted((step.params or {}).items()))
+
+    def _streams(self, step: FetchStep) -> bool:
+        """Whether to stream a feed request rather than load the whole feed."""
+        return self.STREAM_FEEDS and self.feed_cache.age(self._feed_key(step)) is None
+
+    def _stream_step(
+        self, step: FetchStep, take: Callable[[Any], bool], path: Tuple[str, ...] = ()
+    ) -> StreamFetch:
+        return StreamFetch(
+            step.url, take, path, params=step.params, extra_headers=step.extra_headers
+        )
+
+    def _load_feed(self, step: FetchStep) -> Optional[Tuple[Any, int]]:
+        # Wrapped in Feed before it is remembered, so a 304 hands back the
+        # same Feed with its index already built
+        return self._conditional_json(
+            step.url, params=step.params, extra_headers=step.extra_headers, wrap=Feed
+        )
+
+    def _perform_parallel(self, step: ParallelFetch) -> List[Any]:
+        replies: List[Any] = [None] * len(step.steps)
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(step.max_workers, len(step.steps))),
+            thread_name_prefix="fetch",
+        )
+        try:
+            futures = {
+                executor.submit(copy_context().run, self._perform, fetch): i
+                for i, fetch in enumerate(step.steps)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                replies[i] = future.result()
+                if step.done is not None and step.done(i, replies[i]):
+                    break
+        finally:
+            # Requests already sent finish in the background (feeds still
+            # land in the cache); queued ones are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+        return replies
+
+    def _perform_stream(self, step: StreamFetch) -> Optional[int]:
+        resp = self._request_page(
+            step.url, params=step.params, extra_headers=step.extra_headers, stream=True
+        )
+        if resp is None:
+            return None
+        try:
+            if resp.status_code >= 400:
+                print(f"  [warn] {step.url} returned HTTP {resp.status_code}")
+                return None
+            parser, read = ArrayItemParser(step.path), 0
+            for chunk in resp.iter_content(self.STREAM_CHUNK_BYTES):
+                for item in parser.feed(chunk):
+                    read += 1
+                    if step.take(item):
+                        return read
+                if parser.done:
+                    return read
+            for item in parser.close():
+                read += 1
+                if step.take(item):
+                    break
+            return read
+        except (requests.RequestException, ValueError) as exc:
+            print(f"  [warn] streaming {step.url!r} failed: {exc}")
+            return None
+        finally:
+            # Drops the connection when the body was not read to the end
+            resp.close()
+
+    def _perform(self, step: Step):
+        if isinstance(step, ParallelFetch):
+            return self._perform_parallel(step)
+        if isinstance(step, StreamFetch):
+            return self._perform_stream(step)
+        if step.feed:
+            return self.feed_cache.get_or_load(
+                self._feed_key(step), lambda: self._load_feed(step)
+            )
+        if step.as_json:
+            return self._request_json(
+                step.url, params=step.params, extra_headers=step.extra_headers
+            )
+        return self._request_page(
+            step.url, params=step.params, extra_headers=step.extra_headers
+        )
+
+    def _drive(self, steps: Steps) -> List[Job]:
+        """Run a platform step generator to completion over HTTP."""
+        reply = None
+        while True:
+            try:
+                step = steps.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply = self._perform(step)
+
     # ---- Text / HTML helpers ---------------------------------------------
 
     def _clean(self, value: str) -> str:
         """Strip HTML tags, unescape entities, collapse whitespace."""
-        text = BeautifulSoup(unescape(value or ""), "html.parser").get_text(
-            " ", strip=True
-        )
-        return re.sub(r"\s+", " ", text).strip()
+        return normalize_text(value)
+
+    def _normalise(self, value: str) -> str:
+        """The lower-cased clean form used for all title/location matching."""
+        return self._clean(value).lower()
 
     def _tokens_match(self, query: str, text: str) -> bool:
         """Return True if the first 3 meaningful query tokens appear in text."""
-        tokens = [t for t in re.split(r"\W+", query.lower()) if t][:3]
-        haystack = self._clean(text).lower()
+        tokens = query_tokens(query)
+        haystack = self._normalise(text)
         return all(tok in haystack for tok in tokens) if tokens else True
 
     def _location_match(self, requested: str, job_location: str) -> bool:
         if not requested:
             return True
-        loc_text = self._clean(job_location).lower()
-        req = self._clean(requested).lower()
-        if req in {"remote", "any", "worldwide"}:
+        loc_text = self._normalise(job_location)
+        req = self._normalise(requested)
+        if req in REMOTE_ALIASES:
             return "remote" in loc_text or "worldwide" in loc_text
         return req in loc_text or "remote" in loc_text
 
+    def _index_feed(
+        self,
+        name: str,
+        items: Iterable[Any],
+        identity: Callable[[dict], Optional[Tuple[Hashable, Any]]],
+        make_row: Callable[[Any], Optional[Tuple[Any, str, str]]],
+    ) -> FeedIndex:
+        """
+        Index one copy of a feed so that FeedIndex.title_matches /
+        location_matches reproduce _tokens_match and _location_match
+        without re-cleaning anything per query.
+
+        make_row(item) returns (entry, job_title, job_location), or None to
+        skip the item; entry is a tuple whose first element is item.
+        identity(item) is _item_identity(...) or None when the item has no
+        id: items already seen in the previous copy of feed name keep their
+        cleaned fields, so only new items are cleaned. A kept row is rebuilt
+        around this copy's item, so the previous copy is not kept alive.
+        """
+        previous = self.feed_deltas.previous(name)
+        watermark = newest = self.feed_deltas.watermark(name)
+        carried: Dict[Hashable, IndexRow] = {}
+        entries: List[Any] = []
+        titles: List[str] = []
+        locations: List[str] = []
+        reused = cleaned = new_items = 0
+
+        for item in items:
+            ident = identity(item) if isinstance(item, dict) else None
+            row = previous.get(ident) if ident is not None else None
+            if row is None:
+                made = make_row(item)
+                if made is None:
+                    continue
+                entry, job_title, job_loc = made
+                row = (entry, self._normalise(job_title), self._normalise(job_loc))
+                cleaned += 1
+            else:
+                row = ((item,) + row[0][1:], row[1], row[2])
+                reused += 1
+
+            if ident is not None:
+                carried[ident] = row
+                stamp = ident[1]
+                if _is_newer(stamp, watermark):
+                    new_items += 1
+                if _is_newer(stamp, newest):
+                    newest = stamp
+            entries.append(row[0])
+            titles.append(row[1])
+            locations.append(row[2])
+
+        self.feed_deltas.commit(name, carried, newest, reused, cleaned, new_items)
+        return FeedIndex(entries, titles, locations)
+
     def _abs_url(self, href: str, base: str = "") -> str:
         href = (href or "").strip()
         if not href:
@@ -215,113 +951,164 @@ class JobScraper:
             return f"{base}{href}" if base else href
         return f"{base}/{href}" if base else href
 
+    # learn_as names the (platform, field) a selector list belongs to; when
+    # given, the specific selector that last matched is tried first and a
+    # new match is remembered in self.selector_memory. Generic fallbacks
+    # (_GENERIC_SELECTORS) are neither learned nor moved forward.
+
+    def _learned(
+        self, selectors: SelectorList, learn_as: Optional[FieldKey]
+    ) -> SelectorList:
+        if learn_as is None:
+            return selectors
+        ordered = self.selector_memory.ordered(learn_as, selectors, _pattern)
+        # a memory file written before fallbacks were excluded
+        if ordered and ordered[0].pattern in _GENERIC_SELECTORS:
+            return selectors
+        return ordered
+
+    def _remember(self, learn_as: Optional[FieldKey], sel, position: int) -> None:
+        if learn_as is not None and sel.pattern not in _GENERIC_SELECTORS:
+            self.selector_memory.learn(learn_as, sel.pattern, position)
+
+    def _select_cards(
+        self, soup, selectors: SelectorList, learn_as: Optional[FieldKey] = None
+    ) -> list:
+        for position, sel in enumerate(self._learned(selectors, learn_as)):
+            cards = sel.select(soup)
+            if cards:
+                self._remember(learn_as, sel, position)
+                return cards
+        return []
+
     def _sel_text(
         self,
         elem,
-        selectors: List[str],
+        selectors: SelectorList,
         default: str = "",
+        learn_as: Optional[FieldKey] = None,
     ) -> str:
-        for sel in selectors:
-            try:
-                found = elem.select_one(sel)
-                if not found:
-                    continue
-                text = (
-                    found.get("title")
-                    or found.get("aria-label")
-                    or found.get_text(" ", strip=True)
-                )
-                text = self._clean(text)
-                if text:
-                    return text
-            except Exception:
+        for position, sel in enumerate(self._learned(selectors, learn_as)):
+            found = sel.select_one(elem)
+            if not found:
                 continue
+            text = (
+                found.get("title")
+                or found.get("aria-label")
+                or found.get_text(" ", strip=True)
+            )
+            text = self._clean(text)
+            if text:
+                self._remember(learn_as, sel, position)
+                return text
         return default
 
+    def _sel_attr(
+        self,
+        elem,
+        selectors: SelectorList,
+        attr: str,
+        learn_as: Optional[FieldKey] = None,
+    ) -> str:
+        for position, sel in enumerate(self._learned(selectors, learn_as)):
+            found = sel.select_one(elem)
+            if found and found.get(attr):
+                self._remember(learn_as, sel, position)
+                return str(found[attr]).strip()
+        return ""
+
     def _sel_href(
         self,
         elem,
-        selectors: List[str],
+        selectors: SelectorList,
         base: str = "",
+        learn_as: Optional[FieldKey] = None,
     ) -> str:
-        for sel in selectors:
-            try:
-                found = elem.select_one(sel)
-                if found and found.get("href"):
-                    return self._abs_url(found["href"], base)
-            except Exception:
-                continue
+        for position, sel in enumerate(self._learned(selectors, learn_as)):
+            found = sel.select_one(elem)
+            if found and found.get("href"):
+                self._remember(learn_as, sel, position)
+                return self._abs_url(found["href"], base)
         return ""
 
     # =========================================================================
     # PLATFORM SCRAPERS
     # =========================================================================
-
-    # ---- LinkedIn -----------------------------------------------------------
+    # Each get_jobs_* method drives the matching _steps_* generator below.
 
     def get_jobs_linkedin(
         self, title: str, location: str, max_results: int = 10
     ) -> List[Job]:
+        return self._drive(self._steps_linkedin(title, location, max_results))
+
+    def get_jobs_internshala(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return self._drive(self._steps_internshala(title, location, max_results))
+
+    def get_jobs_remoteok(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return self._drive(self._steps_remoteok(title, location, max_results))
+
+    def get_jobs_arbeitnow(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return self._drive(self._steps_arbeitnow(title, location, max_results))
+
+    def get_jobs_themuse(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return self._drive(self._steps_themuse(title, location, max_results))
+
+    def get_jobs_himalayas(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return self._drive(self._steps_himalayas(title, location, max_results))
+
+    def get_jobs_jobicy(
+        self, title: str, location: str, max_results: int = 10
+    ) -> List[Job]:
+        return self._drive(self._steps_jobicy(title, location, max_results))
+
+    # ---- LinkedIn -----------------------------------------------------------
+
+    def _steps_linkedin(
+        self, title: str, location: str, max_results: int = 10
+    ) -> Steps:
         print(f"  Searching LinkedIn for '{title}' in '{location}'...")
         jobs: List[Job] = []
 
         params = {"keywords": title, "location": location, "sortBy": "DD"}
-        resp = self._request_page(
+        resp = yield FetchStep(
             f"https://www.linkedin.com/jobs/search?{urlencode(params)}"
         )
         if not resp or resp.status_code != 200:
             return jobs
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        cards = []
-        for sel in [
-            ".jobs-search__results-list li",
-            ".job-search-card",
-            ".base-card",
-        ]:
-            cards = soup.select(sel)
-            if cards:
-                break
+        sels = self._LINKEDIN_SELECTORS
+        soup = make_soup(resp.text, self.html_parser)
+        cards = self._select_cards(soup, sels["cards"], ("linkedin", "cards"))
 
         for card in cards[:max_results]:
             job_title = self._sel_text(
-                card,
-                [
-                    "h3.base-search-card__title",
-                    ".base-search-card__title",
-                    ".job-search-card__title",
-                    "h3",
-                ],
+                card, sels["title"], learn_as=("linkedin", "title")
             )
             company = self._sel_text(
-                card,
-                [
-                    ".base-search-card__subtitle",
-                    ".job-search-card__subtitle",
-                    "h4",
-                ],
+                card, sels["company"], learn_as=("linkedin", "company")
             )
             job_loc = self._sel_text(
-                card,
-                [
-                    ".job-search-card__location",
-                    ".base-search-card__metadata",
-                ],
-                default=location,
+                card, sels["location"], default=location,
+                learn_as=("linkedin", "location"),
             )
             posted = self._sel_text(
-                card,
-                ["time", ".job-search-card__listdate"],
-                default="Recently",
+                card, sels["posted"], default="Recently",
+                learn_as=("linkedin", "posted"),
             )
+            posted_at = self._sel_attr(card, sels["posted_at"], "datetime")
             link = self._sel_href(
-                card,
-                [
-                    "a.base-card__full-link",
-                    "a[href*='/jobs/view/']",
-                    "a[href*='/jobs/collections/']",
-                ],
-                "https://www.linkedin.com",
+                card, sels["link"], "https://www.linkedin.com",
+                learn_as=("linkedin", "link"),
             )
 
             if job_title and company:
@@ -333,6 +1120,10 @@ class JobScraper:
                         link=link,
                         source=self.PLATFORM_LABELS["linkedin"],
                         posted_date=posted,
+                        posted_ts=(
+                            parse_posted(posted_at, "linkedin")
+                            or parse_posted(posted, "linkedin")
+                        ),
                     )
                 )
 
@@ -346,49 +1137,38 @@ class JobScraper:
     # multiple URL patterns so the scraper degrades gracefully if Internshala
     # updates again.
 
-    def get_jobs_internshala(
+    def _steps_internshala(
         self, title: str, location: str, max_results: int = 10
-    ) -> List[Job]:
+    ) -> Steps:
         print(f"  Searching Internshala for '{title}' in '{location}'...")
         jobs: List[Job] = []
 
         slug_title = title.lower().replace(" ", "-")
         slug_loc = location.lower().replace(" ", "-")
 
-        # Multiple URL patterns — Internshala has changed URL format before
+        # Multiple URL patterns — Internshala has changed URL format before.
+        # The pattern that last returned jobs is tried first.
         urls = [
             # Pattern 1: keyword-in-city slug (most common, post-2024)
-            f"https://internshala.com/jobs/{slug_title}-jobs-in-{slug_loc}",
+            ("jobs-in-city", f"https://internshala.com/jobs/{slug_title}-jobs-in-{slug_loc}"),
             # Pattern 2: keyword only
-            f"https://internshala.com/jobs/{slug_title}-jobs",
+            ("jobs", f"https://internshala.com/jobs/{slug_title}-jobs"),
             # Pattern 3: fresher-jobs sub-section
-            f"https://internshala.com/fresher-jobs/{slug_title}-jobs",
+            ("fresher-jobs", f"https://internshala.com/fresher-jobs/{slug_title}-jobs"),
             # Pattern 4: query-string style (legacy)
             (
+                "keyword-location",
                 "https://internshala.com/jobs/keyword-"
-                f"{quote(title)}/location-{quote(location)}"
+                f"{quote(title)}/location-{quote(location)}",
             ),
         ]
+        url_key = ("internshala", "url")
+        urls = self.selector_memory.ordered(url_key, urls, lambda u: u[0])
 
-        # Selectors tried in order — covers old markup + 2024/2025 redesign
-        card_selectors = [
-            # 2024-2025 redesign
-            ".individual_internship",
-            "[data-internship-id]",
-            "[data-job-id]",
-            ".job-internship-card",
-            ".internship-card",
-            # older markup still seen on some listing types
-            ".internship_meta",
-            ".container_type .individual_internship",
-            "#internship_list_container .individual_internship",
-            # very broad fallback
-            ".jobs_new_jobs_container article",
-            "article.job",
-        ]
+        sels = self._INTERNSHALA_SELECTORS
 
-        for url in urls:
-            resp = self._request_page(
+        for position, (pattern, url) in enumerate(urls):
+            resp = yield FetchStep(
                 url,
                 extra_headers={
                     "Referer": "https://internshala.com/jobs/",
@@ -399,77 +1179,34 @@ class JobScraper:
                 },
             )
             if not resp or resp.status_code != 200:
-                self._add_delay(0.5, 1.2)
                 continue
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-            listings: list = []
-            for sel in card_selectors:
-                listings = soup.select(sel)
-                if listings:
-                    break
+            soup = make_soup(resp.text, self.html_parser)
+            listings = self._select_cards(
+                soup, sels["cards"], ("internshala", "cards")
+            )
 
             if not listings:
-                self._add_delay(0.5, 1.2)
                 continue  # Try next URL pattern
 
             for item in listings[:max_results]:
                 job_title = self._sel_text(
-                    item,
-                    [
-                        # 2025 class names
-                        ".job-title-text",
-                        "h3.job-title",
-                        ".title",
-                        # 2024 class names
-                        "div.heading_4_5",
-                        ".profile h3",
-                        ".job-internship-name",
-                        # older
-                        ".profile",
-                        "h3",
-                    ],
+                    item, sels["title"], learn_as=("internshala", "title")
                 )
                 company = self._sel_text(
-                    item,
-                    [
-                        # 2025
-                        ".company-name",
-                        ".company_name",
-                        # 2024
-                        "a.link_display_like_text",
-                        ".company",
-                        # generic
-                        "[class*='company']",
-                    ],
+                    item, sels["company"], learn_as=("internshala", "company")
                 )
                 salary = self._sel_text(
-                    item,
-                    [".salary", ".stipend", ".compensation", "[class*='salary']"],
-                    default="Not specified",
+                    item, sels["salary"], default="Not specified",
+                    learn_as=("internshala", "salary"),
                 )
                 posted = self._sel_text(
-                    item,
-                    [
-                        ".status-success",
-                        ".posted-date",
-                        ".date",
-                        "time",
-                        "[class*='date']",
-                    ],
-                    default="Recently",
+                    item, sels["posted"], default="Recently",
+                    learn_as=("internshala", "posted"),
                 )
                 link = self._sel_href(
-                    item,
-                    [
-                        "a.view_detail_button",
-                        "a[href*='/jobs/detail/']",
-                        "a[href*='/internship/detail/']",
-                        "a[href*='/job/']",
-                        "a[href*='/internship/']",
-                        "a",
-                    ],
-                    "https://internshala.com",
+                    item, sels["link"], "https://internshala.com",
+                    learn_as=("internshala", "link"),
                 )
 
                 if job_title and company:
@@ -481,15 +1218,15 @@ class JobScraper:
                             link=link,
                             source=self.PLATFORM_LABELS["internshala"],
                             posted_date=posted,
+                            posted_ts=parse_posted(posted, "internshala"),
                             salary=salary,
                         )
                     )
 
             if jobs:
+                self.selector_memory.learn(url_key, pattern, position)
                 break  # Found results; no need to try the next URL pattern
 
-            self._add_delay()
-
         if not jobs:
             print(
                 "  [info] Internshala returned 0 results. "
@@ -502,132 +1239,225 @@ class JobScraper:
 
     # ---- RemoteOK -----------------------------------------------------------
 
-    def get_jobs_remoteok(
+    def _steps_remoteok(
         self, title: str, location: str, max_results: int = 10
-    ) -> List[Job]:
+    ) -> Steps:
         print(f"  Searching RemoteOK for '{title}'...")
         jobs: List[Job] = []
+        check_location = bool(location) and location.lower() != "remote"
+
+        feed_step = self._remoteok_feed()
+        if self._streams(feed_step):
+            def take(item: Any) -> bool:
+                made = self._remoteok_row(item)
+                if made is not None and self._tokens_match(title, made[1]) and (
+                    not check_location or self._location_match(location, made[2])
+                ):
+                    jobs.append(self._remoteok_job(*made[0]))
+                return len(jobs) >= max_results
 
-        data = self._request_json(
-            "https://remoteok.com/api",
-            extra_headers={"Accept": "application/json"},
-        )
-        if not isinstance(data, list):
-            return jobs
-
-        for item in data:
-            if not isinstance(item, dict) or "position" not in item:
-                continue
-            job_title = self._clean(item.get("position", ""))
-            company   = self._clean(item.get("company", ""))
-            job_loc   = self._clean(item.get("location", "Remote")) or "Remote"
-
-            if not self._tokens_match(title, job_title):
-                continue
-            if (
-                location
-                and location.lower() != "remote"
-                and not self._location_match(location, job_loc)
-            ):
-                continue
+            yield self._stream_step(feed_step, take)
+        else:
+            feed = yield feed_step
+            index = self._remoteok_index(feed)
+            if index is None:
+                return jobs
 
-            s_min = item.get("salary_min") or 0
-            s_max = item.get("salary_max") or 0
-            salary = f"{s_min} - {s_max}" if (s_min or s_max) else "Not specified"
+            wanted = [index.title_matches(title)]
+            if check_location:
+                wanted.append(index.location_matches(self._normalise(location)))
 
-            jobs.append(
-                Job(
-                    title=job_title,
-                    company=company or "Unknown",
-                    location=job_loc,
-                    link=item.get("apply_url") or item.get("url") or "",
-                    source=self.PLATFORM_LABELS["remoteok"],
-                    posted_date=self._clean(item.get("date", "")),
-                    salary=salary,
-                    description=self._clean(item.get("description", "")),
-                )
-            )
-            if len(jobs) >= max_results:
-                break
+            for entry in index.select(*wanted):
+                jobs.append(self._remoteok_job(*entry))
+                if len(jobs) >= max_results:
+                    break
 
         print(f"  RemoteOK → {len(jobs)} job(s)")
         return jobs
 
+    def _remoteok_job(self, item: dict, job_title: str, company: str, job_loc: str) -> Job:
+        s_min = item.get("salary_min") or 0
+        s_max = item.get("salary_max") or 0
+        salary = f"{s_min} - {s_max}" if (s_min or s_max) else "Not specified"
+        return Job(
+            title=job_title,
+            company=company or "Unknown",
+            location=job_loc,
+            link=item.get("apply_url") or item.get("url") or "",
+            source=self.PLATFORM_LABELS["remoteok"],
+            posted_date=self._clean(item.get("date", "")),
+            posted_ts=parse_posted(item.get("epoch") or item.get("date"), "remoteok"),
+            salary=salary,
+            description=self._clean(item.get("description", "")),
+        )
+
+    def _remoteok_feed(self) -> FetchStep:
+        return FetchStep(
+            "https://remoteok.com/api",
+            extra_headers={"Accept": "application/json"},
+            as_json=True,
+            feed=True,
+        )
+
+    def _remoteok_index(self, feed: Optional[Feed]) -> Optional[FeedIndex]:
+        if feed is None or not isinstance(feed.data, list):
+            return None
+        return feed.memo("remoteok", lambda: self._index_remoteok(feed.data))
+
+    def _remoteok_row(self, item: Any) -> Optional[Tuple[tuple, str, str]]:
+        if not isinstance(item, dict) or "position" not in item:
+            return None
+        job_title = self._clean(item.get("position", ""))
+        company   = self._clean(item.get("company", ""))
+        job_loc   = self._clean(item.get("location", "Remote")) or "Remote"
+        return (item, job_title, company, job_loc), job_title, job_loc
+
+    def _index_remoteok(self, data: list) -> FeedIndex:
+        return self._index_feed(
+            "remoteok",
+            data,
+            lambda item: _item_identity(item, "id", "epoch"),
+            self._remoteok_row,
+        )
+
     # ---- Arbeitnow ----------------------------------------------------------
 
-    def get_jobs_arbeitnow(
+    def _steps_arbeitnow(
         self, title: str, location: str, max_results: int = 10
-    ) -> List[Job]:
+    ) -> Steps:
         print(f"  Searching Arbeitnow for '{title}'...")
         jobs: List[Job] = []
 
-        data = self._request_json("https://www.arbeitnow.com/api/job-board-api")
-        if not isinstance(data, dict):
-            return jobs
-
-        for item in data.get("data", []):
-            job_title = self._clean(item.get("title", ""))
-            company   = self._clean(item.get("company_name", ""))
-            job_loc   = self._clean(item.get("location", "Remote")) or "Remote"
-            is_remote = bool(item.get("remote"))
-
-            if not self._tokens_match(title, job_title):
-                continue
-            if not is_remote and not self._location_match(location, job_loc):
-                continue
+        # Remote postings are matched as located in "remote", which every
+        # location query accepts, so they bypass the location check as before.
+        feed_step = self._arbeitnow_feed()
+        if self._streams(feed_step):
+            def take(item: Any) -> bool:
+                made = self._arbeitnow_row(item)
+                if (
+                    made is not None
+                    and self._tokens_match(title, made[1])
+                    and self._location_match(location, made[2])
+                ):
+                    jobs.append(self._arbeitnow_job(*made[0]))
+                return len(jobs) >= max_results
 
-            jobs.append(
-                Job(
-                    title=job_title,
-                    company=company or "Unknown",
-                    location="Remote" if is_remote else job_loc,
-                    link=item.get("url", ""),
-                    source=self.PLATFORM_LABELS["arbeitnow"],
-                    posted_date=str(item.get("created_at", "")),
-                    description=self._clean(item.get("description", "")),
-                )
+            yield self._stream_step(feed_step, take, ("data",))
+        else:
+            feed = yield feed_step
+            index = self._arbeitnow_index(feed)
+            if index is None:
+                return jobs
+
+            matches = index.select(
+                index.title_matches(title),
+                index.location_matches(self._normalise(location)),
             )
-            if len(jobs) >= max_results:
-                break
+            for entry in matches:
+                jobs.append(self._arbeitnow_job(*entry))
+                if len(jobs) >= max_results:
+                    break
 
         print(f"  Arbeitnow → {len(jobs)} job(s)")
         return jobs
 
+    def _arbeitnow_job(
+        self, item: dict, job_title: str, company: str, job_loc: str, is_remote: bool
+    ) -> Job:
+        return Job(
+            title=job_title,
+            company=company or "Unknown",
+            location="Remote" if is_remote else job_loc,
+            link=item.get("url", ""),
+            source=self.PLATFORM_LABELS["arbeitnow"],
+            posted_date=str(item.get("created_at", "")),
+            posted_ts=parse_posted(item.get("created_at"), "arbeitnow"),
+            description=self._clean(item.get("description", "")),
+        )
+
+    def _arbeitnow_feed(self) -> FetchStep:
+        return FetchStep(
+            "https://www.arbeitnow.com/api/job-board-api", as_json=True, feed=True
+        )
+
+    def _arbeitnow_index(self, feed: Optional[Feed]) -> Optional[FeedIndex]:
+        if feed is None or not isinstance(feed.data, dict):
+            return None
+        return feed.memo("arbeitnow", lambda: self._index_arbeitnow(feed.data))
+
+    def _arbeitnow_row(self, item: Any) -> Optional[Tuple[tuple, str, str]]:
+        if not isinstance(item, dict):
+            return None
+        job_title = self._clean(item.get("title", ""))
+        company   = self._clean(item.get("company_name", ""))
+        job_loc   = self._clean(item.get("location", "Remote")) or "Remote"
+        is_remote = bool(item.get("remote"))
+        return (
+            (item, job_title, company, job_loc, is_remote),
+            job_title,
+            "remote" if is_remote else job_loc,
+        )
+
+    def _index_arbeitnow(self, data: dict) -> FeedIndex:
+        return self._index_feed(
+            "arbeitnow",
+            data.get("data", []),
+            lambda item: _item_identity(item, "slug", "created_at"),
+            self._arbeitnow_row,
+        )
+
     # ---- The Muse -----------------------------------------------------------
 
-    def get_jobs_themuse(
+    def _steps_themuse(
         self, title: str, location: str, max_results: int = 10
-    ) -> List[Job]:
+    ) -> Steps:
         print(f"  Searching The Muse for '{title}'...")
         jobs: List[Job] = []
 
-        for page in range(1, 5):
-            data = self._request_json(
-                "https://www.themuse.com/api/public/jobs",
-                params={"page": page},
-            )
-            if not isinstance(data, dict):
-                break
+        filters = self._themuse_filters(title, location)
+        wanted_location = None
+        if location and location.lower() != "remote":
+            wanted_location = self._normalise(location)
+
+        def select(page: int, feed: Optional[Feed]) -> Optional[list]:
+            index = self._themuse_index(feed, page, filters)
+            if index is None:
+                return None
+            wanted = [index.title_matches(title)]
+            if wanted_location is not None:
+                wanted.append(index.location_matches(wanted_location))
+            return list(index.select(*wanted))
+
+        # Pages are fetched concurrently. They are consumed in page order, so
+        # the rest are abandoned once the pages that have arrived without a
+        # gap from page 1 hold max_results matches (or one of them failed).
+        pages = list(range(1, self.THEMUSE_PAGES + 1))
+        matches: Dict[int, Optional[list]] = {}
+
+        def done(i: int, feed: Optional[Feed]) -> bool:
+            matches[pages[i]] = select(pages[i], feed)
+            found = 0
+            for page in pages:
+                if page not in matches:
+                    return False
+                if matches[page] is None:
+                    return True
+                found += len(matches[page])
+                if found >= max_results:
+                    return True
+            return True
 
-            for item in data.get("results", []):
-                job_title = self._clean(item.get("name", ""))
-                company   = self._clean(item.get("company", {}).get("name", ""))
-                locs      = [
-                    self._clean(loc.get("name", ""))
-                    for loc in item.get("locations", [])
-                    if loc.get("name")
-                ]
-                job_loc = ", ".join(locs) or "Remote"
-
-                if not self._tokens_match(title, job_title):
-                    continue
-                if (
-                    location
-                    and location.lower() != "remote"
-                    and not self._location_match(location, job_loc)
-                ):
-                    continue
+        yield ParallelFetch(
+            [self._themuse_feed(page, filters) for page in pages],
+            done,
+            max_workers=self.THEMUSE_PAGE_WORKERS,
+        )
 
+        for page in pages:
+            rows = matches.get(page)
+            if rows is None:
+                break
+            for item, job_title, company, job_loc in rows:
                 jobs.append(
                     Job(
                         title=job_title,
@@ -636,6 +1466,9 @@ class JobScraper:
                         link=item.get("refs", {}).get("landing_page", ""),
                         source=self.PLATFORM_LABELS["themuse"],
                         posted_date=self._clean(item.get("publication_date", "")),
+                        posted_ts=parse_posted(
+                            item.get("publication_date"), "themuse"
+                        ),
                         description=self._clean(item.get("contents", "")),
                     )
                 )
@@ -648,14 +1481,68 @@ class JobScraper:
         print(f"  The Muse → {len(jobs)} job(s)")
         return jobs
 
+    def _themuse_filters(self, title: str, location: str) -> Dict[str, str]:
+        """Query parameters that let The Muse filter server-side."""
+        filters: Dict[str, str] = {}
+        padded = f" {' '.join(query_tokens(title))} "
+        for phrase, category in self.THEMUSE_CATEGORIES:
+            if f" {phrase} " in padded:
+                filters["category"] = category
+                break
+        if self._normalise(location) in REMOTE_ALIASES:
+            filters["location"] = self.THEMUSE_REMOTE_LOCATION
+        return filters
+
+    def _themuse_feed(
+        self, page: int, filters: Optional[Dict[str, str]] = None
+    ) -> FetchStep:
+        return FetchStep(
+            "https://www.themuse.com/api/public/jobs",
+            params={"page": page, **(filters or {})},
+            as_json=True,
+            feed=True,
+        )
+
+    def _themuse_index(
+        self,
+        feed: Optional[Feed],
+        page: int,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> Optional[FeedIndex]:
+        if feed is None or not isinstance(feed.data, dict):
+            return None
+        # Delta state is per filtered feed page: "themuse:category=IT:2"
+        scope = [f"{k}={v}" for k, v in sorted((filters or {}).items())]
+        name = ":".join(["themuse", *scope, str(page)])
+        return feed.memo("themuse", lambda: self._index_themuse(feed.data, name))
+
+    def _index_themuse(self, data: dict, name: str = "themuse:1") -> FeedIndex:
+        def make_row(item):
+            job_title = self._clean(item.get("name", ""))
+            company   = self._clean(item.get("company", {}).get("name", ""))
+            locs      = [
+                self._clean(loc.get("name", ""))
+                for loc in item.get("locations", [])
+                if loc.get("name")
+            ]
+            job_loc = ", ".join(locs) or "Remote"
+            return (item, job_title, company, job_loc), job_title, job_loc
+
+        return self._index_feed(
+            name,
+            data.get("results", []),
+            lambda item: _item_identity(item, "id", "publication_date"),
+            make_row,
+        )
+
     # ---- Himalayas ----------------------------------------------------------
     # Free public JSON API — no authentication required.
     # Endpoint: https://himalayas.app/jobs/api/search
     # Docs:     https://himalayas.app/docs/remote-jobs-api
 
-    def get_jobs_himalayas(
+    def _steps_himalayas(
         self, title: str, location: str, max_results: int = 10
-    ) -> List[Job]:
+    ) -> Steps:
         print(f"  Searching Himalayas for '{title}'...")
         jobs: List[Job] = []
 
@@ -665,10 +1552,11 @@ class JobScraper:
         if loc_lower not in {"remote", "any", "worldwide", ""}:
             params["country"] = location
 
-        data = self._request_json(
+        data = yield FetchStep(
             "https://himalayas.app/jobs/api/search",
             params=params,
             extra_headers={"Accept": "application/json"},
+            as_json=True,
         )
         if not isinstance(data, dict):
             return jobs
@@ -697,6 +1585,7 @@ class JobScraper:
                     link=item.get("applicationLink") or item.get("url") or "",
                     source=self.PLATFORM_LABELS["himalayas"],
                     posted_date=self._clean(str(item.get("publishedAt", ""))),
+                    posted_ts=parse_posted(item.get("publishedAt"), "himalayas"),
                     salary=salary or "Not specified",
                     description=self._clean(item.get("excerpt", "")),
                 )
@@ -712,9 +1601,9 @@ class JobScraper:
     # Endpoint: https://jobicy.com/api/v2/remote-jobs
     # Docs:     https://jobicy.com/jobs-rss-feed
 
-    def get_jobs_jobicy(
+    def _steps_jobicy(
         self, title: str, location: str, max_results: int = 10
-    ) -> List[Job]:
+    ) -> Steps:
         print(f"  Searching Jobicy for '{title}'...")
         jobs: List[Job] = []
 
@@ -727,10 +1616,11 @@ class JobScraper:
             # Jobicy 'geo' accepts country names like 'india', 'usa', 'uk'
             params["geo"] = loc_lower
 
-        data = self._request_json(
+        data = yield FetchStep(
             "https://jobicy.com/api/v2/remote-jobs",
             params=params,
             extra_headers={"Accept": "application/json"},
+            as_json=True,
         )
         if not isinstance(data, dict):
             return jobs
@@ -758,6 +1648,7 @@ class JobScraper:
                     link=item.get("url", ""),
                     source=self.PLATFORM_LABELS["jobicy"],
                     posted_date=self._clean(str(item.get("pubDate", ""))),
+                    posted_ts=parse_posted(item.get("pubDate"), "jobicy"),
                     salary=salary or "Not specified",
                     description=self._clean(item.get("jobExcerpt", "")),
                 )
@@ -768,6 +1659,76 @@ class JobScraper:
         print(f"  Jobicy → {len(jobs)} job(s)")
         return jobs
 
+    # ---- Feed warming -------------------------------------------------------
+
+    def feed_requests(
+        self, queries: Iterable[Tuple[str, str]] = (),
+    ) -> List[Tuple[str, FetchStep, Callable[[Optional[Feed]], Optional[FeedIndex]]]]:
+        """
+        Every full-feed request the scrapers make, with its index builder.
+        The Muse's pages depend on the query (category and remote filters),
+        so they are planned only for the filters of the given
+        (title, location) queries.
+        """
+        planned = [
+            ("remoteok", self._remoteok_feed(), self._remoteok_index),
+            ("arbeitnow", self._arbeitnow_feed(), self._arbeitnow_index),
+        ]
+        variants: List[Dict[str, str]] = []
+        for title, location in queries:
+            filters = self._themuse_filters(title, location)
+            if filters not in variants:
+                variants.append(filters)
+        for filters in variants:
+            for page in range(1, self.THEMUSE_PAGES + 1):
+                planned.append(
+                    (
+                        "themuse",
+                        self._themuse_feed(page, filters),
+                        lambda feed, page=page, filters=filters: self._themuse_index(
+                            feed, page, filters
+                        ),
+                    )
+                )
+        return planned
+
+    def warm_feeds(
+        self,
+        max_age: float,
+        take_budget: Callable[[], bool] = lambda: True,
+        queries: Iterable[Tuple[str, str]] = (),
+    ) -> List[str]:
+        """
+        Reload every cached full feed older than max_age seconds (or not
+        cached at all) and build its index, so searches find both ready.
+        The Muse pages are warmed in the variants the given (title,
+        location) queries read, typically the popular searches.
+        take_budget() is asked before each reload; warming stops when it
+        returns False. Returns the platform pages that were reloaded.
+        Feeds that are streamed (STREAM_FEEDS) are left alone.
+        """
+        warmed: List[str] = []
+        for key, step, build_index in self.feed_requests(queries):
+            if self.STREAM_FEEDS and key in self.STREAMED_PLATFORMS:
+                continue
+            feed_key = self._feed_key(step)
+            age = self.feed_cache.age(feed_key)
+            if age is not None and age <= max_age:
+                continue
+            if not take_budget():
+                break
+            feed = self.feed_cache.load(feed_key, lambda: self._load_feed(step))
+            build_index(feed)
+            warmed.append(self._warmed_label(key, step))
+        return warmed
+
+    def _warmed_label(self, key: str, step: FetchStep) -> str:
+        """"themuse:category=...:2" style name of a warmed feed page."""
+        params = dict(step.params or {})
+        page = params.pop("page", None)
+        scope = [f"{k}={v}" for k, v in sorted(params.items())]
+        return ":".join([key, *scope, str(page)]) if page else key
+
     # =========================================================================
     # Orchestration
     # =========================================================================
@@ -784,14 +1745,173 @@ class JobScraper:
                 cleaned.append(key)
         return cleaned or list(self.DEFAULT_PLATFORMS)
 
-    def scrape_all_sites(
+    def platform_timeout(
+        self, key: str, override: Optional[float] = None
+    ) -> float:
+        if override is not None:
+            return override
+        return self.PLATFORM_TIMEOUTS.get(key, self.DEFAULT_PLATFORM_TIMEOUT)
+
+    def _platform_budget(
+        self, key: str, override: Optional[float], deadline: Optional[float]
+    ) -> float:
+        """Seconds a platform may take: its timeout, capped by the search deadline."""
+        budget = self.platform_timeout(key, override)
+        return budget if deadline is None else min(budget, deadline)
+
+    def _status_entry(
+        self, key: str, status: str, count: int = 0, seconds: Optional[float] = None
+    ) -> Dict[str, str]:
+        entry = {
+            "key": key,
+            "label": self.PLATFORM_LABELS[key],
+            "status": status,
+            "count": str(count),
+        }
+        if seconds is not None:
+            entry["seconds"] = f"{seconds:.2f}"
+        return entry
+
+    def _degraded_entry(self, key: str) -> Dict[str, str]:
+        print(f"  [info] {self.PLATFORM_LABELS[key]} skipped: circuit open")
+        return self._status_entry(key, "degraded")
+
+    def _run_platform(
         self,
+        key: str,
         title: str,
         location: str,
-        max_results_per_site: int = 10,
+        max_results: int,
+        deadline_at: Optional[float] = None,
+    ) -> Tuple[List[Job], Dict[str, str]]:
+        """
+        Run one platform scraper and build its status entry. deadline_at
+        (on the time.monotonic() clock) bounds every request it makes.
+        """
+        flight_key = (
+            key, self._normalise(title), self._normalise(location), max_results
+        )
+        started = time.monotonic()
+        limit = None if deadline_at is None else deadline_at - started
+        try:
+            with search_deadline(limit):
+                results, _shared = self.platform_flights.do(
+                    flight_key,
+                    lambda: self.platform_scrapers[key](title, location, max_results),
+                )
+            results = list(results)
+        except Exception as exc:
+            print(f"  [error] {self.PLATFORM_LABELS[key]} failed: {exc}")
+            return [], self._status_entry(
+                key, "error", seconds=time.monotonic() - started
+            )
+        status = "success" if results else "empty"
+        return results, self._status_entry(
+            key, status, len(results), time.monotonic() - started
+        )
+
+    def probe_platform(
+        self, key: str, title: str, location: str, max_results: int = 5
+    ) -> str:
+        """
+        Scrape one platform outside any search to test whether its circuit
+        can close again; the outcome is reported to self.health.
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="probe")
+        timeout = self.platform_timeout(key)
+        try:
+            future = executor.submit(
+                self._run_platform, key, title, location, max_results,
+                time.monotonic() + timeout,
+            )
+            _results, entry = future.result(timeout=timeout)
+            status, seconds = entry["status"], float(entry["seconds"])
+        except FuturesTimeout:
+            status, seconds = "timeout", timeout
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.health.finish_probe(key, status, seconds)
+        return status
+
+    def iter_platform_results(
+        self,
+        title: str,
+        location: str,
+        max_results: int = 10,
         platforms: Optional[List[str]] = None,
-    ) -> List[Job]:
-        selected = self.resolve_platforms(platforms)
+        platform_timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[str, List[Job], Dict[str, str]]]:
+        """
+        Run the selected platforms on a bounded thread pool and yield
+        (key, jobs, status) for each one as soon as it finishes. Each
+        platform has its own deadline, measured from the start of the
+        search and never later than the overall deadline (seconds); a
+        platform still running when its deadline passes is yielded with a
+        "timeout" status and its late results are discarded. Requests stop
+        retrying at the same deadline.
+        Platforms whose circuit is open are yielded first, as "degraded",
+        without being contacted. Every other outcome is fed to self.health.
+        """
+        query = (title, location)
+        selected = []
+        for key in self.resolve_platforms(platforms):
+            if self.health.allow(key):
+                selected.append(key)
+            else:
+                yield key, [], self._degraded_entry(key)
+        if not selected:
+            return
+        workers = max(1, min(max_workers or self.MAX_WORKERS, len(selected)))
+        started = time.monotonic()
+        deadlines = {
+            key: started + self._platform_budget(key, platform_timeout, deadline)
+            for key in selected
+        }
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="job-scraper"
+        )
+        try:
+            pending = {
+                executor.submit(
+                    copy_context().run, self._run_platform,
+                    key, title, location, max_results, deadlines[key],
+                ): key
+                for key in selected
+            }
+            while pending:
+                next_deadline = min(deadlines[k] for k in pending.values())
+                done, _ = wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    key = pending.pop(future)
+                    results, status = future.result()
+                    self.health.record_statuses([status], query)
+                    yield key, results, status
+
+                now = time.monotonic()
+                for future, key in list(pending.items()):
+                    if deadlines[key] <= now:
+                        del pending[future]
+                        future.cancel()
+                        print(f"  [warn] {self.PLATFORM_LABELS[key]} timed out")
+                        status = self._status_entry(
+                            key, "timeout", seconds=now - started
+                        )
+                        self.health.record_statuses([status], query)
+                        yield key, [], status
+        finally:
+            # Do not wait for stragglers; they finish in the background.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _announce_search(
+        self, title: str, location: str, selected: List[str]
+    ) -> None:
         print(f"\nJob search: '{title}' in '{location}'")
         print("=" * 60)
         print(
@@ -800,65 +1920,114 @@ class JobScraper:
         )
         print("=" * 60)
 
+    def scrape_all_sites(
+        self,
+        title: str,
+        location: str,
+        max_results_per_site: int = 10,
+        platforms: Optional[List[str]] = None,
+        concurrent: bool = False,
+        platform_timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+        on_platform: Optional[Callable[[str, List[Job], Dict[str, str]], None]] = None,
+    ) -> List[Job]:
+        """
+        Scrape every selected platform and return de-duplicated jobs.
+
+        With concurrent=True the platforms run in parallel (see
+        iter_platform_results). Either way requests are only delayed when
+        their host's rate limit is used up, not between platforms.
+
+        deadline (seconds) bounds the whole search: every request, retry
+        and backoff of every platform stops when it runs out, and platforms
+        not reached by then are reported as "timeout".
+
+        on_platform(key, jobs, status) is called as each platform finishes,
+        before de-duplication, so callers can show progress.
+        """
+        selected = self.resolve_platforms(platforms)
+        self._announce_search(title, location, selected)
+
         all_jobs: List[Job] = []
         self.last_run_statuses = []
 
-        for key in selected:
-            scraper_fn = self.platform_scrapers[key]
-            label = self.PLATFORM_LABELS[key]
-            try:
-                results = scraper_fn(title, location, max_results_per_site)
+        if concurrent:
+            outcomes = {}
+            for key, results, status in self.iter_platform_results(
+                title,
+                location,
+                max_results_per_site,
+                platforms=selected,
+                platform_timeout=platform_timeout,
+                max_workers=max_workers,
+                deadline=deadline,
+            ):
+                outcomes[key] = (results, status)
+                if on_platform is not None:
+                    on_platform(key, results, status)
+            # Keep the platform order stable regardless of completion order
+            for key in selected:
+                results, status = outcomes[key]
                 all_jobs.extend(results)
-                self.last_run_statuses.append(
-                    {
-                        "key": key,
-                        "label": label,
-                        "status": "success" if results else "empty",
-                        "count": str(len(results)),
-                    }
-                )
-            except Exception as exc:
-                print(f"  [error] {label} failed: {exc}")
-                self.last_run_statuses.append(
-                    {"key": key, "label": label, "status": "error", "count": "0"}
-                )
-            self._add_delay()
-
-        # De-duplicate by (normalised title, company, location) key
-        unique: List[Job] = []
-        seen: set = set()
-        for job in all_jobs:
-            k = (
-                self._clean(job.title).lower(),
-                self._clean(job.company).lower(),
-                self._clean(job.location).lower(),
-            )
-            if k[0] and k[1] and k not in seen:
-                seen.add(k)
-                unique.append(job)
+                self.last_run_statuses.append(status)
+        else:
+            deadline_at = None if deadline is None else time.monotonic() + deadline
+            for key in selected:
+                results: List[Job] = []
+                if not self.health.allow(key):
+                    status = self._degraded_entry(key)
+                elif deadline_at is not None and time.monotonic() >= deadline_at:
+                    print(f"  [warn] {self.PLATFORM_LABELS[key]} skipped: search deadline reached")
+                    status = self._status_entry(key, "timeout")
+                else:
+                    results, status = self._run_platform(
+                        key, title, location, max_results_per_site, deadline_at
+                    )
+                    self.health.record_statuses([status], (title, location))
+                    all_jobs.extend(results)
+                self.last_run_statuses.append(status)
+                if on_platform is not None:
+                    on_platform(key, results, status)
+
+        return self._dedupe_jobs(all_jobs)
+
+    def take_unique(self, jobs: List[Job], seen: Deduper) -> List[Job]:
+        """
+        Jobs that are not duplicates or near-duplicates of a job already
+        added to seen, which is updated in place. Jobs without a title or
+        company are dropped.
+        """
+        return [job for job in jobs if seen.add(job)]
+
+    def _dedupe_jobs(self, all_jobs: List[Job]) -> List[Job]:
+        # Near-duplicates across platforms collapse into their richest record
+        unique = dedupe_jobs(all_jobs)
 
         print(f"\nTotal unique jobs found: {len(unique)}")
         return unique
 
     # ---- Filtering ----------------------------------------------------------
 
-    def filter_latest_jobs(self, jobs: List[Job], days: int = 7) -> List[Job]:
+    def filter_latest_jobs(
+        self,
+        jobs: Union[List[Job], RecencyIndex],
+        days: int = 7,
+        now: Optional[float] = None,
+    ) -> List[Job]:
         """
-        Heuristic filter: keep jobs whose posted_date string contains recency
-        keywords, since date formats vary wildly across platforms.
-        Pass days=0 to skip filtering entirely.
+        Jobs posted within the last `days` days, newest first, by the
+        posted_ts parsed at ingest. Jobs whose posting date is unknown are
+        kept (after the dated ones). Pass days=0 to skip filtering entirely.
+
+        Pass a RecencyIndex to filter a large cached set repeatedly: the
+        cutoff is then a binary search instead of a sort.
         """
+        if isinstance(jobs, RecencyIndex):
+            return jobs.within_days(days, now)
         if days <= 0:
             return jobs
-        recent_kw = [
-            "today", "yesterday", "hour", "day", "week",
-            "recent", "new", "ago", "posted", "just",
-        ]
-        return [
-            job for job in jobs
-            if not job.posted_date
-            or any(kw in self._clean(job.posted_date).lower() for kw in recent_kw)
-        ]
+        return RecencyIndex(jobs).within_days(days, now)
 
     # ---- Export helpers -----------------------------------------------------
 
@@ -924,7 +2093,7 @@ def main() -> None:
     )
 
     scraper   = JobScraper()
-    all_jobs  = scraper.scrape_all_sites(title, location, max_results)
+    all_jobs  = scraper.scrape_all_sites(title, location, max_results, concurrent=True)
     to_display = (
         scraper.filter_latest_jobs(all_jobs, latest_days)
         if latest_days > 0
@@ -951,7 +2120,9 @@ def main() -> None:
     # Print per-platform status summary
     print("\n--- Platform summary ---")
     for st in scraper.last_run_statuses:
-        icon = {"success": "✓", "empty": "○", "error": "✗"}.get(st["status"], "?")
+        icon = {
+            "success": "✓", "empty": "○", "error": "✗", "timeout": "⏱", "degraded": "⊘",
+        }.get(st["status"], "?")
         print(f"  {icon} {st['label']:<15} {st['count']} result(s)")
 
 
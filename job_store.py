@@ -0,0 +1,373 @@
+"""
+Persistent job store
+====================
+Every scraped Job is upserted into a local SQLite database so that repeat
+searches can be answered without scraping again, and so results survive
+restarts and are shared between web workers.
+
+  - one row per dedupe.job_key (normalised title, company, location), the
+    key the scraper de-duplicates on, refreshed in place on every re-scrape
+  - title and location are indexed in an FTS5 trigram table, so the
+    substring matching of a search is an index lookup rather than a LIKE
+    scan, and an index on the recency order lets the newest matches stream
+    out without sorting the table (SQLite builds without FTS5 trigrams fall
+    back to LIKE)
+  - prune() drops jobs not seen for a while; the app schedules it
+  - writes go through executemany in fixed-size batches, reads stream with
+    fetchmany, so memory stays bounded however large the table grows
+  - the searches table records when each search was last scraped live, and
+    with which platform statuses, to decide whether the store is fresh
+    enough to answer it
+  - WAL journaling and one connection per thread: readers never block the
+    writer and the store can be used from the search worker pool directly
+  - nothing touches the disk until the store is first used, so creating a
+    JobStore (e.g. when the app module is imported) opens no database
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dedupe import job_key
+from feed_index import REMOTE_ALIASES, query_tokens
+from job_automation import Job
+from posted_dates import parse_posted
+from text_normalize import normalize_text
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY,
+    title_norm    TEXT NOT NULL,
+    company_norm  TEXT NOT NULL,
+    location_norm TEXT NOT NULL,
+    source        TEXT NOT NULL,
+    title         TEXT NOT NULL,
+    company       TEXT NOT NULL,
+    location      TEXT NOT NULL,
+    link          TEXT NOT NULL,
+    posted_date   TEXT NOT NULL DEFAULT '',
+    posted_ts     REAL,
+    salary        TEXT NOT NULL DEFAULT '',
+    description   TEXT NOT NULL DEFAULT '',
+    first_seen    REAL NOT NULL,
+    last_seen     REAL NOT NULL,
+    UNIQUE (title_norm, company_norm, location_norm)
+);
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company_norm);
+CREATE INDEX IF NOT EXISTS jobs_location ON jobs (location_norm);
+-- Matches the ORDER BY of iter_search
+CREATE INDEX IF NOT EXISTS jobs_recency
+    ON jobs (posted_ts IS NULL, posted_ts DESC, last_seen DESC);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+
+CREATE TABLE IF NOT EXISTS searches (
+    key          TEXT PRIMARY KEY,
+    title        TEXT NOT NULL,
+    location     TEXT NOT NULL,
+    statuses     TEXT NOT NULL,
+    job_count    INTEGER NOT NULL,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+# Kept in step with jobs by triggers; rowid is jobs.id
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, location, content='jobs', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, location)
+    VALUES (new.id, new.title, new.location);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, location)
+    VALUES ('delete', old.id, old.title, old.location);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, location ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, location)
+    VALUES ('delete', old.id, old.title, old.location);
+    INSERT INTO jobs_fts (rowid, title, location)
+    VALUES (new.id, new.title, new.location);
+END;
+"""
+
+# Version 2 keys rows on dedupe.job_key; older stores are emptied on open
+_SCHEMA_VERSION = 2
+
+# Trigram search needs at least this many characters per term
+_FTS_MIN_TERM = 3
+
+_UPSERT = """
+INSERT INTO jobs (
+    title_norm, company_norm, location_norm, source, title, company,
+    location, link, posted_date, posted_ts, salary, description,
+    first_seen, last_seen
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (title_norm, company_norm, location_norm) DO UPDATE SET
+    source      = excluded.source,
+    title       = excluded.title,
+    company     = excluded.company,
+    location    = excluded.location,
+    link        = excluded.link,
+    posted_date = excluded.posted_date,
+    posted_ts   = COALESCE(excluded.posted_ts, jobs.posted_ts),
+    salary      = CASE WHEN excluded.salary != '' THEN excluded.salary ELSE jobs.salary END,
+    description = CASE WHEN excluded.description != ''
+                       THEN excluded.description ELSE jobs.description END,
+    last_seen   = excluded.last_seen
+"""
+
+_JOB_COLUMNS = (
+    "title, company, location, link, source, posted_date, salary, description, "
+    "posted_ts"
+)
+
+
+def _norm(value: str) -> str:
+    return normalize_text(value).lower()
+
+
+def _phrase(fragment: str) -> str:
+    return '"' + fragment.replace('"', '""') + '"'
+
+
+def _like(fragment: str) -> str:
+    escaped = (
+        fragment.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return f"%{escaped}%"
+
+
+class JobStore:
+    BATCH_SIZE = 500
+    FETCH_SIZE = 200
+
+    def __init__(self, path: str, batch_size: Optional[int] = None) -> None:
+        self.path = path
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self._local = threading.local()
+        self.fts = True
+        self._ready = False
+        self._setup_lock = threading.Lock()
+
+    def _setup(self, conn: sqlite3.Connection) -> None:
+        with conn:
+            self._migrate(conn)
+            conn.executescript(_SCHEMA)
+            try:
+                conn.executescript(_FTS_SCHEMA)
+            except sqlite3.OperationalError as exc:
+                print(f"  [warn] job store search without FTS5 trigrams: {exc}")
+                self.fts = False
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+        ).fetchone()
+        if version >= _SCHEMA_VERSION or not exists:
+            return
+        # Rows keyed the old way would never be refreshed again; the store
+        # refills from the next scrapes
+        print(f"  [info] job store {self.path!r} predates schema {_SCHEMA_VERSION}; emptying it")
+        conn.executescript(
+            "DROP TABLE IF EXISTS jobs_fts; DROP TABLE IF EXISTS jobs; "
+            "DROP TABLE IF EXISTS searches;"
+        )
+
+    # ---- Connections ------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._ready:
+            # The first use creates or migrates the schema
+            with self._setup_lock:
+                if not self._ready:
+                    self._setup(conn)
+                    self._ready = True
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ---- Writes -----------------------------------------------------------
+
+    def _row(self, job: Job, now: float) -> Tuple[Any, ...]:
+        return (
+            *job_key(job),
+            job.source, job.title, job.company, job.location, job.link,
+            job.posted_date or "",
+            job.posted_ts if job.posted_ts is not None else parse_posted(job.posted_date),
+            job.salary or "", job.description or "", now, now,
+        )
+
+    def upsert_many(self, jobs: Iterable[Job]) -> int:
+        """Insert or refresh jobs in batches; returns the number written."""
+        conn = self._connect()
+        now = time.time()
+        written = 0
+        batch: List[Tuple[Any, ...]] = []
+        for job in jobs:
+            batch.append(self._row(job, now))
+            if len(batch) >= self.batch_size:
+                with conn:
+                    conn.executemany(_UPSERT, batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            with conn:
+                conn.executemany(_UPSERT, batch)
+            written += len(batch)
+        return written
+
+    def record_search(
+        self,
+        key: str,
+        title: str,
+        location: str,
+        statuses: List[Dict[str, Any]],
+        job_count: int,
+    ) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO searches "
+                "(key, title, location, statuses, job_count, refreshed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, title, location, json.dumps(statuses), job_count, time.time()),
+            )
+
+    def prune(self, older_than: float) -> int:
+        """
+        Delete jobs not seen in the last older_than seconds, and the
+        records of searches last scraped before then; returns the number
+        of jobs deleted.
+        """
+        conn = self._connect()
+        cutoff = time.time() - older_than
+        with conn:
+            cur = conn.execute("DELETE FROM jobs WHERE last_seen < ?", (cutoff,))
+            conn.execute("DELETE FROM searches WHERE refreshed_at < ?", (cutoff,))
+        return cur.rowcount
+
+    # ---- Reads ------------------------------------------------------------
+
+    def last_search(self, key: str) -> Optional[Dict[str, Any]]:
+        """The recorded live scrape for key, with its age in seconds."""
+        row = self._connect().execute(
+            "SELECT statuses, job_count, refreshed_at FROM searches WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        statuses, job_count, refreshed_at = row
+        return {
+            "platform_statuses": json.loads(statuses),
+            "job_count": job_count,
+            "age": time.time() - refreshed_at,
+        }
+
+    def iter_search(
+        self,
+        title: str,
+        location: str,
+        sources: Optional[List[str]] = None,
+        seen_within: Optional[float] = None,
+    ) -> Iterator[Job]:
+        """
+        Stream stored jobs matching a search, newest first. Title and
+        location matching follow JobScraper._tokens_match and
+        _location_match: every query token is a substring of the title and
+        the location matches or is remote.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        terms: List[str] = []
+        for token in query_tokens(title):
+            if self.fts and len(token) >= _FTS_MIN_TERM:
+                terms.append(f"title : {_phrase(token)}")
+            else:
+                clauses.append("lower(title) LIKE ? ESCAPE '\\'")
+                params.append(_like(token))
+
+        req = _norm(location)
+        if req in REMOTE_ALIASES:
+            places = ["remote", "worldwide"]
+        elif req:
+            places = [req, "remote"]
+        else:
+            places = []
+        if places and self.fts and all(len(p) >= _FTS_MIN_TERM for p in places):
+            terms.append(f"location : ({' OR '.join(_phrase(p) for p in places)})")
+        elif places:
+            clauses.append(
+                "(" + " OR ".join("lower(location) LIKE ? ESCAPE '\\'" for _ in places) + ")"
+            )
+            params.extend(_like(p) for p in places)
+
+        if terms:
+            clauses.insert(0, "id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.insert(0, " AND ".join(terms))
+
+        if sources:
+            clauses.append(f"source IN ({', '.join('?' for _ in sources)})")
+            params.extend(sources)
+        if seen_within is not None:
+            clauses.append("last_seen >= ?")
+            params.append(time.time() - seen_within)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cur = self._connect().execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs {where} "
+            "ORDER BY posted_ts IS NULL, posted_ts DESC, last_seen DESC",
+            params,
+        )
+        try:
+            while True:
+                rows = cur.fetchmany(self.FETCH_SIZE)
+                if not rows:
+                    return
+                for row in rows:
+                    yield Job(*row)
+        finally:
+            cur.close()
+
+    def search(
+        self,
+        title: str,
+        location: str,
+        limit: int = 50,
+        sources: Optional[List[str]] = None,
+        seen_within: Optional[float] = None,
+    ) -> List[Job]:
+        jobs: List[Job] = []
+        for job in self.iter_search(title, location, sources, seen_within):
+            jobs.append(job)
+            if len(jobs) >= limit:
+                break
+        return jobs
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        jobs = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        searches = conn.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+        by_source = dict(
+            conn.execute("SELECT source, COUNT(*) FROM jobs GROUP BY source").fetchall()
+        )
+        return {
+            "path": self.path, "fts": self.fts, "jobs": jobs, "searches": searches,
+            "by_source": by_source,
+        }
@@ -0,0 +1,266 @@
+"""
+Streaming JSON array reader
+===========================
+RemoteOK and Arbeitnow answer with one multi-megabyte JSON document, and
+resp.json() holds the whole body plus every decoded item at once. A search
+that only needs its first max_results matches does not need any of that.
+
+ArrayItemParser is a push parser: feed() it the body as it arrives (bytes
+or text, in chunks of any size) and it hands back each item of the target
+array as soon as the item is complete. The array is either the document
+itself (path=()) or found by following object keys (path=("data",) for
+{"data": [...], "links": ...}). Only the item being decoded is buffered,
+so memory is bounded by the largest single item rather than the payload,
+and the caller can stop reading (and drop the connection) at any point.
+A malformed item raises ValueError as soon as text past the error has
+arrived, and an item that grows beyond max_item_chars raises too, so a
+broken document never makes the parser buffer the rest of the body.
+
+Items are decoded with json.JSONDecoder.raw_decode, so each one comes out
+exactly as json.loads would produce it. Values of other keys met on the
+way to the array are scanned past (strings, nesting and scalars tracked,
+nothing decoded) and their text is dropped as it is read, so a large
+sibling such as {"meta": {...}, "data": [...]} costs no memory either;
+everything after the array is never read.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, List, Sequence, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = " \t\n\r,]}"
+
+# Parser states
+_OPEN = "open"            # next container on the path ({ or the target [)
+_KEY = "key"              # an object key, or } when the key is missing
+_COLON = "colon"
+_SKIP = "skip"            # a value that is not on the path
+_NEXT_KEY = "next_key"    # , or } after a skipped value
+_FIRST = "first"          # first array item, or ] for an empty array
+_ITEM = "item"
+_SEPARATOR = "separator"  # , or ] after an item
+_DONE = "done"
+
+_MORE = object()  # the buffer ends inside the current value
+
+# What may still follow a number decoded at the end of the buffer ("2." of "2.5e3")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+# Longest token a chunk boundary can cut before raw_decode notices
+_PARTIAL_TOKEN = len("-Infinity") + 1
+
+# Far beyond any single job posting
+MAX_ITEM_CHARS = 4 * 1024 * 1024
+
+
+class ArrayItemParser:
+    def __init__(
+        self, path: Sequence[str] = (), max_item_chars: int = MAX_ITEM_CHARS
+    ) -> None:
+        self.path = tuple(path)
+        self.max_item_chars = max_item_chars
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._key = ""
+        self._state = _OPEN
+        self._eof = False
+        self._started = False
+        # (depth, inside a string, after a backslash) of the value being skipped
+        self._skip = (0, False, False)
+
+    @property
+    def done(self) -> bool:
+        """True once the target array (or the object that lacks it) has closed."""
+        return self._state == _DONE
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Any]:
+        """Add the next piece of the body; return the items it completed."""
+        if self._state == _DONE:
+            return []
+        if isinstance(chunk, bytes):
+            chunk = self._text.decode(chunk)
+        if not self._started:
+            chunk = chunk.lstrip("\ufeff")
+            self._started = bool(chunk)
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """
+        Mark the end of the body and return any last items. Raises
+        ValueError if the document ended before the target array did.
+        """
+        if self._state == _DONE:
+            return []
+        self._buf = self._buf[self._pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        items = self._parse()
+        if self._state != _DONE:
+            raise ValueError("JSON document ended inside the array")
+        return items
+
+    # ---- Parsing ------------------------------------------------------------
+
+    def _skip_whitespace(self) -> bool:
+        self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+        return self._pos < len(self._buf)
+
+    def _value(self) -> Any:
+        """Decode the value at the cursor, or _MORE if it is not complete yet."""
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as exc:
+            # Running out of text fails near the end of the buffer (inside
+            # "-Infinity" or a \uXXXX escape at most), or at the opening
+            # quote of a string that is still arriving; an error anywhere
+            # else is in text already received and will not go away
+            truncated = (
+                len(self._buf) - exc.pos < _PARTIAL_TOKEN
+                or exc.msg.startswith("Unterminated string")
+            )
+            if self._eof or not truncated:
+                raise
+            return self._incomplete()
+        # A number is only complete once a delimiter follows it ("2." may
+        # still become "2.5e3" with the next chunk)
+        if (
+            not self._eof
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and (end == len(self._buf) or self._buf[end] not in _DELIMITERS)
+        ):
+            if not _NUMBER_TAIL.match(self._buf, end):
+                raise ValueError(
+                    f"malformed number {self._buf[self._pos:end + 1]!r}"
+                )
+            return self._incomplete()
+        self._pos = end
+        return value
+
+    def _incomplete(self) -> Any:
+        """_MORE, unless the value has outgrown max_item_chars."""
+        if len(self._buf) - self._pos > self.max_item_chars:
+            raise ValueError(
+                f"JSON value longer than {self.max_item_chars} characters"
+            )
+        return _MORE
+
+    def _skip_value(self) -> bool:
+        """
+        Move the cursor past the value being skipped; False if the buffer
+        ends inside it (what was scanned is dropped by the next feed()).
+        """
+        buf, i, end = self._buf, self._pos, len(self._buf)
+        depth, in_string, escaped = self._skip
+        while i < end:
+            char = buf[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                    if depth == 0:
+                        i += 1
+                        break
+            elif char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                if depth == 0:
+                    break  # a scalar ended by its object's closing brace
+                depth -= 1
+                if depth == 0:
+                    i += 1
+                    break
+            elif depth == 0 and char in _DELIMITERS:
+                break  # a scalar ended by , or whitespace
+            i += 1
+        else:
+            self._pos = i
+            self._skip = (depth, in_string, escaped)
+            # A scalar may end with the document
+            return self._eof and depth == 0 and not in_string
+        self._pos = i
+        self._skip = (0, False, False)
+        return True
+
+    def _expect(self, char: str) -> None:
+        found = self._buf[self._pos]
+        if found != char:
+            raise ValueError(
+                f"expected {char!r} but found {found!r} while looking for "
+                f"{'/'.join(self.path) or 'the top-level array'}"
+            )
+        self._pos += 1
+
+    def _parse(self) -> List[Any]:
+        items: List[Any] = []
+        while self._state != _DONE and self._skip_whitespace():
+            state = self._state
+            char = self._buf[self._pos]
+
+            if state == _OPEN:
+                if self._depth == len(self.path):
+                    self._expect("[")
+                    self._state = _FIRST
+                else:
+                    self._expect("{")
+                    self._state = _KEY
+            elif state == _KEY:
+                if char == "}":
+                    self._state = _DONE  # no such key: an empty result
+                    break
+                key = self._value()
+                if key is _MORE:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError(f"object key expected, found {key!r}")
+                self._key = key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(":")
+                if self._key == self.path[self._depth]:
+                    self._depth += 1
+                    self._state = _OPEN
+                else:
+                    self._state = _SKIP
+            elif state == _SKIP:
+                if not self._skip_value():
+                    break
+                self._state = _NEXT_KEY
+            elif state == _NEXT_KEY:
+                if char == "}":
+                    self._state = _DONE
+                    break
+                self._expect(",")
+                self._state = _KEY
+            elif state in (_FIRST, _ITEM):
+                if state == _FIRST and char == "]":
+                    self._state = _DONE
+                    break
+                item = self._value()
+                if item is _MORE:
+                    break
+                items.append(item)
+                self._state = _SEPARATOR
+            elif state == _SEPARATOR:
+                if char == "]":
+                    self._state = _DONE
+                    break
+                self._expect(",")
+                self._state = _ITEM
+
+        if self._state == _DONE:
+            # Whatever follows the array is never needed
+            self._buf, self._pos = "", 0
+        return items
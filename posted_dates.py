@@ -0,0 +1,163 @@
+"""
+Posted dates
+============
+Every platform reports when a job was posted in its own format:
+
+  - RemoteOK     epoch seconds ("epoch") and ISO 8601 ("date")
+  - Arbeitnow    epoch seconds ("created_at")
+  - The Muse     ISO 8601 with a Z suffix ("publication_date")
+  - Himalayas    epoch seconds or milliseconds ("publishedAt")
+  - Jobicy       "YYYY-MM-DD HH:MM:SS" in UTC ("pubDate")
+  - LinkedIn     a <time datetime="YYYY-MM-DD"> plus "2 days ago" text
+  - Internshala  relative text ("Just now", "3 days ago", "1 week ago")
+
+parse_posted() turns any of them into a UTC epoch timestamp once, when the
+Job is created, so recency filtering and sorting are numeric.
+RecencyIndex keeps a result set ordered newest first, so "posted in the
+last N days" is a binary search instead of a scan.
+"""
+
+import re
+import time
+from bisect import bisect_right
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # job_automation imports this module
+    from job_automation import Job
+
+DAY = 86400.0
+
+_UNIT_SECONDS = {
+    "second": 1.0, "sec": 1.0, "minute": 60.0, "min": 60.0, "hour": 3600.0,
+    "hr": 3600.0, "day": DAY, "week": 7 * DAY, "month": 30 * DAY, "year": 365 * DAY,
+}
+_RELATIVE_RE = re.compile(
+    r"(\d+|an?|few|one)\+?\s*(second|sec|minute|min|hour|hr|day|week|month|year)s?\b"
+)
+_JUST_NOW = ("just now", "just posted", "moments ago", "today", "few hours ago")
+
+
+def parse_epoch(value: Any, now: float) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        text = str(value).strip()
+        if not text.replace(".", "", 1).isdigit():
+            return None
+        number = float(text)
+    # Millisecond timestamps are common in JSON feeds
+    if number > 1e11:
+        number /= 1000.0
+    return number if number > 0 else None
+
+
+def parse_iso(value: Any, now: float) -> Optional[float]:
+    text = str(value).strip()
+    if not text or not text[:4].isdigit():
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def parse_rfc2822(value: Any, now: float) -> Optional[float]:
+    try:
+        parsed = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def parse_relative(value: Any, now: float) -> Optional[float]:
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    if text.startswith("yesterday"):
+        return now - DAY
+    if any(phrase in text for phrase in _JUST_NOW):
+        return now
+    match = _RELATIVE_RE.search(text)
+    if match is None:
+        return None
+    amount, unit = match.groups()
+    if amount.isdigit():
+        count = int(amount)
+    else:
+        count = 3 if amount == "few" else 1
+    return now - count * _UNIT_SECONDS[unit]
+
+
+Parser = Callable[[Any, float], Optional[float]]
+
+_ABSOLUTE: Tuple[Parser, ...] = (parse_epoch, parse_iso, parse_rfc2822)
+
+# Most likely format first; every platform falls back to the others
+PLATFORM_PARSERS: Dict[str, Tuple[Parser, ...]] = {
+    "remoteok": (parse_epoch, parse_iso),
+    "arbeitnow": (parse_epoch,),
+    "themuse": (parse_iso,),
+    "himalayas": (parse_epoch, parse_iso),
+    "jobicy": (parse_iso, parse_rfc2822),
+    "linkedin": (parse_iso, parse_relative),
+    "internshala": (parse_relative,),
+}
+_FALLBACK: Tuple[Parser, ...] = _ABSOLUTE + (parse_relative,)
+
+
+def parse_posted(
+    value: Any, platform: str = "", now: Optional[float] = None
+) -> Optional[float]:
+    """UTC epoch seconds a job was posted, or None if value is not a date."""
+    if value is None or value == "":
+        return None
+    now = time.time() if now is None else now
+    preferred = PLATFORM_PARSERS.get(platform, ())
+    for parser in preferred + tuple(p for p in _FALLBACK if p not in preferred):
+        stamp = parser(value, now)
+        if stamp is not None:
+            return stamp
+    return None
+
+
+class RecencyIndex:
+    """
+    Jobs ordered newest first by posted_ts (ties keep their input order),
+    with undated jobs after the dated ones in their input order.
+    """
+
+    def __init__(self, jobs: Sequence["Job"]) -> None:
+        dated = [job for job in jobs if job.posted_ts is not None]
+        dated.sort(key=lambda job: -job.posted_ts)
+        self._dated = dated
+        self._keys = [-job.posted_ts for job in dated]
+        self._undated = [job for job in jobs if job.posted_ts is None]
+
+    def __len__(self) -> int:
+        return len(self._dated) + len(self._undated)
+
+    def newest_first(self) -> List["Job"]:
+        return self._dated + self._undated
+
+    def since(self, cutoff: float, include_undated: bool = True) -> List["Job"]:
+        """Jobs posted at or after cutoff, newest first."""
+        recent = self._dated[:bisect_right(self._keys, -cutoff)]
+        return recent + self._undated if include_undated else recent
+
+    def within_days(self, days: int, now: Optional[float] = None) -> List["Job"]:
+        """Jobs posted in the last `days` days plus undated ones; all if days <= 0."""
+        if days <= 0:
+            return self.newest_first()
+        now = time.time() if now is None else now
+        return self.since(now - days * DAY)
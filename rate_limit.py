@@ -0,0 +1,147 @@
+"""
+Per-host rate limiting
+======================
+A process-wide token bucket per upstream host. Every request takes one
+token; tokens refill at the host's rate up to its burst size, so a single
+search goes out without any pause and the limiter only delays requests once
+a host's budget is actually used up - typically when several searches hit
+the same site at the same time.
+
+reserve() never blocks: it books a token and returns how long the caller
+must wait before sending, which lets the thread-based scraper sleep and the
+asyncio scraper await on the same buckets. Bookings beyond the available
+tokens queue up behind each other, so the aggregate rate per host stays at
+its configured limit however many searches are running.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+
+class Rate(NamedTuple):
+    per_second: float
+    burst: int
+
+
+# JSON APIs tolerate far more than the HTML sites; LinkedIn is the one
+# that blocks, so it gets the tightest budget.
+HOST_RATES: Dict[str, Rate] = {
+    "www.linkedin.com":  Rate(0.5, 2),
+    "internshala.com":   Rate(1.0, 3),
+    "remoteok.com":      Rate(1.0, 2),
+    "www.arbeitnow.com": Rate(2.0, 4),
+    "www.themuse.com":   Rate(4.0, 8),
+    "himalayas.app":     Rate(2.0, 4),
+    "jobicy.com":        Rate(1.0, 3),
+}
+DEFAULT_RATE = Rate(2.0, 4)
+
+
+class _Bucket:
+    __slots__ = ("rate", "tokens", "updated", "requests", "delayed", "waited", "rejected")
+
+    def __init__(self, rate: Rate, now: float) -> None:
+        self.rate = rate
+        self.tokens = float(rate.burst)
+        self.updated = now
+        self.requests = 0
+        self.delayed = 0
+        self.waited = 0.0
+        self.rejected = 0
+
+    def reserve(self, now: float, max_wait: Optional[float]) -> Optional[float]:
+        per_second, burst = self.rate
+        if per_second <= 0:
+            self.requests += 1
+            return 0.0
+        self.tokens = min(float(burst), self.tokens + (now - self.updated) * per_second)
+        self.updated = now
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / per_second
+        if max_wait is not None and wait > max_wait:
+            self.rejected += 1
+            return None
+        self.tokens -= 1
+        self.requests += 1
+        if wait > 0:
+            self.delayed += 1
+            self.waited += wait
+        return wait
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rates: Optional[Mapping[str, Rate]] = None,
+        default: Rate = DEFAULT_RATE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rates: Dict[str, Rate] = dict(rates or {})
+        self.default = default
+        self._clock = clock
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def configure(
+        self,
+        host: str,
+        per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            current = self.rates.get(host, self.default)
+            rate = Rate(
+                current.per_second if per_second is None else per_second,
+                current.burst if burst is None else max(1, burst),
+            )
+            self.rates[host] = rate
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                bucket.rate = rate
+                bucket.tokens = min(bucket.tokens, float(rate.burst))
+
+    def reserve(self, url: str, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Book one request to url's host and return the seconds to wait before
+        sending it, or None (booking nothing) if that would exceed max_wait.
+        """
+        host = self.host(url)
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = _Bucket(
+                    self.rates.get(host, self.default), now
+                )
+            return bucket.reserve(now, max_wait)
+
+    def acquire(self, url: str, max_wait: Optional[float] = None) -> bool:
+        """Blocking reserve(): sleep out the wait; False if it was too long."""
+        wait = self.reserve(url, max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                host: {
+                    "per_second": bucket.rate.per_second,
+                    "burst": bucket.rate.burst,
+                    "requests": bucket.requests,
+                    "delayed": bucket.delayed,
+                    "waited_s": round(bucket.waited, 3),
+                    "rejected": bucket.rejected,
+                }
+                for host, bucket in self._buckets.items()
+            }
+
+
+RATE_LIMITER = RateLimiter(HOST_RATES)
@@ -0,0 +1,385 @@
+"""
+Request policy
+==============
+How the scrapers send each GET:
+
+  - retries: a connection error, 429 or 5xx is retried up to max_attempts
+    times with full-jitter exponential backoff; a Retry-After header (in
+    seconds or as an HTTP date) replaces the backoff when it is longer
+  - hedging: for idempotent GETs to hosts that opt in, a duplicate request
+    is sent once the first has been outstanding longer than the host's
+    recent hedge_percentile latency, and whichever answers first is used.
+    Hedged requests run on a shared thread pool, but only as many as it
+    can start at once (and at most hedge_host_limit per host): any other
+    request is sent unhedged on the caller's thread instead of queueing
+  - deadline: a search sets an overall deadline (search_deadline()) that
+    every attempt, backoff sleep and hedge respects; attempts are cut
+    short to the time left and no retry starts once it has run out
+
+The deadline lives in a context variable, so it follows the search into
+asyncio tasks automatically and into worker threads through
+contextvars.copy_context() (see JobScraper.iter_platform_results).
+
+The policy only makes decisions and keeps statistics; the scrapers do the
+sending, so the same policy drives the requests and aiohttp scrapers.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, Iterator, List, Mapping, Optional,
+)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("search_deadline", default=None)
+
+
+# ---------------------------------------------------------------------------
+# Search deadline
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def search_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Run the block under a deadline seconds from now (None: no new limit).
+    A deadline already in force that ends earlier is kept.
+    """
+    if seconds is None:
+        yield
+        return
+    deadline_at = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    if current is not None:
+        deadline_at = min(current, deadline_at)
+    token = _DEADLINE.set(deadline_at)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def time_left() -> Optional[float]:
+    """Seconds until the current search deadline, or None without one."""
+    deadline_at = _DEADLINE.get()
+    if deadline_at is None:
+        return None
+    return deadline_at - time.monotonic()
+
+
+def retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Seconds requested by a Retry-After header, if it has a usable one."""
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+# ---------------------------------------------------------------------------
+# Latency tracking
+# ---------------------------------------------------------------------------
+
+class LatencyTracker:
+    """Recent successful response times per host."""
+
+    def __init__(self, window: int = 50) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, host: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, host: str, p: float, min_samples: int) -> Optional[float]:
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None or len(samples) < min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+# ---------------------------------------------------------------------------
+# Policy
+# ---------------------------------------------------------------------------
+
+# Threads for hedged requests (the first request and its duplicate). Each
+# hedged request reserves two of them up front, so none ever waits for one.
+_HEDGE_WORKERS = 16
+_HEDGE_POOL = ThreadPoolExecutor(max_workers=_HEDGE_WORKERS, thread_name_prefix="hedge")
+_HEDGE_SLOTS = threading.BoundedSemaphore(_HEDGE_WORKERS // 2)
+
+
+def _close(resp: Any) -> None:
+    if resp is not None:
+        resp.close()
+
+
+def _close_result(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        _close(future.result())
+
+
+def _succeeded(resp: Any) -> bool:
+    return resp is not None and resp.status_code not in RETRY_STATUSES
+
+
+class RequestPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_retry_after: float = 30.0,
+        hedge_percentile: float = 0.9,
+        hedge_min_samples: int = 20,
+        hedge_host_limit: int = 4,
+        hedging: bool = True,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_host_limit = hedge_host_limit
+        self.hedging = hedging
+        self.latency = LatencyTracker()
+        self._lock = threading.Lock()
+        # Hedgeable requests on the pool right now, per host
+        self._hedging: Dict[str, int] = {}
+        self._stats = {
+            "attempts": 0, "retries": 0, "hedged": 0, "hedge_wins": 0,
+            "hedge_pool_busy": 0, "out_of_time": 0,
+        }
+
+    def configure(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedging: Optional[bool] = None,
+    ) -> None:
+        with self._lock:
+            if max_attempts is not None:
+                self.max_attempts = max_attempts
+            if base_delay is not None:
+                self.base_delay = base_delay
+            if max_delay is not None:
+                self.max_delay = max_delay
+            if hedge_percentile is not None:
+                self.hedge_percentile = hedge_percentile
+            if hedging is not None:
+                self.hedging = hedging
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    # ---- Decisions ----------------------------------------------------------
+
+    def attempt_timeout(self, timeout: float) -> Optional[float]:
+        """Timeout for the next attempt, or None if the deadline has passed."""
+        left = time_left()
+        if left is None:
+            return timeout
+        if left <= 0:
+            self._count("out_of_time")
+            return None
+        return min(timeout, left)
+
+    def retry_delay(self, attempt: int, resp: Any) -> Optional[float]:
+        """
+        Seconds to wait before retrying after attempt (0-based) returned
+        resp (None for a connection error); None when there is no retry.
+        """
+        if _succeeded(resp) or attempt + 1 >= self.max_attempts:
+            return None
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, cap)
+        asked = retry_after(resp.headers) if resp is not None else None
+        if asked is not None:
+            if asked > self.max_retry_after:
+                return None
+            delay = max(delay, asked)
+        left = time_left()
+        if left is not None and delay >= left:
+            self._count("out_of_time")
+            return None
+        self._count("retries")
+        return delay
+
+    def hedge_after(self, host: str, timeout: float) -> Optional[float]:
+        """When to send a duplicate request to host, if hedging applies."""
+        if not self.hedging:
+            return None
+        after = self.latency.percentile(host, self.hedge_percentile, self.hedge_min_samples)
+        if after is None or after >= timeout:
+            return None
+        return after
+
+    def _reserve(self, host: str) -> bool:
+        """Claim pool threads for one hedgeable request to host, if free now."""
+        with self._lock:
+            if self._hedging.get(host, 0) >= self.hedge_host_limit:
+                self._stats["hedge_pool_busy"] += 1
+                return False
+            if not _HEDGE_SLOTS.acquire(blocking=False):
+                self._stats["hedge_pool_busy"] += 1
+                return False
+            self._hedging[host] = self._hedging.get(host, 0) + 1
+            return True
+
+    def _release_after(self, host: str, futures: List[Future]) -> None:
+        """Give back a reservation once every request it started has finished."""
+        left = [len(futures)]
+        lock = threading.Lock()
+
+        def finished(_future: Future) -> None:
+            with lock:
+                left[0] -= 1
+                if left[0]:
+                    return
+            with self._lock:
+                self._hedging[host] -= 1
+            _HEDGE_SLOTS.release()
+
+        for future in futures:
+            future.add_done_callback(finished)
+
+    def _timed(self, host: str, send: Callable[[float], Any], timeout: float) -> Any:
+        started = time.monotonic()
+        resp = send(timeout)
+        if _succeeded(resp):
+            self.latency.record(host, time.monotonic() - started)
+        return resp
+
+    # ---- Sending --------------------------------------------------------------
+
+    def send(
+        self,
+        host: str,
+        send: Callable[[float], Any],
+        timeout: float,
+        may_hedge: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """
+        One attempt: send(timeout) returns a response or None on a connection
+        error. may_hedge() is asked before sending a duplicate; without it
+        the request is never hedged. When the hedge pool has no threads to
+        spare for host, the request is sent unhedged on this thread.
+        """
+        self._count("attempts")
+        after = self.hedge_after(host, timeout) if may_hedge is not None else None
+        if after is None or not self._reserve(host):
+            return self._timed(host, send, timeout)
+
+        first = _HEDGE_POOL.submit(copy_context().run, self._timed, host, send, timeout)
+        done, _ = wait([first], timeout=after)
+        if done or not may_hedge():
+            self._release_after(host, [first])
+            return first.result()
+        self._count("hedged")
+        second = _HEDGE_POOL.submit(
+            copy_context().run, self._timed, host, send, timeout - after
+        )
+        self._release_after(host, [first, second])
+        pending = {first, second}
+        winner = None
+        losers: List[Any] = []
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                resp = future.result()
+                if winner is None and _succeeded(resp):
+                    winner = resp
+                    if future is second:
+                        self._count("hedge_wins")
+                else:
+                    losers.append(resp)
+        if winner is None:
+            # Neither succeeded: answer with the one that finished last
+            winner = losers.pop()
+        # Losing responses give their pooled connections back to the session
+        for resp in losers:
+            _close(resp)
+        for future in pending:
+            # The slower request finishes in the background
+            future.add_done_callback(_close_result)
+        return winner
+
+    async def send_async(
+        self,
+        host: str,
+        send: Callable[[float], Awaitable[Any]],
+        timeout: float,
+        may_hedge: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """asyncio version of send(); the losing request is cancelled."""
+        self._count("attempts")
+
+        async def timed(limit: float) -> Any:
+            started = time.monotonic()
+            resp = await send(limit)
+            if _succeeded(resp):
+                self.latency.record(host, time.monotonic() - started)
+            return resp
+
+        after = self.hedge_after(host, timeout) if may_hedge is not None else None
+        if after is None:
+            return await timed(timeout)
+
+        first = asyncio.ensure_future(timed(timeout))
+        done, _ = await asyncio.wait({first}, timeout=after)
+        if done or not may_hedge():
+            return await first
+        self._count("hedged")
+        second = asyncio.ensure_future(timed(timeout - after))
+        pending = {first, second}
+        resp = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    resp = task.result()
+                    if _succeeded(resp):
+                        if task is second:
+                            self._count("hedge_wins")
+                        return resp
+            return resp
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_attempts": self.max_attempts,
+                "hedging": self.hedging,
+                "hedging_now": sum(self._hedging.values()),
+                **self._stats,
+            }
+
+
+REQUEST_POLICY = RequestPolicy()
@@ -0,0 +1,238 @@
+"""
+Background scheduler
+====================
+One daemon thread running periodic maintenance tasks: the Render
+keep-alive ping, warming the full-feed platforms and refreshing the most
+popular recent searches, so user requests find warm data.
+
+  - each task runs every `interval` seconds, spread by +/- `jitter`
+    (a fraction of the interval) so workers do not fire in lockstep
+  - refresh work draws from a RefreshBudget shared by the tasks, capping
+    how many upstream refreshes happen per budget window
+  - PopularityTracker keeps an exponentially decaying hit count per search
+  - report() lists every task with its last outcome plus recent runs
+"""
+
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+
+class RefreshBudget:
+    """At most `limit` refreshes per `window` seconds."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self._used = 0
+        self._window_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _roll(self) -> None:
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self._window_start = now
+            self._used = 0
+
+    def take(self, n: int = 1) -> bool:
+        with self._lock:
+            self._roll()
+            if self._used + n > self.limit:
+                return False
+            self._used += n
+            return True
+
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll()
+            return self.limit - self._used
+
+
+class PopularityTracker:
+    """Decaying per-key hit counts; a hit loses half its weight every half_life."""
+
+    def __init__(self, half_life: float = 3600.0, max_keys: int = 500) -> None:
+        self.half_life = half_life
+        self.max_keys = max_keys
+        self._scores: Dict[Hashable, Tuple[float, float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _decayed(self, score: float, at: float, now: float) -> float:
+        return score * math.pow(0.5, (now - at) / self.half_life)
+
+    def record(self, key: Hashable, params: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            score, at, _ = self._scores.get(key, (0.0, now, None))
+            self._scores[key] = (self._decayed(score, at, now) + 1.0, now, params)
+            if len(self._scores) > self.max_keys:
+                self._prune(now)
+
+    def top(self, n: int) -> List[Tuple[Hashable, Any, float]]:
+        """The n most popular keys as (key, params, score), best first."""
+        now = time.monotonic()
+        with self._lock:
+            ranked = [
+                (key, params, self._decayed(score, at, now))
+                for key, (score, at, params) in self._scores.items()
+            ]
+        ranked.sort(key=lambda row: row[2], reverse=True)
+        return ranked[:n]
+
+    def _prune(self, now: float) -> None:
+        # Call with the lock held: keep the better-scoring half
+        ranked = sorted(
+            self._scores.items(),
+            key=lambda kv: self._decayed(kv[1][0], kv[1][1], now),
+            reverse=True,
+        )
+        self._scores = dict(ranked[: self.max_keys // 2])
+
+
+class ScheduledTask:
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        interval: float,
+        jitter: float = 0.1,
+        initial_delay: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.jitter = jitter
+        self.next_run = time.monotonic() + (
+            initial_delay if initial_delay is not None else self._spread()
+        )
+        self.runs = 0
+        self.failures = 0
+        self.last_run: Optional[float] = None
+        self.last_duration = 0.0
+        self.last_result: Any = None
+        self.last_error = ""
+
+    def _spread(self) -> float:
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def reschedule(self) -> None:
+        self.next_run = time.monotonic() + self._spread()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "jitter": self.jitter,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_run": self.last_run,
+            "last_duration": round(self.last_duration, 3),
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+            "next_run_in": round(max(0.0, self.next_run - time.monotonic()), 1),
+        }
+
+
+class Scheduler:
+    def __init__(self, history: int = 50) -> None:
+        self._tasks: List[ScheduledTask] = []
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        interval: float,
+        jitter: float = 0.1,
+        initial_delay: Optional[float] = None,
+    ) -> ScheduledTask:
+        task = ScheduledTask(name, fn, interval, jitter, initial_delay)
+        with self._lock:
+            self._tasks.append(task)
+        self._wake.set()
+        return task
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Start the scheduler thread; False if it is already running."""
+        with self._lock:
+            if self.running:
+                return False
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._loop, daemon=True, name="scheduler"
+            )
+            self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._wake.set()
+
+    def run_now(self, name: str) -> None:
+        """Make task name due immediately."""
+        with self._lock:
+            for task in self._tasks:
+                if task.name == name:
+                    task.next_run = time.monotonic()
+        self._wake.set()
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self.running,
+                "tasks": [task.summary() for task in self._tasks],
+                "recent": list(self._history),
+            }
+
+    def _loop(self) -> None:
+        while not self._stopped:
+            with self._lock:
+                due = [t for t in self._tasks if t.next_run <= time.monotonic()]
+                upcoming = min((t.next_run for t in self._tasks), default=None)
+            for task in due:
+                if self._stopped:
+                    return
+                self._run(task)
+            if due:
+                continue
+            timeout = None if upcoming is None else max(0.0, upcoming - time.monotonic())
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def _run(self, task: ScheduledTask) -> None:
+        started = time.time()
+        t0 = time.monotonic()
+        ok = True
+        try:
+            task.last_result = task.fn()
+            task.last_error = ""
+        except Exception as exc:
+            ok = False
+            task.failures += 1
+            task.last_error = str(exc)
+            print(f"  [warn] scheduled task {task.name} failed: {exc}")
+        task.runs += 1
+        task.last_run = started
+        task.last_duration = time.monotonic() - t0
+        task.reschedule()
+        with self._lock:
+            self._history.append(
+                {
+                    "task": task.name,
+                    "started": started,
+                    "duration": round(task.last_duration, 3),
+                    "ok": ok,
+                    "result": task.last_result if ok else task.last_error,
+                }
+            )
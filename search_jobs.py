@@ -0,0 +1,180 @@
+"""
+Background search jobs
+======================
+Runs searches on a bounded worker pool instead of inside the request
+thread. A search is submitted, gets an id back immediately and is polled
+(or waited on) for its status and result.
+
+  - max_workers bounds how many searches scrape at the same time,
+    independently of how many HTTP workers the web server runs
+  - max_pending bounds queued + running searches; beyond it submit()
+    raises QueueFull so the web tier can answer "busy" at once
+  - finished searches are kept for result_ttl seconds, then expire
+  - searches submitted with the same key while one is queued or running
+    attach to that search instead of scraping again
+  - the runner is called as runner(params, report); every report(item)
+    is appended to the search's progress, which watchers read with
+    progress_since() while the search runs (per-platform results, so a
+    streamed page can show each platform as it finishes)
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class QueueFull(Exception):
+    """Raised by SearchQueue.submit when the pending-search limit is reached."""
+
+
+class SearchJob:
+    def __init__(
+        self, params: Dict[str, Any], key: Optional[Hashable] = None
+    ) -> None:
+        self.id = uuid.uuid4().hex
+        self.params = params
+        self.key = key
+        self.status = "queued"
+        self.result: Any = None
+        self.error = ""
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.progress: List[Any] = []
+        self._done = threading.Event()
+        self._changed = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def report(self, item: Any) -> None:
+        with self._changed:
+            self.progress.append(item)
+            self._changed.notify_all()
+
+    def progress_since(self, start: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Progress items from index start on. If there are none yet and the
+        search is still running, wait up to timeout for the next one.
+        """
+        with self._changed:
+            if len(self.progress) <= start and not self.finished:
+                self._changed.wait(timeout)
+            return self.progress[start:]
+
+    def _finish(self) -> None:
+        self._done.set()
+        with self._changed:
+            self._changed.notify_all()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "params": self.params,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class SearchQueue:
+    def __init__(
+        self,
+        runner: Callable[[Dict[str, Any], Callable[[Any], None]], Any],
+        max_workers: int = 2,
+        max_pending: int = 20,
+        result_ttl: float = 600.0,
+    ) -> None:
+        self.runner = runner
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="search-job"
+        )
+        self._jobs: Dict[str, SearchJob] = {}
+        self._in_flight: Dict[Hashable, SearchJob] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0, "coalesced": 0, "rejected": 0, "completed": 0, "failed": 0,
+        }
+
+    def submit(
+        self, params: Dict[str, Any], key: Optional[Hashable] = None
+    ) -> SearchJob:
+        """
+        Queue a search. With a key, an identical search that is already
+        queued or running is returned instead of starting a new one.
+        """
+        with self._lock:
+            self._expire()
+            if key is not None and key in self._in_flight:
+                self._stats["coalesced"] += 1
+                return self._in_flight[key]
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                raise QueueFull(f"{self._pending} searches already pending")
+            job = SearchJob(params, key)
+            self._pending += 1
+            self._jobs[job.id] = job
+            if key is not None:
+                self._in_flight[key] = job
+            self._stats["submitted"] += 1
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[SearchJob]:
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job.status == "running")
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "in_flight_keys": len(self._in_flight),
+                "running": running,
+                "stored": len(self._jobs),
+                **self._stats,
+            }
+
+    def _run(self, job: SearchJob) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            job.result = self.runner(job.params, job.report)
+            job.status = "done"
+        except Exception as exc:
+            print(f"  [error] search {job.id} failed: {exc}")
+            job.error = str(exc)
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._pending -= 1
+                if self._in_flight.get(job.key) is job:
+                    del self._in_flight[job.key]
+                self._stats["completed" if job.status == "done" else "failed"] += 1
+            job._finish()
+
+    def _expire(self) -> None:
+        # Call with the lock held
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
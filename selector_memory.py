@@ -0,0 +1,119 @@
+"""
+Learned selector order
+======================
+The HTML scrapers carry long fallback lists: card, title, company, link ...
+selectors for every markup generation a site has gone through, and several
+URL patterns for Internshala. Only one of each matches the current site,
+and it keeps matching until the site changes again.
+
+SelectorMemory remembers, per (platform, field), the name of the choice that
+last succeeded (a selector's pattern string, or a URL pattern's name), and
+ordered() puts it first. A hit costs one select_one / one request instead of
+walking the list; a miss falls through to the rest of the list in its usual
+order, and whatever matches then is learned instead.
+
+Learned choices are kept as JSON at SELECTOR_MEMORY_PATH
+("selector_memory.json" by default, "off" to keep them in memory only) and
+written only when one changes, so they survive restarts and are shared by
+every worker that starts later.
+"""
+
+import json
+import os
+import threading
+from typing import Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+FieldKey = Tuple[str, str]
+
+
+class SelectorMemory:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._choices: Dict[FieldKey, str] = {}
+        self._orders: Dict[Tuple[FieldKey, Tuple[str, ...]], Tuple[str, Tuple[int, ...]]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "learned": 0}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                saved = json.load(fh)
+        except (OSError, ValueError) as exc:
+            print(f"  [warn] ignoring selector memory {self.path!r}: {exc}")
+            return
+        for platform, fields in saved.items():
+            for field, name in fields.items():
+                self._choices[(platform, field)] = name
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        saved: Dict[str, Dict[str, str]] = {}
+        for (platform, field), name in sorted(self._choices.items()):
+            saved.setdefault(platform, {})[field] = name
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(saved, fh, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            print(f"  [warn] could not save selector memory {self.path!r}: {exc}")
+
+    def ordered(
+        self, key: FieldKey, items: Sequence[T], name_of: Callable[[T], str]
+    ) -> Sequence[T]:
+        """items with the remembered choice for key moved to the front."""
+        name = self._choices.get(key)
+        if name is None:
+            return items
+        # Lists built per call (Internshala's per-query URLs) share names but
+        # not items, so the cached order is positions keyed by the names
+        names = tuple(name_of(item) for item in items)
+        cache_key = (key, names)
+        cached = self._orders.get(cache_key)
+        if cached is None or cached[0] != name:
+            if name not in names:
+                return items
+            i = names.index(name)
+            positions = (i,) + tuple(range(i)) + tuple(range(i + 1, len(names)))
+            cached = self._orders[cache_key] = (name, positions)
+        return tuple(items[i] for i in cached[1])
+
+    def learn(self, key: FieldKey, name: str, position: int) -> None:
+        """Record that the item called name matched, at position in its order."""
+        if position == 0 and self._choices.get(key) == name:
+            self._stats["hits"] += 1
+            return
+        with self._lock:
+            self._stats["misses"] += 1
+            if self._choices.get(key) == name:
+                return
+            self._choices[key] = name
+            self._stats["learned"] += 1
+            self._save()
+
+    def forget(self, platform: Optional[str] = None) -> None:
+        with self._lock:
+            if platform is None:
+                self._choices.clear()
+            else:
+                for key in [k for k in self._choices if k[0] == platform]:
+                    del self._choices[key]
+            self._orders.clear()
+            self._save()
+
+    def stats(self) -> Dict[str, int]:
+        return {"choices": len(self._choices), **self._stats}
+
+
+def _default_path() -> Optional[str]:
+    path = os.environ.get("SELECTOR_MEMORY_PATH", "selector_memory.json").strip()
+    return None if path.lower() in {"", "off", "none"} else path
+
+
+SELECTOR_MEMORY = SelectorMemory(_default_path())
@@ -0,0 +1,67 @@
+"""
+Text normalisation
+==================
+normalize_text() is the fast equivalent of the original BeautifulSoup-based
+cleaner (kept as soup_text() for reference and as the fallback): strip HTML
+tags, unescape entities and collapse whitespace.
+
+Most fields the platforms return are plain strings, which only need their
+whitespace collapsed. Strings with markup are handled with a couple of
+regular expressions when they only contain constructs whose html.parser
+behaviour is trivially reproduced (ordinary tags and comments); anything
+else — a stray "<", raw-text elements such as <script>, entities surviving
+the first unescape — is handed to soup_text() so the output is always
+identical to the original cleaner.
+"""
+
+import re
+from html import unescape
+
+from bs4 import BeautifulSoup
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Comments, end tags and well-formed start tags. Anything looser is left in
+# place, and the leftover "<" sends the string to the parser instead.
+_MARKUP_RE = re.compile(
+    r"<!--.*?-->"
+    r"|</[a-zA-Z][^\s/<>\x00]*\s*>"
+    r"|<[a-zA-Z][^\s/<>\x00]*"
+    r"(?:\s+[^\s/<>=\x00\"']+(?:\s*=\s*(?:\"[^\"<]*\"|'[^'<]*'|[^\s<>\"'=`]+))?)*"
+    r"\s*/?>",
+    re.DOTALL,
+)
+
+# Elements whose content html.parser treats as raw text or that get_text()
+# skips, plus an entity left over after the first unescape
+_NEEDS_PARSER_RE = re.compile(
+    r"<(?:script|style|textarea|title|template|xmp|iframe|noembed|noframes"
+    r"|noscript|plaintext)\b"
+    r"|&[#\w]",
+    re.IGNORECASE,
+)
+
+
+def soup_text(value: str) -> str:
+    """Reference cleaner: parse with BeautifulSoup and collapse whitespace."""
+    text = BeautifulSoup(unescape(value or ""), "html.parser").get_text(
+        " ", strip=True
+    )
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def normalize_text(value: str) -> str:
+    """Strip HTML tags, unescape entities, collapse whitespace."""
+    if not value:
+        return ""
+    if "<" not in value and "&" not in value:
+        return " ".join(value.split())
+
+    text = unescape(value)
+    if _NEEDS_PARSER_RE.search(text):
+        return soup_text(value)
+    if "<" in text:
+        text = _MARKUP_RE.sub(" ", text)
+        if "<" in text:
+            return soup_text(value)
+    return " ".join(text.split())